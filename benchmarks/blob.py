@@ -0,0 +1,85 @@
+"""
+This benchmark compares populating many settings from one JSON blob with a blob minicfg (minicfg_blob),
+which parses the blob once per population (and not at all while it does not change),
+with fields parsing the blob with their own casters.
+
+Run `python benchmarks/blob.py`.
+"""
+
+import json
+import timeit
+
+from minicfg import Field, Minicfg, minicfg_blob, minicfg_name
+from minicfg.caster import AbstractCaster, JSONCaster
+from minicfg.provider import DictProvider
+
+_NUMBER = 200
+_FIELDS = 40
+_BLOB = json.dumps(
+    {
+        "settings": {f"field_{i}": {"value": i, "description": "x" * 200} for i in range(_FIELDS)},
+        "features": [{"name": f"feature-{i}", "enabled": i % 2 == 0} for i in range(200)],
+    }
+)
+
+
+class _PathCaster(AbstractCaster):
+    """
+    Caster parsing the whole blob and extracting one value, as fields without blob minicfgs have to.
+    """
+
+    def __init__(self, path: tuple[str, ...]):
+        self._json = JSONCaster()
+        self._path = path
+
+    @property
+    def typename(self) -> str:
+        return "int"
+
+    def cast(self, value: str) -> int:
+        document = self._json.cast(value)
+        for key in self._path:
+            document = document[key]
+        return int(document)
+
+
+def _build_per_field_class() -> type[Minicfg]:
+    fields = {
+        f"FIELD_{i}": Field(name="CONFIG_JSON", caster=_PathCaster(("settings", f"field_{i}", "value")))
+        for i in range(_FIELDS)
+    }
+    return minicfg_name("SERVICE")(type("Config", (Minicfg,), fields))
+
+
+def _build_blob_class() -> type[Minicfg]:
+    fields = {f"FIELD_{i}": Field() for i in range(_FIELDS)}
+    fields["__annotations__"] = {f"FIELD_{i}": int for i in range(_FIELDS)}
+    pointers = {f"FIELD_{i}": f"/settings/field_{i}/value" for i in range(_FIELDS)}
+    settings = minicfg_name("CONFIG_JSON")(minicfg_blob(pointers=pointers)(type("Settings", (Minicfg,), fields)))
+    return minicfg_name("SERVICE")(type("Config", (Minicfg,), {"Settings": settings}))
+
+
+def main():
+    provider = DictProvider({"SERVICE_CONFIG_JSON": _BLOB})
+    per_field = _build_per_field_class().new_populated(provider)
+    blob = _build_blob_class().new_populated(provider)
+    assert [getattr(per_field, f"FIELD_{i}") for i in range(_FIELDS)] == [
+        getattr(blob.Settings, f"FIELD_{i}") for i in range(_FIELDS)
+    ]
+
+    print(f"{_FIELDS} fields from a {len(_BLOB) // 1024} KiB JSON blob ({_NUMBER} populations):")
+    per_field_time = timeit.timeit(lambda: per_field.populate(provider), number=_NUMBER)
+    print(f"parsed per field:       {per_field_time * 1000:8.2f} ms")
+
+    # a new blob string for every population, so that it is parsed every time:
+    providers = [DictProvider({"SERVICE_CONFIG_JSON": _BLOB + " " * (i % 2)}) for i in range(_NUMBER)]
+    iterator = iter(providers)
+    changed_time = timeit.timeit(lambda: blob.populate(next(iterator)), number=_NUMBER)
+    print(f"blob, changed blob:     {changed_time * 1000:8.2f} ms ({per_field_time / changed_time:.1f}x)")
+
+    unchanged_time = timeit.timeit(lambda: blob.populate(provider), number=_NUMBER)
+    print(f"blob, unchanged blob:   {unchanged_time * 1000:8.2f} ms ({per_field_time / unchanged_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+This benchmark compares populating one Minicfg instance per tenant (Minicfg.populate) with columnar bulk population
+(minicfg.bulk.populate_many) for 100k tenants with 50 fields each.
+Per-instance population is measured on a sample of the tenants and extrapolated.
+
+Run `python benchmarks/bulk.py`.
+"""
+
+import datetime
+import random
+import time
+
+from minicfg import Field, Minicfg
+from minicfg.bulk import populate_many
+from minicfg.provider import DictProvider
+
+_TENANTS = 100_000
+_SAMPLE = 5_000  # tenants populated one by one
+_FIELDS_PER_TYPE = 10
+
+_TYPES = {  # annotation -> function generating a raw value
+    str: lambda rng: f"tenant-{rng.randrange(1000)}",
+    int: lambda rng: str(rng.randrange(100_000)),
+    float: lambda rng: f"{rng.random():.3f}",
+    bool: lambda rng: rng.choice(["true", "false", "on", "off"]),
+    datetime.timedelta: lambda rng: rng.choice(["100ms", "1s", "30s", "1m", "1h"]),
+}
+
+
+def _build_config_class() -> type[Minicfg]:
+    namespace = {"__annotations__": {}}
+    for annotation in _TYPES:
+        for i in range(_FIELDS_PER_TYPE):
+            attr_name = f"{annotation.__name__.upper()}_{i}"
+            namespace["__annotations__"][attr_name] = annotation
+            namespace[attr_name] = Field()
+    return type("TenantConfig", (Minicfg,), namespace)
+
+
+def _build_columns(config_class: type[Minicfg]) -> dict[str, list[str]]:
+    rng = random.Random(0)
+    annotations = config_class.__annotations__
+    return {
+        attr_name: [_TYPES[annotation](rng) for _ in range(_TENANTS)] for attr_name, annotation in annotations.items()
+    }
+
+
+def main():
+    config_class = _build_config_class()
+    columns = _build_columns(config_class)
+    print(f"{_TENANTS} tenants x {len(columns)} fields:")
+
+    start = time.perf_counter()
+    for index in range(_SAMPLE):
+        config_class.new_populated(DictProvider({name: column[index] for name, column in columns.items()}))
+    per_instance = (time.perf_counter() - start) * _TENANTS / _SAMPLE
+    print(f"populate per instance:  {per_instance * 1000:8.0f} ms (extrapolated from {_SAMPLE} tenants)")
+
+    start = time.perf_counter()
+    configs = populate_many(config_class, columns)
+    columnar = time.perf_counter() - start
+    print(f"populate_many columns:  {columnar * 1000:8.0f} ms ({per_instance / columnar:.1f}x)")
+
+    start = time.perf_counter()
+    configs.instances()
+    instances = time.perf_counter() - start + columnar
+    print(f"populate_many instances:{instances * 1000:8.0f} ms ({per_instance / instances:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
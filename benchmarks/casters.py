@@ -0,0 +1,75 @@
+"""
+This micro-benchmark compares the built-in casters with naive ad-hoc implementations
+(regular expressions compiled on every call, lowercase copies, etc.).
+
+Run `python benchmarks/casters.py`.
+"""
+
+import datetime
+import ipaddress
+import re
+import timeit
+import urllib.parse
+
+from minicfg.caster import BoolCaster, ByteSizeCaster, DurationCaster, IPNetworkCaster, URLCaster
+
+_NUMBER = 100_000
+
+
+def naive_bool(value: str) -> bool:
+    value = value.lower()
+    if value in ("true", "yes", "on", "enable", "enabled", "1"):
+        return True
+    if value in ("false", "no", "off", "disable", "disabled", "0"):
+        return False
+    raise ValueError(value)
+
+
+def naive_duration(value: str) -> datetime.timedelta:
+    units = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400}
+    seconds = 0.0
+    for number, unit in re.findall(r"(\d+(?:\.\d+)?)(ms|s|m|h|d)", value):
+        seconds += float(number) * units[unit]
+    return datetime.timedelta(seconds=seconds)
+
+
+def naive_byte_size(value: str) -> int:
+    match = re.match(r"^(\d+(?:\.\d+)?)\s*([A-Za-z]*)$", value.strip())
+    units = {"": 1, "b": 1, "kb": 1000, "mb": 1000**2, "gb": 1000**3, "kib": 1024, "mib": 1024**2, "gib": 1024**3}
+    return int(float(match.group(1)) * units[match.group(2).lower()])
+
+
+def naive_url(value: str) -> urllib.parse.ParseResult:
+    if not re.match(r"^[a-z][a-z0-9+.-]*://[^/]+", value):
+        raise ValueError(value)
+    return urllib.parse.urlparse(value)
+
+
+def naive_network(value: str) -> ipaddress.IPv4Network:
+    if not re.match(r"^\d{1,3}(\.\d{1,3}){3}/\d{1,2}$", value):
+        raise ValueError(value)
+    return ipaddress.ip_network(value)
+
+
+_CASES = [
+    ("bool", naive_bool, BoolCaster().cast, "Enabled"),
+    ("duration", naive_duration, DurationCaster().cast, "1h30m15s"),
+    ("byte size", naive_byte_size, ByteSizeCaster().cast, "512MiB"),
+    ("url", naive_url, URLCaster(schemes=["postgres"]).cast, "postgres://user:password@db:5432/name"),
+    ("ip network", naive_network, IPNetworkCaster().cast, "10.0.0.0/8"),
+]
+
+
+def main():
+    re.purge()
+    for name, naive, builtin, value in _CASES:
+        naive_time = timeit.timeit(lambda: naive(value), number=_NUMBER) / _NUMBER
+        builtin_time = timeit.timeit(lambda: builtin(value), number=_NUMBER) / _NUMBER
+        print(
+            f"{name:<10}: naive {naive_time * 1e9:8.0f} ns, built-in {builtin_time * 1e9:8.0f} ns "
+            f"({naive_time / builtin_time:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+This benchmark populates many config instances concurrently (e.g. per-tenant configs created by a burst of requests)
+through a slow stand-in provider, with and without CoalescingProvider.
+
+Run `python benchmarks/coalescing.py`.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from minicfg import Field, Minicfg, minicfg_name
+from minicfg.provider import AbstractProvider, CoalescingProvider
+
+_FIELDS = 20
+_CONCURRENCY = 64
+_LATENCY = 0.005  # latency of a single backend lookup, in seconds
+
+
+class SlowProvider(AbstractProvider):
+    """
+    A stand-in for a remote backend: every lookup takes _LATENCY seconds.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            self.calls += 1
+        time.sleep(_LATENCY)
+        return "value"
+
+
+@minicfg_name("TENANT")
+class TenantConfig(Minicfg):
+    pass
+
+
+for _i in range(_FIELDS):
+    setattr(TenantConfig, f"FIELD_{_i}", Field())
+
+
+def _run_threads(provider: AbstractProvider) -> float:
+    configs = [TenantConfig() for _ in range(_CONCURRENCY)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=_CONCURRENCY) as executor:
+        list(executor.map(lambda config: config.populate(provider), configs))
+    return time.perf_counter() - start
+
+
+async def _run_asyncio(provider: CoalescingProvider) -> float:
+    keys = [f"TENANT_FIELD_{i}" for i in range(_FIELDS)]
+    start = time.perf_counter()
+    await asyncio.gather(*(provider.get_async(key) for _ in range(_CONCURRENCY) for key in keys))
+    return time.perf_counter() - start
+
+
+def main():
+    direct = SlowProvider()
+    direct_time = _run_threads(direct)
+    print(f"threads, direct:     {direct_time * 1000:8.1f} ms, {direct.calls:5} backend calls")
+
+    backend = SlowProvider()
+    coalesced_time = _run_threads(CoalescingProvider(backend))
+    print(f"threads, coalesced:  {coalesced_time * 1000:8.1f} ms, {backend.calls:5} backend calls")
+
+    backend = SlowProvider()
+    async_time = asyncio.run(_run_asyncio(CoalescingProvider(backend)))
+    print(f"asyncio, coalesced:  {async_time * 1000:8.1f} ms, {backend.calls:5} backend calls")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+This benchmark compares the startup cost of loading a config through a loader generated by `minicfg codegen`
+with reflective loading (Minicfg.new_populated). Each variant runs in a fresh interpreter.
+Both modules are byte-compiled beforehand, as they would be in a deployed service.
+
+Run `python benchmarks/codegen.py`.
+"""
+
+import os
+import py_compile
+import subprocess
+import sys
+import tempfile
+
+_SECTIONS = 20
+_FIELDS_PER_SECTION = 10
+_RUNS = 10
+
+_CONFIG_MODULE = """
+from minicfg import Field, Minicfg, minicfg_name
+
+@minicfg_name("SERVICE")
+class Config(Minicfg):
+{sections}
+"""
+
+_SECTION = """
+    @minicfg_name("SECTION_{index}")
+    class Section{index}(Minicfg):
+{fields}
+"""
+
+_RUNNER = """
+import os
+import time
+
+start = time.perf_counter()
+{import_}
+imported = time.perf_counter()
+{load}
+print(imported - start, time.perf_counter() - imported)
+"""
+
+_REFLECTIVE = ("from config import Config", "Config.new_populated()")
+_GENERATED = ("from config_loader import load", "load()")
+
+
+def _write_config_module(directory: str) -> dict[str, str]:
+    sections = []
+    env: dict[str, str] = {}
+    for section in range(_SECTIONS):
+        fields = []
+        for field in range(_FIELDS_PER_SECTION):
+            if field % 2:
+                fields.append(f"        FIELD_{field}: int = Field()")
+                env[f"SERVICE_SECTION_{section}_FIELD_{field}"] = str(field)
+            else:
+                fields.append(f'        FIELD_{field}: str = Field(default="default")')
+        sections.append(_SECTION.format(index=section, fields="\n".join(fields)))
+
+    with open(os.path.join(directory, "config.py"), "w") as file:
+        file.write(_CONFIG_MODULE.format(sections="".join(sections)))
+    return env
+
+
+def _measure(directory: str, variant: tuple[str, str], env: dict[str, str]) -> tuple[float, float]:
+    """
+    Return the best import and load times of the variant.
+    """
+
+    import_, load = variant
+    import_times = []
+    load_times = []
+    for _ in range(_RUNS):
+        output = subprocess.check_output(
+            [sys.executable, "-c", _RUNNER.format(import_=import_, load=load)],
+            cwd=directory,
+            env={**os.environ, **env, "PYTHONPATH": os.pathsep.join([directory, os.getcwd()])},
+        )
+        import_time, load_time = map(float, output.split())
+        import_times.append(import_time)
+        load_times.append(load_time)
+    return min(import_times), min(load_times)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        env = _write_config_module(directory)
+        subprocess.check_call(
+            [sys.executable, "-m", "minicfg", "codegen", "--output", "config_loader.py", "config.Config"],
+            cwd=directory,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join([directory, os.getcwd()])},
+        )
+        for module in ("config.py", "config_loader.py"):
+            py_compile.compile(os.path.join(directory, module), doraise=True)
+
+        reflective_import, reflective_load = _measure(directory, _REFLECTIVE, env)
+        generated_import, generated_load = _measure(directory, _GENERATED, env)
+
+    fields = _SECTIONS * _FIELDS_PER_SECTION
+    print(f"{fields} fields, best of {_RUNS} fresh interpreters:")
+    print(f"reflective: import {reflective_import * 1000:6.2f} ms, load {reflective_load * 1000:6.2f} ms")
+    print(
+        f"generated:  import {generated_import * 1000:6.2f} ms, load {generated_load * 1000:6.2f} ms "
+        f"({reflective_load / generated_load:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+This benchmark compares the peak memory used to populate a field from a large base64-encoded gzip file
+with the streaming decoders of the field (Field decoders) and with decoding the whole file at once.
+
+Run `python benchmarks/decoding.py`.
+"""
+
+import base64
+import gzip
+import os
+import tempfile
+import time
+import tracemalloc
+
+from minicfg import Field, Minicfg, minicfg_name
+from minicfg.decoding import AutoDecompressDecoder, Base64Decoder
+from minicfg.provider import DictProvider
+
+_SIZE = 50 * 1024 * 1024  # size of the decoded value
+
+
+class _BytesCaster:
+    accepts_bytes = True
+
+    @staticmethod
+    def cast(value: bytes) -> int:
+        return len(value)
+
+
+@minicfg_name("APP")
+class _Config(Minicfg):
+    BLOB = Field(caster=_BytesCaster(), decoders=[Base64Decoder(), AutoDecompressDecoder()], attach_file_field=True)
+
+
+def _decode_whole_file(path: str) -> int:
+    with open(path, "rb") as file:
+        return len(gzip.decompress(base64.b64decode(file.read())))
+
+
+def _populate(path: str) -> int:
+    return _Config.new_populated(DictProvider({"APP_BLOB_FILE": path})).BLOB
+
+
+def _measure(load, path: str) -> tuple[float, float]:
+    """
+    Return the peak memory used in bytes and the time taken in seconds.
+    """
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = load(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert size == _SIZE
+    return peak, elapsed
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "blob.b64")
+        with open(path, "wb") as file:
+            file.write(base64.encodebytes(gzip.compress(os.urandom(_SIZE // 2) * 2, compresslevel=1)))
+
+        print(f"{_SIZE // 1024 // 1024} MiB value, {os.path.getsize(path) // 1024 // 1024} MiB base64 gzip file:")
+        whole_peak, whole_time = _measure(_decode_whole_file, path)
+        streamed_peak, streamed_time = _measure(_populate, path)
+
+    print(f"whole file: peak {whole_peak / 1024 / 1024:7.1f} MiB, {whole_time * 1000:7.2f} ms")
+    print(
+        f"streamed:   peak {streamed_peak / 1024 / 1024:7.1f} MiB, {streamed_time * 1000:7.2f} ms "
+        f"({whole_peak / streamed_peak:.1f}x less memory)"
+    )
+
+
+if __name__ == "__main__":
+    main()
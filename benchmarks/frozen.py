@@ -0,0 +1,68 @@
+"""
+This benchmark compares attribute reads and memory per instance of populated Minicfg instances
+and their frozen copies (Minicfg.freeze).
+
+Run `python benchmarks/frozen.py`.
+"""
+
+import timeit
+import tracemalloc
+
+from minicfg import Field, Minicfg, minicfg_name
+from minicfg.provider import DictProvider
+
+_READS = 1_000_000
+_INSTANCES = 10_000
+
+
+@minicfg_name("SERVICE")
+class Config(Minicfg):
+    DEBUG: bool = Field(default=False)
+    WORKERS: int = Field(default=4)
+
+    @minicfg_name("DATABASE")
+    class Database(Minicfg):
+        HOST = Field(default="localhost")
+        PORT: int = Field(default=5432)
+        USER = Field(default="service")
+        TIMEOUT: float = Field(default=1.5)
+
+
+def _measure_reads(config) -> float:
+    return timeit.timeit("config.Database.HOST; config.WORKERS", globals={"config": config}, number=_READS)
+
+
+def _measure_memory(create) -> float:
+    """
+    Return the memory allocated per instance created by the function, in bytes.
+    """
+
+    tracemalloc.start()
+    instances = [create() for _ in range(_INSTANCES)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return size / _INSTANCES
+
+
+def main():
+    provider = DictProvider({})
+    config = Config.new_populated(provider)
+    frozen = config.freeze()
+
+    populated_reads = _measure_reads(config)
+    frozen_reads = _measure_reads(frozen)
+    print(f"attribute reads ({_READS} x 2 reads):")
+    print(f"populated: {populated_reads * 1000:7.2f} ms")
+    print(f"frozen:    {frozen_reads * 1000:7.2f} ms ({populated_reads / frozen_reads:.2f}x)")
+
+    # default values are shared by all instances, so only the instances and their bookkeeping are measured:
+    populated_memory = _measure_memory(lambda: Config.new_populated(provider))
+    frozen_memory = _measure_memory(config.freeze)
+    print(f"memory per instance (including the child minicfg, {_INSTANCES} instances):")
+    print(f"populated: {populated_memory:7.0f} B")
+    print(f"frozen:    {frozen_memory:7.0f} B ({populated_memory / frozen_memory:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+This benchmark compares the memory used by a history of versions of a configuration with many sections
+(Minicfg.enable_history, sharing unchanged sections) with keeping a full frozen copy of every version,
+when every refresh changes one field.
+
+Run `python benchmarks/history.py`.
+"""
+
+import time
+import tracemalloc
+
+from minicfg import Field, Minicfg, minicfg_name
+from minicfg.provider import DictProvider
+
+_VERSIONS = 100
+_SECTIONS = 30
+_FIELDS_PER_SECTION = 10
+
+
+def _build_config_class() -> type[Minicfg]:
+    namespace = {}
+    for i in range(_SECTIONS):
+        fields = {f"FIELD_{j}": Field(default=f"default-{j}") for j in range(_FIELDS_PER_SECTION)}
+        namespace[f"Section{i}"] = minicfg_name(f"SECTION_{i}")(type(f"Section{i}", (Minicfg,), fields))
+    return minicfg_name("SERVICE")(type("Config", (Minicfg,), namespace))
+
+
+def _refresh(config: Minicfg, version: int) -> None:
+    config.populate(DictProvider({f"SERVICE_SECTION_{version % _SECTIONS}_FIELD_0": f"value-{version}"}))
+
+
+def _measure(keep_versions) -> tuple[float, float]:
+    """
+    Return the memory used by the kept versions in bytes and the time taken by the refreshes in seconds.
+    """
+
+    config = _build_config_class().new_populated(DictProvider({}))
+    tracemalloc.start()
+    start = time.perf_counter()
+    versions = keep_versions(config)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del versions
+    return size, elapsed
+
+
+def _keep_history(config: Minicfg):
+    history = config.enable_history(max_versions=_VERSIONS)
+    for version in range(_VERSIONS):
+        _refresh(config, version)
+    return history
+
+
+def _keep_frozen_copies(config: Minicfg):
+    copies = []
+    for version in range(_VERSIONS):
+        _refresh(config, version)
+        copies.append(config.freeze())
+    return copies
+
+
+def main():
+    print(
+        f"{_VERSIONS} versions of {_SECTIONS} sections x {_FIELDS_PER_SECTION} fields, one field changed per version:"
+    )
+    copies_size, copies_time = _measure(_keep_frozen_copies)
+    history_size, history_time = _measure(_keep_history)
+    print(f"frozen copies: {copies_size / 1024:8.1f} KiB, {copies_time * 1000:7.2f} ms")
+    print(
+        f"history:       {history_size / 1024:8.1f} KiB, {history_time * 1000:7.2f} ms "
+        f"({copies_size / history_size:.1f}x less memory)"
+    )
+
+
+if __name__ == "__main__":
+    main()
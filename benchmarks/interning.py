@@ -0,0 +1,86 @@
+"""
+This benchmark compares the memory used by many instances of a tenant configuration populated with mostly
+identical values (Minicfg.populate) with and without an Interner deduplicating the values across instances.
+
+Run `python benchmarks/interning.py`.
+"""
+
+import time
+import tracemalloc
+
+from minicfg import Field, Minicfg, minicfg_name
+from minicfg.caster import JSONCaster, ListCaster
+from minicfg.interning import Interner
+from minicfg.provider import DictProvider
+
+_TENANTS = 2000
+_OPTIONS = {f"option_{i}": {"enabled": True, "limit": i, "tags": ["a", "b", "c"]} for i in range(20)}
+
+
+@minicfg_name("TENANT")
+class _TenantConfig(Minicfg):
+    NAME = Field()
+    REGION = Field()
+    HOSTS = Field(caster=ListCaster())
+    OPTIONS = Field(caster=JSONCaster())
+    TIMEOUT: float = Field()
+
+
+def _providers() -> list[DictProvider]:
+    import json
+
+    options = json.dumps(_OPTIONS)
+    return [
+        DictProvider(
+            {
+                "TENANT_NAME": f"tenant-{i}",
+                "TENANT_REGION": f"region-{i % 4}",
+                "TENANT_HOSTS": ",".join(f"host-{j}.example.com" for j in range(8)),
+                # built for every tenant, as values read from per-tenant sources are:
+                "TENANT_OPTIONS": "".join(options),
+                "TENANT_TIMEOUT": "2.5",
+            }
+        )
+        for i in range(_TENANTS)
+    ]
+
+
+def _populate(providers: list[DictProvider], interner: Interner | None) -> list[_TenantConfig]:
+    configs = []
+    for provider in providers:
+        config = _TenantConfig()
+        config.populate(provider, interner=interner)
+        configs.append(config)
+    return configs
+
+
+def _measure(new_interner) -> tuple[float, float]:
+    """
+    Return the memory used by the populated instances (and the interner) in bytes and the time taken in seconds
+    (measured separately, as tracing memory allocations slows them down).
+    """
+
+    providers = _providers()
+    start = time.perf_counter()
+    _populate(providers, new_interner())
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    configs = _populate(providers, new_interner())
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del configs
+    return size, elapsed
+
+
+def main():
+    print(f"{_TENANTS} tenant configurations:")
+    plain_size, plain_time = _measure(lambda: None)
+    print(f"not interned:     {plain_size / 1024:9.1f} KiB, {plain_time * 1000:7.2f} ms")
+    for label, freeze in (("interned:        ", False), ("interned, frozen:", True)):
+        size, elapsed = _measure(lambda: Interner(freeze=freeze))
+        print(f"{label} {size / 1024:9.1f} KiB, {elapsed * 1000:7.2f} ms ({plain_size / size:.1f}x less memory)")
+
+
+if __name__ == "__main__":
+    main()
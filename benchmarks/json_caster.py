@@ -0,0 +1,58 @@
+"""
+This benchmark compares reading multi-megabyte JSON file fields as text (decode, strip and parse)
+with passing raw bytes straight to JSONCaster.
+
+Run `python benchmarks/json_caster.py`.
+"""
+
+import json
+import os
+import tempfile
+import timeit
+
+from minicfg import Field
+from minicfg.caster import JSONCaster
+from minicfg.field import _read_raw_value_from_file
+from minicfg.provider import DictProvider
+
+_SIZES_MB = (1, 8, 32)
+_NUMBER = 5
+
+
+def _generate_payload(size_mb: int) -> bytes:
+    """
+    Generate a JSON payload of approximately the given size.
+    """
+
+    item = {"id": 123456, "name": "service-name", "tags": ["a", "b", "c"], "enabled": True, "ratio": 0.25}
+    item_size = len(json.dumps(item)) + 2
+    return json.dumps([item] * (size_mb * 1024 * 1024 // item_size)).encode()
+
+
+def _text_path(path: str) -> None:
+    json.loads(_read_raw_value_from_file(path))
+
+
+def main():
+    caster = JSONCaster()
+    print(f"JSONCaster backend: {caster._load.__module__}.{caster._load.__name__}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "payload.json")
+        provider = DictProvider({"PAYLOAD_FILE": path})
+        field = Field(name="PAYLOAD", caster=caster, attach_file_field=True)
+
+        for size_mb in _SIZES_MB:
+            with open(path, "wb") as file:
+                file.write(_generate_payload(size_mb))
+
+            text_time = timeit.timeit(lambda: _text_path(path), number=_NUMBER) / _NUMBER
+            bytes_time = timeit.timeit(lambda: field.populate(provider), number=_NUMBER) / _NUMBER
+            print(
+                f"{size_mb:>3} MB: text path {text_time * 1000:8.2f} ms, "
+                f"bytes path {bytes_time * 1000:8.2f} ms ({text_time / bytes_time:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
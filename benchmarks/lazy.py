@@ -0,0 +1,63 @@
+"""
+This benchmark compares the startup cost (initialization and population) of a configuration with many sections
+when the sections are eager and when they are lazy (minicfg_lazy), for a process using only a few of them.
+The first startup includes the work done once per class (names of the whole tree are always generated at once).
+
+Run `python benchmarks/lazy.py`.
+"""
+
+import time
+import timeit
+
+from minicfg import Field, Minicfg, minicfg_lazy, minicfg_name
+from minicfg.provider import DictProvider
+
+_NUMBER = 1000
+_SECTIONS = 30
+_FIELDS_PER_SECTION = 10
+_USED_SECTIONS = 2
+
+
+def _build_config_class(lazy: bool) -> type[Minicfg]:
+    namespace = {}
+    for i in range(_SECTIONS):
+        section = type(
+            f"Section{i}",
+            (Minicfg,),
+            {"__annotations__": {f"FIELD_{j}": int for j in range(_FIELDS_PER_SECTION)}}
+            | {f"FIELD_{j}": Field() for j in range(_FIELDS_PER_SECTION)},
+        )
+        section = minicfg_name(f"SECTION_{i}")(section)
+        namespace[f"Section{i}"] = minicfg_lazy(section) if lazy else section
+    return minicfg_name("SERVICE")(type("Config", (Minicfg,), namespace))
+
+
+def _startup(config_class: type[Minicfg], provider: DictProvider) -> None:
+    config = config_class.new_populated(provider)
+    for i in range(_USED_SECTIONS):
+        getattr(config, f"Section{i}").FIELD_0
+
+
+def main():
+    provider = DictProvider(
+        {f"SERVICE_SECTION_{i}_FIELD_{j}": str(j) for i in range(_SECTIONS) for j in range(_FIELDS_PER_SECTION)}
+    )
+    print(f"{_SECTIONS} sections x {_FIELDS_PER_SECTION} fields, {_USED_SECTIONS} sections used:")
+    results = {}
+    for lazy in (False, True):
+        config_class = _build_config_class(lazy)
+        start = time.perf_counter()
+        _startup(config_class, provider)
+        first = time.perf_counter() - start
+        results[lazy] = (first, timeit.timeit(lambda: _startup(config_class, provider), number=_NUMBER) / _NUMBER)
+
+    for lazy, label in ((False, "eager"), (True, "lazy ")):
+        first, startup = results[lazy]
+        print(
+            f"{label}: first startup {first * 1000:6.2f} ms ({results[False][0] / first:.2f}x), "
+            f"next startups {startup * 1000:6.3f} ms ({results[False][1] / startup:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+This benchmark compares populating a whole configuration with many sections again with populating only
+the field or the section which has changed (Minicfg.populate with `only`), as done on change notifications.
+
+Run `python benchmarks/populate_only.py`.
+"""
+
+import timeit
+
+from minicfg import Field, Minicfg, minicfg_name
+from minicfg.provider import DictProvider
+
+_NUMBER = 1000
+_SECTIONS = 30
+_FIELDS_PER_SECTION = 10
+
+
+def _build_config_class() -> type[Minicfg]:
+    namespace = {}
+    for i in range(_SECTIONS):
+        fields = {f"FIELD_{j}": Field() for j in range(_FIELDS_PER_SECTION)}
+        fields["__annotations__"] = {f"FIELD_{j}": int for j in range(_FIELDS_PER_SECTION)}
+        namespace[f"Section{i}"] = minicfg_name(f"SECTION_{i}")(type(f"Section{i}", (Minicfg,), fields))
+    return minicfg_name("SERVICE")(type("Config", (Minicfg,), namespace))
+
+
+def main():
+    provider = DictProvider(
+        {f"SERVICE_SECTION_{i}_FIELD_{j}": str(j) for i in range(_SECTIONS) for j in range(_FIELDS_PER_SECTION)}
+    )
+    config = _build_config_class().new_populated(provider)
+
+    print(f"{_SECTIONS} sections x {_FIELDS_PER_SECTION} fields ({_NUMBER} populations):")
+    whole = timeit.timeit(lambda: config.populate(provider), number=_NUMBER)
+    print(f"whole tree:  {whole * 1000:8.2f} ms")
+    for only in (["Section7"], ["Section7.FIELD_3"]):
+        elapsed = timeit.timeit(lambda: config.populate(provider, only=only), number=_NUMBER)
+        print(f"{only[0]:<17} {elapsed * 1000:8.2f} ms ({whole / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+This benchmark measures the cost of field reads with telemetry disabled (the default) and enabled.
+
+Run `python benchmarks/telemetry.py`.
+"""
+
+import timeit
+
+from minicfg import Field, Minicfg, minicfg_name, telemetry
+from minicfg.provider import DictProvider
+
+_READS = 1_000_000
+
+
+@minicfg_name("SERVICE")
+class Config(Minicfg):
+    WORKERS: int = Field(default=4)
+
+    @minicfg_name("DATABASE")
+    class Database(Minicfg):
+        HOST = Field(default="localhost")
+
+
+def _measure_reads(config: Config) -> float:
+    return timeit.timeit("config.Database.HOST; config.WORKERS", globals={"config": config}, number=_READS)
+
+
+def main():
+    config = Config.new_populated(DictProvider({}))
+    untouched_config = Config.new_populated(DictProvider({}))
+
+    disabled_time = _measure_reads(config)
+    recorder = telemetry.enable(config)
+    enabled_time = _measure_reads(config)
+    recorder.disable()
+    disabled_again_time = _measure_reads(config)
+    untouched_time = _measure_reads(untouched_config)
+
+    print(f"{_READS} x 2 reads:")
+    print(f"never enabled:  {untouched_time * 1000:7.2f} ms")
+    print(f"disabled:       {disabled_time * 1000:7.2f} ms")
+    print(f"enabled:        {enabled_time * 1000:7.2f} ms ({enabled_time / disabled_time:.2f}x)")
+    print(f"disabled again: {disabled_again_time * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+This example demonstrates how casters are inferred from field annotations.
+"""
+
+import enum
+from typing import Optional
+
+from minicfg import Field, Minicfg
+from minicfg.caster import ListCaster
+from minicfg.provider import AbstractProvider
+
+
+class MockProvider(AbstractProvider):
+    """
+    A custom mock provider.
+    Used to simulate the environment variables.
+    """
+
+    data = {"PORT": "8080", "DEBUG": "yes", "ORIGINS": "a.com,b.com", "WEIGHTS": "1;2;3", "LOG_LEVEL": "info"}
+
+    def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+
+class LogLevel(enum.Enum):
+    DEBUG = "debug"
+    INFO = "info"
+
+
+class MyConfig(Minicfg):
+    PORT: int = Field()  # IntCaster is inferred
+    DEBUG: bool = Field()  # BoolCaster is inferred
+    ORIGINS: list[str] = Field()  # ListCaster is inferred
+    WEIGHTS: list[int] = Field(caster=ListCaster(sep=";"))  # explicitly set casters take precedence
+    LOG_LEVEL: LogLevel = Field()  # EnumCaster is inferred
+    TIMEOUT: Optional[float] = Field(default=None)  # FloatCaster is inferred
+
+
+"""
+Try running `python annotations.py` and you should see the following output:
+>>> config.PORT=8080
+>>> config.DEBUG=True
+>>> config.ORIGINS=['a.com', 'b.com']
+>>> config.WEIGHTS=['1', '2', '3']
+>>> config.LOG_LEVEL=<LogLevel.INFO: 'info'>
+>>> config.TIMEOUT=None
+"""
+if __name__ == "__main__":
+    config = MyConfig.new_populated(MockProvider())
+
+    print(f"{config.PORT=}")
+    print(f"{config.DEBUG=}")
+    print(f"{config.ORIGINS=}")
+    print(f"{config.WEIGHTS=}")
+    print(f"{config.LOG_LEVEL=}")
+    print(f"{config.TIMEOUT=}")
@@ -1,2 +1,2 @@
 from .field import Field
-from .minicfg import Minicfg, minicfg_name
+from .minicfg import Minicfg, minicfg_blob, minicfg_lazy, minicfg_name
@@ -1,18 +1,35 @@
 """
-This simple tool will help you generating documentation for your minicfg classes.
+This simple tool will help you generating documentation for your minicfg classes
+and checking environments against them.
 
 Usage: minicfg [--format <format>] <path>
+       minicfg check [--env-file <file>]... [--format <format>] <path>...
+       minicfg codegen [--output <file>] <path>
+       minicfg telemetry [--unused] [--format <format>] <dump>...
 Example: minicfg --format plaintext my_package.my_module.MyConfig
+         minicfg check --env-file .env.staging my_package.my_module.MyConfig
+         minicfg codegen --output my_package/config_loader.py my_package.my_module.MyConfig
+         minicfg telemetry --unused /var/run/service/telemetry-*.json
 """
 
 import sys
 import os
 import argparse
+import dataclasses
+import datetime
 import importlib
+import json
 from enum import Enum
 
+from minicfg import telemetry
+from minicfg.checker import Checker, CheckReport, load_env_file
+from minicfg.codegen import generate
 from minicfg.docs_generator import DocsGenerator
 
+_CHECK_COMMAND = "check"
+_CODEGEN_COMMAND = "codegen"
+_TELEMETRY_COMMAND = "telemetry"
+
 
 class _Format(Enum):
     """
@@ -23,7 +40,16 @@ class _Format(Enum):
     MARKDOWN = "markdown"
 
 
-def _parse_args() -> argparse.Namespace:
+class _CheckFormat(Enum):
+    """
+    Check report output format enum.
+    """
+
+    TEXT = "text"
+    JSON = "json"
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         "minicfg", description="This simple tool will help you generating documentation for your minicfg classes."
     )
@@ -37,23 +63,196 @@ def _parse_args() -> argparse.Namespace:
         help="Output format (plaintext or markdown)",
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main():
-    args = _parse_args()
+def _parse_check_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        f"minicfg {_CHECK_COMMAND}",
+        description="Check environments against minicfg classes without booting the service.",
+    )
+    parser.add_argument(
+        "paths", type=str, nargs="+", help="Paths to the minicfg classes (e.g. my_package.my_module.MyConfig)"
+    )
+    parser.add_argument(
+        "--env-file",
+        "-e",
+        type=str,
+        action="append",
+        dest="env_files",
+        default=[],
+        help="Dotenv or JSON file to check (can be repeated). The current environment is checked if not set",
+    )
+    parser.add_argument(
+        "--format",
+        "-f",
+        type=str,
+        choices=[f.value for f in _CheckFormat],
+        default=_CheckFormat.TEXT.value,
+        help="Output format (text or json)",
+    )
+
+    return parser.parse_args(argv)
+
+
+def _parse_codegen_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        f"minicfg {_CODEGEN_COMMAND}", description="Generate a specialized loader module for a minicfg class."
+    )
+    parser.add_argument("path", type=str, help="Path to the minicfg class (e.g. my_package.my_module.MyConfig)")
+    parser.add_argument(
+        "--output", "-o", type=str, default=None, help="Path to the output file. Printed to stdout if not set"
+    )
+
+    return parser.parse_args(argv)
+
+
+def _parse_telemetry_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        f"minicfg {_TELEMETRY_COMMAND}",
+        description="Merge field read telemetry dumped by many processes and report hot and unused fields.",
+    )
+    parser.add_argument("dumps", type=str, nargs="+", help="Telemetry dumps (see minicfg.telemetry)")
+    parser.add_argument("--unused", action="store_true", help="Report only fields which have never been read")
+    parser.add_argument(
+        "--format",
+        "-f",
+        type=str,
+        choices=[f.value for f in _CheckFormat],
+        default=_CheckFormat.TEXT.value,
+        help="Output format (text or json)",
+    )
+
+    return parser.parse_args(argv)
+
 
-    module_path_tokens = args.path.rsplit(".")
+def _import_minicfg_class(path: str) -> type:
+    """
+    Import the minicfg class by its path.
+    :param path: path to the minicfg class (e.g. my_package.my_module.MyConfig).
+    """
+
+    module_path_tokens = path.rsplit(".")
     if len(module_path_tokens) < 2:
         raise ValueError("invalid path")
 
     module_name = ".".join(module_path_tokens[:-1])
     class_name = module_path_tokens[-1]
 
-    sys.path.insert(0, os.getcwd())  # add current directory to the path
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())  # add current directory to the path
     module = importlib.import_module(module_name)
 
-    minicfg_class = getattr(module, class_name)
+    return getattr(module, class_name)
+
+
+def _format_check_report_text(report: CheckReport) -> str:
+    if report.ok:
+        return f"{report.config_name} ({report.source}): OK"
+
+    result = f"{report.config_name} ({report.source}): {len(report.errors) + len(report.unknown)} problem(s)"
+    for error in report.errors:
+        result += f"\n - {error}"
+    for key in report.unknown:
+        result += f"\n - unknown variable {key}"
+    return result
+
+
+def _check(args: argparse.Namespace) -> int:
+    """
+    Run the check command.
+    :return: exit code (0 if no problems were found, 1 otherwise).
+    """
+
+    sources: list[tuple[str, dict[str, str]]]
+    if args.env_files:
+        sources = [(path, load_env_file(path)) for path in args.env_files]
+    else:
+        sources = [("environment", dict(os.environ))]
+
+    reports: list[CheckReport] = []
+    for path in args.paths:
+        checker = Checker(_import_minicfg_class(path)())
+        for source, data in sources:
+            reports.append(checker.check(data, source=source))
+
+    match args.format:
+        case _CheckFormat.TEXT.value:
+            print("\n".join(_format_check_report_text(report) for report in reports))
+        case _CheckFormat.JSON.value:
+            print(
+                json.dumps(
+                    [
+                        {
+                            "config": report.config_name,
+                            "source": report.source,
+                            "errors": [str(error) for error in report.errors],
+                            "unknown": report.unknown,
+                        }
+                        for report in reports
+                    ],
+                    indent=2,
+                )
+            )
+        case _:
+            raise ValueError(f"unexpected format {args.format}")
+
+    return 0 if all(report.ok for report in reports) else 1
+
+
+def _codegen(args: argparse.Namespace) -> None:
+    """
+    Run the codegen command.
+    """
+
+    source = generate(_import_minicfg_class(args.path))
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(source)
+    else:
+        print(source, end="")
+
+
+def _format_time(timestamp: float | None) -> str:
+    if timestamp is None:
+        return "never"
+    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _telemetry(args: argparse.Namespace) -> None:
+    """
+    Run the telemetry command.
+    """
+
+    report = telemetry.merge(telemetry.load(path) for path in args.dumps)
+    accesses = sorted(report.values(), key=lambda access: (-access.reads, access.name))
+    if args.unused:
+        accesses = [access for access in accesses if not access.reads]
+
+    match args.format:
+        case _CheckFormat.TEXT.value:
+            for access in accesses:
+                print(f"{access.reads:>12} {_format_time(access.last_read):>19}  {access.name}")
+        case _CheckFormat.JSON.value:
+            print(json.dumps([dataclasses.asdict(access) for access in accesses], indent=2))
+        case _:
+            raise ValueError(f"unexpected format {args.format}")
+
+
+def main():
+    argv = sys.argv[1:]
+    if argv and argv[0] == _CHECK_COMMAND:
+        sys.exit(_check(_parse_check_args(argv[1:])))
+    if argv and argv[0] == _CODEGEN_COMMAND:
+        _codegen(_parse_codegen_args(argv[1:]))
+        return
+    if argv and argv[0] == _TELEMETRY_COMMAND:
+        _telemetry(_parse_telemetry_args(argv[1:]))
+        return
+
+    args = _parse_args(argv)
+
+    minicfg_class = _import_minicfg_class(args.path)
     minicfg_instance = minicfg_class()
 
     docs_generator = DocsGenerator(minicfg_instance)
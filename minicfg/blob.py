@@ -0,0 +1,224 @@
+"""
+Extraction of the fields of a minicfg from a single JSON or TOML blob (see minicfg_blob).
+
+Platforms often inject one variable (or mounted file) with a JSON or TOML document holding many settings.
+Instead of parsing the document once per field, the fields of a blob minicfg are mapped onto JSON pointer paths
+(RFC 6901) in the document. The blob is parsed once per population, and the parsed document is reused
+as long as the raw blob does not change. Extracted values are passed to the fields as raw values,
+so that the casters, validators and default values of the fields apply as usual.
+"""
+
+import typing
+from collections.abc import Mapping
+
+from .caster import AbstractCaster, ListCaster, _resolve_json_load
+from .field import Field
+from .provider import AbstractProvider
+
+if typing.TYPE_CHECKING:
+    from .decoding import AbstractDecoder
+    from .minicfg import Minicfg
+
+_FORMATS = ("json", "toml")
+
+
+class _BlobCaster(AbstractCaster):
+    """
+    Caster that parses the blob, reusing the last parsed document if the raw blob has not changed.
+    """
+
+    _format: str
+    _cache: tuple[str, typing.Any] | None  # last raw blob and its parsed document
+
+    def __init__(self, format: str):
+        self._format = format
+        self._cache = None
+
+    @property
+    def typename(self) -> str:
+        return self._format
+
+    def cast(self, value: str) -> typing.Any:
+        cache = self._cache
+        if cache is not None and cache[0] == value:
+            return cache[1]
+
+        if self._format == "toml":
+            document = _resolve_toml_load()(value)
+        else:
+            document = _resolve_json_load()(value)
+        self._cache = (value, document)
+        return document
+
+
+class _Blob:
+    """
+    Blob of a blob minicfg: the field of the raw blob and the JSON pointers of the fields of the minicfg.
+    """
+
+    field: Field  # field of the raw blob, named after the blob minicfg
+    _pointers: dict[str, str]  # JSON pointers set explicitly, by attribute name
+    _tokens: dict[str, tuple[str, ...]]  # reference tokens of the JSON pointers, by field name
+    _separators: dict[str, str]  # separators of the fields cast with ListCaster, by field name
+
+    def __init__(
+        self,
+        format: str,
+        pointers: Mapping[str, str],
+        attach_file_field: bool,
+        decoders: typing.Iterable["AbstractDecoder"] | None,
+    ):
+        if format not in _FORMATS:
+            raise ValueError(f"unsupported blob format {format!r}, expected one of {_FORMATS}")
+        if format == "toml":
+            _resolve_toml_load()  # fail when the blob minicfg is defined rather than when it is populated
+        for pointer in pointers.values():
+            _parse_pointer(pointer)
+
+        self.field = Field(
+            caster=_BlobCaster(format), default=None, attach_file_field=attach_file_field, decoders=decoders
+        )
+        self._pointers = dict(pointers)
+        self._tokens = {}
+        self._separators = {}
+
+    def bind(self, minicfg_class: type["Minicfg"]) -> None:
+        """
+        Name the blob field after the blob minicfg and resolve the JSON pointers of its fields.
+        Called once the names of the fields of the minicfg are generated.
+        """
+
+        if not minicfg_class._name:
+            raise ValueError(f"blob minicfg {minicfg_class.__name__} must be named, its name is the key of the blob")
+        if next(minicfg_class._iter_minicfg_classes(), None) is not None:
+            raise ValueError(
+                f"blob minicfg {minicfg_class.__name__} cannot have child minicfgs, map nested values with pointers"
+            )
+
+        attr_names = {attr_name for attr_name, _ in minicfg_class._iter_class_field_instances()}
+        unknown = set(self._pointers) - attr_names
+        if unknown:
+            raise ValueError(f"pointers of unknown fields of {minicfg_class.__name__}: {sorted(unknown)}")
+
+        self.field.name = minicfg_class._name
+        if self.field.file_field:
+            self.field.file_field.name = f"{minicfg_class._name}_FILE"
+        self._tokens = {
+            field.name: _parse_pointer(self._pointers.get(attr_name, f"/{attr_name.lower()}"))
+            for attr_name, field in minicfg_class._iter_class_field_instances()
+        }
+        self._separators = {
+            field.name: field.caster.sep
+            for _, field in minicfg_class._iter_class_field_instances()
+            if isinstance(field.caster, ListCaster)
+        }
+
+    def provider(self, provider: AbstractProvider) -> AbstractProvider:
+        """
+        Populate the blob field using the given provider and return the provider of the values of the blob.
+        A missing blob provides no values.
+        :raises CastingError: if the blob cannot be parsed.
+        """
+
+        self.field.populate(provider)
+        return _BlobProvider(self.field.value, self._tokens, self._separators)
+
+
+class _BlobProvider(AbstractProvider):
+    """
+    Provider of the values of a parsed blob, by field name.
+    """
+
+    def __init__(self, document: typing.Any, tokens: dict[str, tuple[str, ...]], separators: dict[str, str]):
+        self._document = document
+        self._tokens = tokens
+        self._separators = separators
+
+    def get(self, key: str) -> str | None:
+        tokens = self._tokens.get(key)
+        if tokens is None or self._document is None:
+            return None
+        return _to_raw_value(_resolve(self._document, tokens), self._separators.get(key))
+
+
+def _resolve_toml_load() -> typing.Callable[[str], typing.Any]:
+    """
+    Resolve the TOML load function: tomllib of the standard library (Python 3.11+), or its tomli backport.
+    """
+
+    try:
+        import tomllib
+
+        return tomllib.loads
+    except ImportError:
+        pass
+    try:
+        import tomli
+
+        return tomli.loads
+    except ImportError:
+        raise ImportError("TOML blobs require Python 3.11+ (tomllib) or the tomli package") from None
+
+
+def _parse_pointer(pointer: str) -> tuple[str, ...]:
+    """
+    Parse the JSON pointer (e.g. "/database/hosts/0") into its reference tokens.
+    """
+
+    if pointer == "":
+        return ()
+    if not pointer.startswith("/"):
+        raise ValueError(f'invalid JSON pointer "{pointer}", it must be empty or start with "/"')
+    return tuple(token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/"))
+
+
+def _resolve(document: typing.Any, tokens: tuple[str, ...]) -> typing.Any:
+    """
+    Return the value referenced by the tokens in the document, or None if there is no such value.
+    """
+
+    value = document
+    for token in tokens:
+        if isinstance(value, dict):
+            value = value.get(token)
+        elif isinstance(value, list) and token.isdigit() and int(token) < len(value):
+            value = value[int(token)]
+        else:
+            return None
+        if value is None:
+            return None
+    return value
+
+
+def _to_raw_value(value: typing.Any, separator: str | None = None) -> str | None:
+    """
+    Convert the extracted value to a raw value: strings are kept, booleans become "true" and "false",
+    dates and times are formatted in ISO 8601, arrays and objects are serialized to JSON.
+    :param separator: separator of the ListCaster of the field, if any. Arrays of scalars are joined with it,
+        so that the caster splits them back into the items.
+    """
+
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if separator is not None and isinstance(value, list) and not any(isinstance(item, (list, dict)) for item in value):
+        return separator.join(_to_raw_value(item) or "" for item in value)
+    if isinstance(value, (list, dict)):
+        import json
+
+        return json.dumps(value, default=str)
+    if hasattr(value, "isoformat"):
+        # TOML dates and times
+        return value.isoformat()
+    return str(value)
+
+
+def _has_blob(minicfg_class: type["Minicfg"]) -> bool:
+    """
+    Check whether the Minicfg class or one of its children recursively is a blob minicfg.
+    """
+
+    return minicfg_class._blob is not None or any(
+        _has_blob(child_minicfg_class) for _, child_minicfg_class in minicfg_class._iter_minicfg_classes()
+    )
@@ -0,0 +1,350 @@
+"""
+Columnar bulk population of many instances of the same Minicfg class.
+
+Multi-tenant services build thousands of instances of one Minicfg class, one per row of a table (CSV, SQLite, ...).
+Populating them one by one repeats the per-field work (attribute iteration, provider lookups, casting) for every row.
+populate_many takes the table as columns of raw values keyed by field name and casts each column in one pass
+of its caster (see AbstractCaster.cast_many). The result is a columnar view of the cast values, from which
+Minicfg instances are built only when they are needed.
+"""
+
+import typing
+from collections.abc import Iterator, Mapping, Sequence
+
+from .blob import _has_blob
+from .field import NO_DEFAULT_VALUE, DecodingError, Field, ValidationError, _read_raw_value_from_file, _validate_value
+from .minicfg import Minicfg, PopulationError
+from .provider import AbstractProvider
+
+if typing.TYPE_CHECKING:
+    from .interning import Interner
+
+_M = typing.TypeVar("_M", bound=Minicfg)
+
+_RawColumn = Sequence[str | bytes | None]
+
+
+class RowError(Exception):
+    """
+    Exception raised when a row of the columns could not be populated.
+    """
+
+    row: int  # index of the row
+    error: Exception  # error raised by the field, the same as Minicfg.populate would raise for the row
+
+    def __init__(self, row: int, error: Exception):
+        self.row = row
+        self.error = error
+        super().__init__(f"row {row}: {error}")
+
+
+class _RowProvider(AbstractProvider):
+    """
+    A provider serving the raw values of one row of the columns.
+    """
+
+    def __init__(self, columns: Mapping[str, _RawColumn], row: int):
+        self._columns = columns
+        self._row = row
+
+    def get(self, key: str) -> str | bytes | None:
+        column = self._columns.get(key)
+        return column[self._row] if column is not None else None
+
+
+class _ClassPlan:
+    """
+    Fields and children of a Minicfg class, used to build instances from the columns.
+    """
+
+    def __init__(self, minicfg_class: type[Minicfg]):
+        self.minicfg_class = minicfg_class
+        self.fields: list[tuple[str, Field]] = list(minicfg_class._iter_class_field_instances())
+        self.children: list[tuple[str, _ClassPlan]] = [
+            (attr_name, _ClassPlan(child_minicfg_class))
+            for attr_name, child_minicfg_class in minicfg_class._iter_minicfg_classes()
+        ]
+
+    def iter_fields(self) -> Iterator[Field]:
+        """
+        Iterate over the fields of the class and its children recursively.
+        """
+
+        for _, field in self.fields:
+            yield field
+        for _, child_plan in self.children:
+            yield from child_plan.iter_fields()
+
+
+class _Layout:
+    """
+    Columns of the fields of a Minicfg class and its children, bound once to build instances quickly.
+    """
+
+    def __init__(self, plan: _ClassPlan, values: dict[str, list[typing.Any]], raw_values: dict[str, _RawColumn]):
+        self.minicfg_class = plan.minicfg_class
+        self.attr_names = tuple(attr_name for attr_name, _ in plan.fields)
+        self.value_columns = tuple(values[field.name] for _, field in plan.fields)
+        self.raw_columns = tuple(raw_values[field.name] for _, field in plan.fields)
+        self.children = [
+            (attr_name, _Layout(child_plan, values, raw_values)) for attr_name, child_plan in plan.children
+        ]
+
+
+class ColumnarConfigs(typing.Generic[_M]):
+    """
+    ColumnarConfigs class is a columnar view of many populated instances of a Minicfg class.
+    Cast values are stored by column, and instances are built on demand (see row() and instances()).
+    """
+
+    _plan: _ClassPlan
+    _layout: _Layout
+    _length: int
+    _values: dict[str, list[typing.Any]]  # field name -> cast values of the rows
+    _raw_values: dict[str, _RawColumn]  # field name -> raw values of the rows (None if the default value was used)
+
+    def __init__(
+        self, plan: _ClassPlan, length: int, values: dict[str, list[typing.Any]], raw_values: dict[str, _RawColumn]
+    ):
+        self._plan = plan
+        self._length = length
+        self._values = values
+        self._raw_values = raw_values
+        self._layout = _Layout(plan, values, raw_values)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[_M]:
+        for index in range(self._length):
+            yield self._build(self._layout, index)
+
+    def column(self, name: str) -> list[typing.Any]:
+        """
+        Return the cast values of the field in all rows. The list must not be modified.
+        :param name: name of the field (e.g. "APP_DB_PORT").
+        """
+
+        try:
+            return self._values[name]
+        except KeyError:
+            raise KeyError(f"{name} is not a field of {self._plan.minicfg_class.__name__}") from None
+
+    def row(self, index: int) -> _M:
+        """
+        Build the populated Minicfg instance of the row. A new instance is built on every call.
+        :param index: index of the row.
+        """
+
+        if not -self._length <= index < self._length:
+            raise IndexError(f"row {index} is out of range")
+        return self._build(self._layout, index % self._length)
+
+    def instances(self) -> list[_M]:
+        """
+        Build the populated Minicfg instances of all rows.
+        """
+
+        return list(self)
+
+    def _build(self, layout: _Layout, index: int) -> Minicfg:
+        """
+        Build the populated instance of the layout for the row, as Minicfg.populate would populate it.
+        """
+
+        # instances are built without __init__, since names are generated and children are built here:
+        config = object.__new__(layout.minicfg_class)
+        config.__dict__.update(zip(layout.attr_names, [column[index] for column in layout.value_columns]))
+        config._raw_values = dict(zip(layout.attr_names, [column[index] for column in layout.raw_columns]))
+        for attr_name, child_layout in layout.children:
+            config.__dict__[attr_name] = self._build(child_layout, index)
+
+        # (computed as Minicfg.populate computes it, so that rows equal instances populated from the same values)
+        config._fingerprint = config._compute_fingerprint()
+        return config
+
+
+def populate_many(
+    minicfg_class: type[_M],
+    columns: Mapping[str, _RawColumn],
+    collect_errors: bool = False,
+    interner: "Interner | None" = None,
+) -> ColumnarConfigs[_M]:
+    """
+    Populate many instances of the Minicfg class from columns of raw values, one instance per row.
+    Rows are populated as Minicfg.populate would populate them from a provider serving the values of the row:
+    None values and missing columns are not provided, attached file fields are read from their own columns.
+
+    :param minicfg_class: Minicfg class to populate. Interpolated fields and blob minicfgs are not supported.
+    :param columns: columns of raw values by field name (e.g. "APP_DB_PORT"), all of the same length.
+        Columns of other names (e.g. tenant ids) are ignored.
+    :param collect_errors: if set, all rows are checked and a single PopulationError listing the RowErrors
+        of all failed rows is raised at the end.
+    :param interner: if set, values and raw values are deduplicated across rows (and with other instances
+        populated with the same interner, see minicfg.interning).
+    :return: columnar view of the populated instances.
+    :raises RowError: if a row could not be populated (and errors are not collected).
+    """
+
+    if not columns:
+        raise ValueError("at least one column is required")
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) != 1:
+        raise ValueError(f"columns must have the same length, got lengths {sorted(lengths)}")
+    (length,) = lengths
+
+    minicfg_class()  # generate the names of the fields once per class
+    if minicfg_class._get_interpolation_plan() is not None:
+        raise ValueError(f"{minicfg_class.__name__} has interpolated fields, which cannot be populated in bulk")
+    if _has_blob(minicfg_class):
+        raise ValueError(f"{minicfg_class.__name__} has blob minicfgs, which cannot be populated in bulk")
+
+    plan = _ClassPlan(minicfg_class)
+    values: dict[str, list[typing.Any]] = {}
+    raw_values: dict[str, _RawColumn] = {}
+    failed_rows: set[int] = set()
+    for field in plan.iter_fields():
+        raw_values[field.name] = _raw_column(field, columns, length, failed_rows)
+        values[field.name] = _cast_column(field, raw_values[field.name], length, failed_rows)
+        if interner is not None:
+            raw_values[field.name] = list(map(interner.intern, raw_values[field.name]))
+            values[field.name] = list(map(interner.intern, values[field.name]))
+
+    if failed_rows:
+        _raise_row_errors(minicfg_class, columns, sorted(failed_rows), collect_errors)
+
+    return ColumnarConfigs(plan, length, values, raw_values)
+
+
+def _raw_column(field: Field, columns: Mapping[str, _RawColumn], length: int, failed_rows: set[int]) -> _RawColumn:
+    """
+    Return the raw values of the field, with missing values read from the files of the attached file field if any,
+    decoded by the decoders of the field. Rows whose values could not be decoded are added to failed_rows.
+    """
+
+    column = columns.get(field.name)
+    if column is None:
+        column = [None] * length
+
+    file_column = columns.get(field.file_field.name) if field.file_field else None
+    if file_column is None or None not in column:
+        return _decode_column(field, column, failed_rows) if field.decoders else column
+
+    column = list(column)
+    if field.decoders:
+        column = _decode_column(field, column, failed_rows)
+    binary = bool(field.caster and field.caster.accepts_bytes)
+    for index, path in enumerate(file_column):
+        if column[index] is None and path is not None and index not in failed_rows:
+            if not field.decoders:
+                column[index] = _read_raw_value_from_file(path, binary=binary)
+                continue
+            try:
+                column[index] = field._read_decoded_file(path)
+            except DecodingError:
+                failed_rows.add(index)
+    return column
+
+
+def _decode_column(field: Field, column: _RawColumn, failed_rows: set[int]) -> list[str | bytes | None]:
+    """
+    Decode the provided raw values of the field. Rows whose values could not be decoded are added to failed_rows
+    and their values are replaced with None.
+    """
+
+    decoded: list[str | bytes | None] = []
+    for index, raw_value in enumerate(column):
+        if raw_value is None:
+            decoded.append(None)
+            continue
+        try:
+            decoded.append(field._decode_raw_value(raw_value))
+        except DecodingError:
+            failed_rows.add(index)
+            decoded.append(None)
+    return decoded
+
+
+def _cast_column(field: Field, raw_column: _RawColumn, length: int, failed_rows: set[int]) -> list[typing.Any]:
+    """
+    Cast the provided raw values of the field in one pass and validate them, using the default value for the rest.
+    Rows which could not be populated are added to failed_rows.
+    """
+
+    if None not in raw_column:
+        # fast path: all values are provided
+        rows = range(length)
+        provided = raw_column
+    else:
+        rows = [index for index, raw_value in enumerate(raw_column) if raw_value is not None]
+        provided = [raw_column[index] for index in rows]
+        if field.default is NO_DEFAULT_VALUE:
+            failed_rows.update(index for index, raw_value in enumerate(raw_column) if raw_value is None)
+
+    try:
+        cast_values = field.caster.cast_many(provided) if field.caster else list(provided)
+    except Exception:
+        # find the failed rows by casting the values one by one:
+        cast_values = []
+        for index, raw_value in zip(rows, provided):
+            try:
+                cast_values.append(field.caster.cast(raw_value))
+            except Exception:
+                failed_rows.add(index)
+                cast_values.append(None)
+
+    if field.validators or field.item_validators:
+        _validate_column(field, rows, cast_values, failed_rows)
+
+    if provided is raw_column:
+        return cast_values
+
+    column = [field.default] * length
+    for index, value in zip(rows, cast_values):
+        column[index] = value
+    return column
+
+
+def _validate_column(field: Field, rows: Sequence[int], cast_values: list[typing.Any], failed_rows: set[int]) -> None:
+    """
+    Validate the cast values of the field, adding the rows with invalid values to failed_rows.
+    """
+
+    try:
+        # validators check all values of the column in one pass:
+        for validator in field.validators:
+            validator.validate_many(cast_values)
+        validators: tuple = ()
+    except Exception:
+        # (values of rows which failed to be cast are None, so validators may fail with other errors)
+        validators = field.validators
+
+    if not validators and not field.item_validators:
+        return
+
+    for index, value in zip(rows, cast_values):
+        if index in failed_rows:
+            continue
+        try:
+            _validate_value(field.name, value, validators, field.item_validators, field.secret)
+        except ValidationError:
+            failed_rows.add(index)
+
+
+def _raise_row_errors(
+    minicfg_class: type[Minicfg], columns: Mapping[str, _RawColumn], rows: list[int], collect_errors: bool
+) -> typing.NoReturn:
+    """
+    Populate the failed rows one by one to raise the same errors as Minicfg.populate.
+    """
+
+    errors: list[Exception] = []
+    for index in rows:
+        try:
+            minicfg_class().populate(_RowProvider(columns, index), collect_errors=collect_errors)
+        except PopulationError as e:
+            errors += [RowError(index, error) for error in e.errors]
+        except Exception as e:
+            raise RowError(index, e) from e
+
+    raise PopulationError(errors)
@@ -1,6 +1,13 @@
+import datetime
+import enum
+import functools
+import ipaddress
+import re
+import types
 import typing
+import urllib.parse
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
 
 class AbstractCaster(ABC):
@@ -8,6 +15,12 @@ class AbstractCaster(ABC):
     Abstract caster class.
     """
 
+    """
+    Indicates whether the caster accepts raw bytes. If set, values of attached file fields are passed
+    to the caster as bytes read from the file, without decoding and stripping.
+    """
+    accepts_bytes: bool = False
+
     @abstractmethod
     def typename(self) -> str | None:
         """
@@ -26,6 +39,17 @@ class AbstractCaster(ABC):
 
         pass
 
+    def cast_many(self, values: Sequence[str]) -> list[typing.Any]:
+        """
+        Cast all the provided values (e.g. a column of a table) in one pass.
+        :param values: values to be cast.
+        :return: the cast values, in the same order.
+        :raises Exception: if any of the values cannot be cast.
+        """
+
+        cast = self.cast
+        return [cast(value) for value in values]
+
 
 class IntCaster(AbstractCaster):
     """
@@ -39,6 +63,9 @@ class IntCaster(AbstractCaster):
     def cast(self, value: str) -> int:
         return int(value)
 
+    def cast_many(self, values: Sequence[str]) -> list[int]:
+        return list(map(int, values))
+
 
 class FloatCaster(AbstractCaster):
     """
@@ -52,26 +79,61 @@ class FloatCaster(AbstractCaster):
     def cast(self, value: str) -> float:
         return float(value)
 
+    def cast_many(self, values: Sequence[str]) -> list[float]:
+        return list(map(float, values))
+
 
 class BoolCaster(AbstractCaster):
     """
     Caster that casts the provided value to a boolean.
+    Values are matched case-insensitively.
     """
 
     true = {"true", "yes", "on", "enable", "enabled", "1"}
     false = {"false", "no", "off", "disable", "disabled", "0"}
 
+    def __init__(self):
+        # common spellings are matched without allocating lowercase copies, other ones are lowercased:
+        self._values, self._lowercase_values = _bool_values(frozenset(self.true), frozenset(self.false))
+
     @property
     def typename(self) -> str:
         return "bool"
 
     def cast(self, value: str) -> bool:
-        if value in self.true:
-            return True
-        elif value in self.false:
-            return False
+        result = self._values.get(value)
+        if result is None:
+            result = self._lowercase_values.get(value.lower())
+            if result is None:
+                raise ValueError("the provided value cannot be cast to bool")
+        return result
+
+    def cast_many(self, values: Sequence[str]) -> list[bool]:
+        try:
+            return list(map(self._values.__getitem__, values))
+        except KeyError:
+            pass
+        try:
+            return [self._lowercase_values[value.lower()] for value in values]
+        except KeyError:
+            raise ValueError("one of the provided values cannot be cast to bool") from None
+
+
+@functools.lru_cache(maxsize=None)
+def _bool_values(true: frozenset[str], false: frozenset[str]) -> tuple[dict[str, bool], dict[str, bool]]:
+    """
+    Build the mappings of the given true and false values to booleans: one of their common spellings
+    (lowercase, uppercase and capitalized) and one of their lowercase forms.
+    """
 
-        raise ValueError("the provided value cannot be cast to bool")
+    values: dict[str, bool] = {}
+    lowercase_values: dict[str, bool] = {}
+    for words, result in ((true, True), (false, False)):
+        for word in words:
+            for variant in (word.lower(), word.upper(), word.capitalize()):
+                values[variant] = result
+            lowercase_values[word.lower()] = result
+    return values, lowercase_values
 
 
 class ListCaster(AbstractCaster):
@@ -120,23 +182,365 @@ class JSONCaster(AbstractCaster):
     Caster that casts the provided value to a JSON object.
     """
 
-    _load: Callable[[str], dict[typing.Any, typing.Any]] | None
+    _load: Callable[[str | bytes], typing.Any]
+    _keys: tuple[str, ...] | None
 
-    def __init__(self, load: Callable[[str], dict[typing.Any, typing.Any]] | None = None):
+    def __init__(
+        self,
+        load: Callable[[str], typing.Any] | None = None,
+        keys: typing.Iterable[str] | None = None,
+    ):
         """
         Initialize JSONCaster.
-        :param load: custom json load function. If set to None, standard json.load is used.
+        :param load: custom json load function, called with str values. If set to None, orjson.loads is used
+            if orjson is installed, standard json.loads otherwise (both are given the raw bytes of file fields).
+        :param keys: keys the JSON object must contain. If set, only these keys are extracted from the object.
         """
-        self._load = load
+
+        # only the default load functions are known to accept bytes:
+        self.accepts_bytes = load is None
+        self._load = load or _resolve_json_load()
+        self._keys = tuple(keys) if keys is not None else None
 
     @property
     def typename(self) -> str:
         return "json"
 
-    def cast(self, value: str) -> dict[typing.Any, typing.Any] | list[typing.Any]:
-        if self._load:
-            return self._load(value)
+    def cast(self, value: str | bytes) -> dict[typing.Any, typing.Any] | list[typing.Any]:
+        result = self._load(value)
+        if self._keys is None:
+            return result
+
+        if not isinstance(result, dict):
+            raise ValueError("the provided value is not a JSON object")
+        try:
+            return {key: result[key] for key in self._keys}
+        except KeyError as e:
+            raise ValueError(f"the provided JSON object has no key {e.args[0]!r}") from None
+
 
+@functools.lru_cache(maxsize=None)
+def _resolve_json_load() -> Callable[[str | bytes], typing.Any]:
+    """
+    Resolve the default JSON load function (only once).
+    orjson is used if it is installed, standard json otherwise. Both accept str and bytes.
+    """
+
+    try:
+        import orjson
+
+        return orjson.loads
+    except ImportError:
         import json
 
-        return json.loads(value)
+        return json.loads
+
+
+class EnumCaster(AbstractCaster):
+    """
+    Caster that casts the provided value to a member of the given enum.
+    Values are matched against member values (converted to strings) first, then against member names.
+    """
+
+    def __init__(self, enum_class: type[enum.Enum]):
+        """
+        Initialize the enum caster.
+        :param enum_class: enum class to cast values to.
+        """
+
+        self.enum_class = enum_class
+        self._members: dict[str, enum.Enum] = {member.name: member for member in enum_class}
+        self._members.update({str(member.value): member for member in enum_class})
+
+    @property
+    def typename(self) -> str:
+        return self.enum_class.__name__
+
+    def cast(self, value: str) -> enum.Enum:
+        try:
+            return self._members[value]
+        except KeyError:
+            raise ValueError(f"the provided value is not a member of {self.enum_class.__name__}") from None
+
+    def cast_many(self, values: Sequence[str]) -> list[enum.Enum]:
+        try:
+            return list(map(self._members.__getitem__, values))
+        except KeyError:
+            raise ValueError(f"one of the provided values is not a member of {self.enum_class.__name__}") from None
+
+
+_DURATION_UNITS = {  # unit -> number of seconds
+    "us": 1e-6,
+    "µs": 1e-6,
+    "ms": 1e-3,
+    "s": 1.0,
+    "m": 60.0,
+    "h": 3600.0,
+    "d": 86400.0,
+    "w": 604800.0,
+}
+_DURATION_COMPONENT_RE = re.compile(r"(\d+(?:\.\d*)?|\.\d+)(us|µs|ms|s|m|h|d|w)")
+
+
+class DurationCaster(AbstractCaster):
+    """
+    Caster that casts the provided value to a timedelta.
+    Accepts one or more components with units (e.g. "30s", "1h30m", "1.5d", "500ms") or plain numbers of seconds.
+    Supported units: us (µs), ms, s, m, h, d, w.
+    """
+
+    @property
+    def typename(self) -> str:
+        return "duration"
+
+    def cast(self, value: str) -> datetime.timedelta:
+        if value and value[-1].isdigit():
+            return datetime.timedelta(seconds=float(value))
+
+        seconds = 0.0
+        length = 0
+        for number, unit in _DURATION_COMPONENT_RE.findall(value):
+            seconds += float(number) * _DURATION_UNITS[unit]
+            length += len(number) + len(unit)
+
+        # matches do not overlap, so the value is fully matched if there are no gaps between them:
+        if length == 0 or length != len(value):
+            raise ValueError("the provided value is not a duration")
+        return datetime.timedelta(seconds=seconds)
+
+    def cast_many(self, values: Sequence[str]) -> list[typing.Any]:
+        return _cast_distinct(self.cast, values)
+
+
+_BYTE_SIZE_UNITS = {
+    "": 1,
+    "b": 1,
+    "k": 1000,
+    "kb": 1000,
+    "m": 1000**2,
+    "mb": 1000**2,
+    "g": 1000**3,
+    "gb": 1000**3,
+    "t": 1000**4,
+    "tb": 1000**4,
+    "p": 1000**5,
+    "pb": 1000**5,
+    "kib": 1024,
+    "mib": 1024**2,
+    "gib": 1024**3,
+    "tib": 1024**4,
+    "pib": 1024**5,
+}
+_BYTE_SIZE_RE = re.compile(r"\s*(\d+(?:\.\d*)?|\.\d+)\s*([a-z]*)\s*", re.IGNORECASE)
+
+
+class ByteSizeCaster(AbstractCaster):
+    """
+    Caster that casts the provided value to a number of bytes.
+    Accepts plain numbers and numbers with decimal (kB, MB, GB, TB, PB) or binary (KiB, MiB, GiB, TiB, PiB) units,
+    e.g. "512MiB" or "1.5GB". Units are case-insensitive.
+    """
+
+    @property
+    def typename(self) -> str:
+        return "bytesize"
+
+    def cast(self, value: str) -> int:
+        match = _BYTE_SIZE_RE.fullmatch(value)
+        if match is None:
+            raise ValueError("the provided value is not a byte size")
+
+        number, unit = match.groups()
+        try:
+            multiplier = _BYTE_SIZE_UNITS[unit.lower()]
+        except KeyError:
+            raise ValueError(f"unknown byte size unit {unit}") from None
+
+        if "." in number:
+            return int(float(number) * multiplier)
+        return int(number) * multiplier
+
+    def cast_many(self, values: Sequence[str]) -> list[typing.Any]:
+        return _cast_distinct(self.cast, values)
+
+
+class URLCaster(AbstractCaster):
+    """
+    Caster that casts the provided value to a parsed URL (urllib.parse.SplitResult).
+    """
+
+    def __init__(self, schemes: typing.Iterable[str] | None = None):
+        """
+        Initialize the URL caster.
+        :param schemes: allowed URL schemes (e.g. ["http", "https"]). Any scheme is allowed if not set.
+        """
+
+        self.schemes = frozenset(schemes) if schemes is not None else None
+
+    @property
+    def typename(self) -> str:
+        return "url"
+
+    def cast(self, value: str) -> urllib.parse.SplitResult:
+        result = urllib.parse.urlsplit(value)
+        if not result.scheme or not result.netloc:
+            raise ValueError("the provided value is not an absolute URL")
+        if self.schemes is not None and result.scheme not in self.schemes:
+            raise ValueError(f"URL scheme {result.scheme} is not allowed")
+
+        result.port  # validate the port
+        return result
+
+    def cast_many(self, values: Sequence[str]) -> list[typing.Any]:
+        return _cast_distinct(self.cast, values)
+
+
+class IPAddressCaster(AbstractCaster):
+    """
+    Caster that casts the provided value to an IPv4 or IPv6 address.
+    """
+
+    def __init__(self, version: int | None = None):
+        """
+        Initialize the IP address caster.
+        :param version: if set to 4 or 6, only addresses of this IP version are accepted.
+        """
+
+        self.version = version
+        self._cast = _ip_constructor(version, ipaddress.ip_address, ipaddress.IPv4Address, ipaddress.IPv6Address)
+
+    @property
+    def typename(self) -> str:
+        return f"ipv{self.version}_address" if self.version else "ip_address"
+
+    def cast(self, value: str) -> ipaddress.IPv4Address | ipaddress.IPv6Address:
+        return self._cast(value)
+
+    def cast_many(self, values: Sequence[str]) -> list[typing.Any]:
+        return _cast_distinct(self.cast, values)
+
+
+class IPNetworkCaster(AbstractCaster):
+    """
+    Caster that casts the provided value to an IPv4 or IPv6 network (CIDR notation, e.g. "10.0.0.0/8").
+    """
+
+    def __init__(self, strict: bool = True, version: int | None = None):
+        """
+        Initialize the IP network caster.
+        :param strict: if set, values with host bits set (e.g. "10.0.0.1/8") are rejected.
+        :param version: if set to 4 or 6, only networks of this IP version are accepted.
+        """
+
+        self.strict = strict
+        self.version = version
+        self._cast = _ip_constructor(version, ipaddress.ip_network, ipaddress.IPv4Network, ipaddress.IPv6Network)
+
+    @property
+    def typename(self) -> str:
+        return f"ipv{self.version}_network" if self.version else "ip_network"
+
+    def cast(self, value: str) -> ipaddress.IPv4Network | ipaddress.IPv6Network:
+        return self._cast(value, strict=self.strict)
+
+    def cast_many(self, values: Sequence[str]) -> list[typing.Any]:
+        return _cast_distinct(self.cast, values)
+
+
+def _ip_constructor(version: int | None, any_version: typing.Any, v4: type, v6: type) -> typing.Any:
+    """
+    Return the ipaddress function or class constructing values of the given IP version (any version if None).
+    """
+
+    constructors = {None: any_version, 4: v4, 6: v6}
+    if version not in constructors:
+        raise ValueError(f"unsupported IP version {version!r}, expected 4 or 6")
+    return constructors[version]
+
+
+class DateTimeCaster(AbstractCaster):
+    """
+    Caster that casts the provided value to a datetime.
+    """
+
+    def __init__(self, format: str | None = None):
+        """
+        Initialize the datetime caster.
+        :param format: strptime format of the values. ISO 8601 is expected if not set.
+        """
+
+        self.format = format
+
+    @property
+    def typename(self) -> str:
+        return "datetime"
+
+    def cast(self, value: str) -> datetime.datetime:
+        if self.format:
+            return datetime.datetime.strptime(value, self.format)
+        return datetime.datetime.fromisoformat(value)
+
+    def cast_many(self, values: Sequence[str]) -> list[typing.Any]:
+        return _cast_distinct(self.cast, values)
+
+
+def _cast_distinct(cast: Callable[[str], typing.Any], values: Sequence[str]) -> list[typing.Any]:
+    """
+    Cast each distinct value only once, which pays off for columns with few distinct values (e.g. durations).
+    Only used by casters returning immutable values, since the cast values are shared.
+    """
+
+    cast_values = {value: cast(value) for value in set(values)}
+    return list(map(cast_values.__getitem__, values))
+
+
+@functools.lru_cache(maxsize=None)
+def infer_caster(annotation: typing.Any) -> AbstractCaster | None:
+    """
+    Infer the caster from the given type annotation.
+    Casters are cached, so the same annotation always results in the same caster instance.
+
+    Supported annotations: str, int, float, bool, list, list[...], dict, dict[...], Optional[...], enums,
+    timedelta, datetime, IP addresses and IP networks.
+    :param annotation: type annotation.
+    Values of other annotations are left as strings, set the caster explicitly to cast them.
+    :return: the inferred caster or None if the value should be left as a string.
+    """
+
+    if annotation is str or annotation is typing.Any:
+        return None
+    if annotation is int:
+        return IntCaster()
+    if annotation is float:
+        return FloatCaster()
+    if annotation is bool:
+        return BoolCaster()
+    if annotation is list:
+        return ListCaster()
+    if annotation is dict:
+        return JSONCaster()
+    if annotation is datetime.timedelta:
+        return DurationCaster()
+    if annotation is datetime.datetime:
+        return DateTimeCaster()
+    if annotation is ipaddress.IPv4Address or annotation is ipaddress.IPv6Address:
+        return IPAddressCaster(version=4 if annotation is ipaddress.IPv4Address else 6)
+    if annotation is ipaddress.IPv4Network or annotation is ipaddress.IPv6Network:
+        return IPNetworkCaster(version=4 if annotation is ipaddress.IPv4Network else 6)
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return EnumCaster(annotation)
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is list:
+        return ListCaster(item_caster=infer_caster(args[0])) if args else infer_caster(list)
+    if origin is dict:
+        return infer_caster(dict)
+    if origin is typing.Union or origin is getattr(types, "UnionType", None):
+        # Optional[...] annotations are cast using the caster of the non-None type:
+        not_none_args = [arg for arg in args if arg is not type(None)]
+        if len(not_none_args) == 1:
+            return infer_caster(not_none_args[0])
+
+    # other annotations (e.g. pathlib.Path or custom classes) leave the value as a string, as without annotations:
+    return None
@@ -0,0 +1,164 @@
+import dataclasses
+import json
+import os
+from collections.abc import Mapping
+
+from .field import Field
+from .minicfg import Minicfg, PopulationError
+from .provider import DictProvider
+
+
+@dataclasses.dataclass
+class CheckReport:
+    """
+    CheckReport class represents the result of checking an environment against a Minicfg class.
+    """
+
+    config_name: str
+    source: str  # name of the checked environment (e.g. path to the env file)
+    errors: list[Exception]  # missing and uncastable fields
+    unknown: list[str]  # variables matching the config prefix, but not defined by the config
+
+    @property
+    def ok(self) -> bool:
+        """
+        Return True if no problems were found.
+        """
+
+        return not self.errors and not self.unknown
+
+
+class Checker:
+    """
+    Checker validates environments against a Minicfg instance without booting the service.
+    The instance is reused between checks, so checking many environments costs one population per environment.
+    """
+
+    _config: Minicfg
+    _known_names: frozenset[str]  # names of all fields (including attached file fields) of the config tree
+    _prefixes: tuple[str, ...]  # name prefixes of all named minicfgs of the config tree
+
+    def __init__(self, config: Minicfg):
+        """
+        Initialize the checker.
+        :param config: Minicfg instance to check environments against.
+        """
+
+        self._config = config
+
+        known_names: set[str] = set()
+        prefixes: set[str] = set()
+        _collect_names(config, known_names, prefixes)
+
+        self._known_names = frozenset(known_names)
+        self._prefixes = tuple(sorted(prefixes))
+
+    def check(self, data: Mapping[str, str], source: str = "environment") -> CheckReport:
+        """
+        Check the given environment.
+        :param data: mapping of variable names to raw values.
+        :param source: name of the environment used in the report.
+        :return: check report.
+        """
+
+        errors: list[Exception] = []
+        try:
+            self._config.populate(DictProvider(data), collect_errors=True)
+        except PopulationError as e:
+            errors = e.errors
+
+        unknown: list[str] = []
+        if self._prefixes:
+            for key in data:
+                if key.startswith(self._prefixes) and key not in self._known_names:
+                    unknown.append(key)
+            unknown.sort()
+
+        return CheckReport(
+            config_name=self._config.name or self._config.__class__.__name__,
+            source=source,
+            errors=errors,
+            unknown=unknown,
+        )
+
+
+def _collect_names(config: Minicfg, known_names: set[str], prefixes: set[str]) -> None:
+    """
+    Collect field names and name prefixes of the given Minicfg instance and its children recursively.
+    """
+
+    if config.name:
+        prefixes.add(f"{config.name}{config._name_sep}")
+
+    if config._blob is not None:
+        # the fields of blob minicfgs are extracted from the blob, which is the only provided value:
+        known_names.add(config._blob.field.name)
+        if config._blob.field.file_field:
+            known_names.add(config._blob.field.file_field.name)
+
+    for child in config:
+        if isinstance(child, Field):
+            known_names.add(child.name)
+            if child.file_field:
+                known_names.add(child.file_field.name)
+        elif isinstance(child, Minicfg):
+            _collect_names(child, known_names, prefixes)
+
+
+def load_env_file(path: str) -> dict[str, str]:
+    """
+    Load variables from a dotenv or JSON file.
+    Files with the .json extension must contain a JSON object, non-string values are converted to JSON text.
+    :param path: path to the file.
+    :return: mapping of variable names to raw values.
+    """
+
+    if os.path.splitext(path)[1].lower() == ".json":
+        with open(path, "rb") as file:
+            data = json.load(file)
+        if not isinstance(data, dict):
+            raise ValueError(f"{path} must contain a JSON object")
+        return {
+            key: value if isinstance(value, str) else json.dumps(value)
+            for key, value in data.items()
+            if value is not None
+        }
+
+    with open(path, "r") as file:
+        return parse_dotenv(file.read())
+
+
+def parse_dotenv(text: str) -> dict[str, str]:
+    """
+    Parse dotenv formatted text.
+    Supports comments, blank lines, the "export" keyword and single or double-quoted values.
+    :param text: dotenv text.
+    :return: mapping of variable names to raw values.
+    """
+
+    result: dict[str, str] = {}
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        if line.startswith("export "):
+            line = line[len("export ") :].lstrip()
+
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            raise ValueError(f"invalid dotenv line {line_number}: {line}")
+
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        else:
+            # strip inline comments of unquoted values:
+            comment_start = value.find(" #")
+            if comment_start != -1:
+                value = value[:comment_start].rstrip()
+
+        result[key] = value
+
+    return result
@@ -0,0 +1,237 @@
+"""
+Ahead-of-time generation of specialized loaders for Minicfg classes.
+
+The generated module contains a straight-line loader with hardcoded field names, direct caster calls,
+default values and attached file field fallbacks, and slotted value classes mirroring the Minicfg tree.
+Loading through it gives the same values and raises the same errors as Minicfg.populate, without any reflection.
+Casters, default values and validators are taken from the Field instances of the Minicfg class.
+"""
+
+from .blob import _has_blob
+from .field import NO_DEFAULT_VALUE, Field
+from .minicfg import Minicfg
+
+_INDENT = "    "
+
+
+class _Generator:
+    """
+    Generator of the loader module source code.
+    """
+
+    _config_class: type[Minicfg]
+    _lines: list[str]  # lines of the loader functions and value classes
+    _refs: list[str]  # lines binding Field instances and their casters and defaults to module-level names
+    _field_count: int
+    _class_count: int  # number of generated value classes, used to name them uniquely
+
+    def __init__(self, config_class: type[Minicfg]):
+        self._config_class = config_class
+        self._lines = []
+        self._refs = []
+        self._field_count = 0
+        self._class_count = 0
+
+    def generate(self) -> str:
+        config_class = self._config_class
+
+        # casters inferred from string annotations are resolved lazily, so the generated module has to resolve them:
+        self._generate_annotations_resolution(config_class, "_Config")
+        config_class()  # resolve casters and generate field names
+        if config_class._get_interpolation_plan() is not None:
+            raise ValueError(f"{config_class.__qualname__} has interpolated fields, which are not supported by codegen")
+        if _has_blob(config_class):
+            raise ValueError(f"{config_class.__qualname__} has blob minicfgs, which are not supported by codegen")
+
+        self._generate_class(config_class, "_Config", "Config")
+
+        header = [
+            '"""',
+            f"Loader for {config_class.__module__}.{config_class.__qualname__} generated by `minicfg codegen`.",
+            "Do not edit, regenerate the module when the config class changes.",
+            '"""',
+            "",
+            "from minicfg.field import (",
+            f"{_INDENT}CastingError,",
+            f"{_INDENT}FieldValueNotProvidedError,",
+            f"{_INDENT}_read_raw_value_from_file,",
+            f"{_INDENT}_validate_value,",
+            ")",
+            "from minicfg.provider import AbstractProvider, EnvProvider",
+            f"from {config_class.__module__} import {config_class.__qualname__.split('.')[0]} as _root",
+            "",
+            f"_Config = _root{''.join('.' + part for part in config_class.__qualname__.split('.')[1:])}",
+            "",
+            *self._refs,
+        ]
+        footer = [
+            "",
+            "",
+            "def load(provider: AbstractProvider | None = None) -> Config:",
+            f'{_INDENT}"""',
+            f"{_INDENT}Load the config using the given provider (environment variables by default).",
+            f'{_INDENT}"""',
+            "",
+            f"{_INDENT}if not provider:",
+            f"{_INDENT * 2}provider = EnvProvider()",
+            f"{_INDENT}return _load_Config(provider, provider.get)",
+        ]
+
+        return "\n".join(header + self._lines + footer) + "\n"
+
+    def _generate_annotations_resolution(self, minicfg_class: type[Minicfg], class_ref: str) -> None:
+        """
+        Generate calls resolving string annotations of the Minicfg class and its children recursively.
+        """
+
+        # (fields, and their annotations, may be inherited from base classes)
+        if any(
+            isinstance(annotation, str) and isinstance(base.__dict__.get(attr_name), Field)
+            for base in minicfg_class.__mro__
+            for attr_name, annotation in base.__dict__.get("__annotations__", {}).items()
+        ):
+            self._refs.append(f"{class_ref}._resolve_annotations()")
+        for attr_name, child_minicfg_class in minicfg_class._iter_minicfg_classes():
+            self._generate_annotations_resolution(child_minicfg_class, f"{class_ref}.{attr_name}")
+
+    def _generate_class(self, minicfg_class: type[Minicfg], class_ref: str, value_class_name: str) -> None:
+        """
+        Generate the value class and the loader function of the Minicfg class and its children recursively.
+        :param minicfg_class: Minicfg class.
+        :param class_ref: expression referring to the Minicfg class in the generated module.
+        :param value_class_name: name of the generated value class.
+        """
+
+        field_names = [attr_name for attr_name, _ in minicfg_class._iter_class_field_instances()]
+        # (names of child classes are numbered, joining the attribute names would make e.g. A.B and A_B collide)
+        children: list[tuple[str, str]] = []
+        for attr_name, _ in minicfg_class._iter_minicfg_classes():
+            self._class_count += 1
+            children.append((attr_name, f"{attr_name}_{self._class_count}"))
+        slots = field_names + [attr_name for attr_name, _ in children]
+
+        # value class:
+        self._lines += [
+            "",
+            "",
+            f"class {value_class_name}:",
+            f"{_INDENT}__slots__ = ({''.join(repr(slot) + ', ' for slot in slots)})",
+            "",
+            f"{_INDENT}def __init__(self{''.join(f', _{i}' for i in range(len(slots)))}):",
+            *[f"{_INDENT * 2}self.{slot} = _{i}" for i, slot in enumerate(slots)],
+        ]
+        if not slots:
+            self._lines.append(f"{_INDENT * 2}pass")
+
+        # loader function (fields are loaded in the same order as Minicfg.populate does):
+        body: list[str] = []
+        for attr_name, field in minicfg_class._iter_class_field_instances():
+            body += self._generate_field(field, f"{class_ref}.__dict__[{attr_name!r}]", f"value_{attr_name}")
+        for attr_name, child_value_class_name in children:
+            body.append(f"child_{attr_name} = _load_{child_value_class_name}(provider, get)")
+        body.append(
+            f"return {value_class_name}("
+            + ", ".join([f"value_{attr_name}" for attr_name in field_names] + [f"child_{name}" for name, _ in children])
+            + ")"
+        )
+
+        self._lines += [
+            "",
+            "",
+            f"def _load_{value_class_name}(provider, get):",
+            *[f"{_INDENT}{line}" for line in body],
+        ]
+
+        for attr_name, child_value_class_name in children:
+            self._generate_class(
+                getattr(minicfg_class, attr_name),
+                f"{class_ref}.{attr_name}",
+                child_value_class_name,
+            )
+
+    def _generate_field(self, field: Field, field_ref: str, var: str) -> list[str]:
+        """
+        Generate the statements loading the field value into the given variable.
+        :param field: Field instance.
+        :param field_ref: expression referring to the Field instance in the generated module.
+        :param var: name of the variable to load the value into.
+        """
+
+        index = self._field_count
+        self._field_count += 1
+
+        field_var = f"_field_{index}"
+        self._refs.append(f"{field_var} = {field_ref}")
+        if field.caster:
+            self._refs.append(f"_caster_{index} = {field_var}.caster")
+        if field.default is not NO_DEFAULT_VALUE:
+            self._refs.append(f"_default_{index} = {field_var}.default")
+        if field.validators or field.item_validators:
+            self._refs.append(f"_validators_{index} = {field_var}.validators")
+            self._refs.append(f"_item_validators_{index} = {field_var}.item_validators")
+
+        lines = [
+            f"# {field.name}",
+            f"raw = get({field.name!r})",
+        ]
+        if field.decoders:
+            lines += [
+                "if raw is not None:",
+                f"{_INDENT}raw = {field_var}._decode_raw_value(raw)",
+            ]
+        lines.append("if raw is None:")
+
+        missing: list[str]
+        if field.default is not NO_DEFAULT_VALUE:
+            missing = [f"{var} = _default_{index}"]
+        else:
+            missing = [f"raise FieldValueNotProvidedError(field_name={field.name!r}, provider=provider)"]
+
+        if field.file_field:
+            binary = bool(field.caster and field.caster.accepts_bytes)
+            if field.decoders:
+                read = f"{field_var}._read_decoded_file(path)"
+            else:
+                read = f"_read_raw_value_from_file(path, binary={binary})"
+            lines += [
+                f"{_INDENT}path = get({field.file_field.name!r})",
+                f"{_INDENT}if path is not None:",
+                f"{_INDENT * 2}raw = {read}",
+                "if raw is None:",
+            ]
+        lines += [f"{_INDENT}{line}" for line in missing]
+
+        lines.append("else:")
+        if field.caster:
+            lines += [
+                f"{_INDENT}try:",
+                f"{_INDENT * 2}{var} = _caster_{index}.cast(raw)",
+                f"{_INDENT}except Exception as e:",
+                f"{_INDENT * 2}raise CastingError(field_name={field.name!r}, raw_value=raw, caster=_caster_{index}) from e",
+            ]
+        else:
+            lines.append(f"{_INDENT}{var} = raw")
+
+        if field.validators or field.item_validators:
+            lines.append(
+                f"{_INDENT}_validate_value({field.name!r}, {var}, _validators_{index}, _item_validators_{index}, "
+                f"{field.secret})"
+            )
+
+        return lines
+
+
+def generate(config_class: type[Minicfg]) -> str:
+    """
+    Generate the source code of a loader module for the Minicfg class.
+    The generated module provides `load(provider=None)` returning an instance of the generated slotted `Config` class.
+    :param config_class: Minicfg class. It must be importable by its module and qualified name.
+    :return: source code of the loader module.
+    """
+
+    if not (isinstance(config_class, type) and issubclass(config_class, Minicfg)):
+        raise TypeError(f"{config_class!r} is not a Minicfg class")
+    if "<locals>" in config_class.__qualname__:
+        raise ValueError(f"{config_class.__qualname__} is not importable, define it at the module level")
+
+    return _Generator(config_class).generate()
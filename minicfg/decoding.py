@@ -0,0 +1,244 @@
+"""
+Streaming decoding of raw values: base64 and gzip/bz2/lzma compression.
+
+Large certificates, keytabs and blobs are often provided base64-encoded and/or compressed. The decoders of a field
+(see the decoders parameter of Field) are applied in order to the provided raw value or to the content of the attached
+file, chunk by chunk, so that neither the whole encoded content nor the intermediate stages are held in memory at once.
+"""
+
+import binascii
+import io
+import typing
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
+
+_CHUNK_SIZE = 64 * 1024  # size of the chunks read from files and of the decompressed chunks
+_BASE64_WHITESPACE = b" \t\r\n\v\f"
+_URLSAFE_ALPHABET = bytes.maketrans(b"-_", b"+/")
+_BASE64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="  # (with padding)
+_GZIP_WBITS = 16 + 15  # zlib window bits accepting the gzip header and trailer
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_BZ2_MAGIC = b"BZh"
+_XZ_MAGIC = b"\xfd7zXZ\x00"
+
+
+class AbstractDecoder(ABC):
+    """
+    Abstract decoder class.
+    """
+
+    @abstractmethod
+    def decode(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Decode the stream of encoded chunks into a stream of decoded chunks.
+        :param chunks: encoded chunks, of any size.
+        :raises Exception: if the stream cannot be decoded.
+        """
+
+        pass
+
+
+class Base64Decoder(AbstractDecoder):
+    """
+    Decoder that decodes base64, ignoring whitespaces (e.g. line breaks of PEM-like values) and missing padding.
+    """
+
+    _urlsafe: bool
+
+    def __init__(self, urlsafe: bool = False):
+        """
+        Initialize Base64Decoder.
+        :param urlsafe: if set, the URL-safe alphabet (with "-" and "_") is decoded instead of the standard one.
+        """
+
+        self._urlsafe = urlsafe
+
+    def decode(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        # binascii skips invalid characters (strict_mode is only available on Python 3.11+), so they are checked here:
+        pending = b""
+        position = 0  # number of base64 characters before the chunk
+        padding = -1  # position of the first padding character, if any
+        for chunk in chunks:
+            data = chunk.translate(_URLSAFE_ALPHABET if self._urlsafe else None, _BASE64_WHITESPACE)
+            if data.translate(None, _BASE64_ALPHABET):
+                raise ValueError("invalid base64 character")
+            if padding < 0 and (index := data.find(b"=")) >= 0:
+                padding = position + index
+            if padding >= 0 and data[max(padding - position, 0) :].strip(b"="):
+                raise ValueError("excess data after base64 padding")
+            position += len(data)
+
+            data = pending + data
+            # only whole groups of 4 characters can be decoded, the rest waits for the next chunk:
+            end = len(data) - len(data) % 4
+            pending = data[end:]
+            if end:
+                yield binascii.a2b_base64(data[:end])
+
+        if padding >= 0 and (padding % 4 < 2 or position > padding - padding % 4 + 4):
+            raise ValueError("invalid base64 padding")
+        if pending:
+            yield binascii.a2b_base64(pending + b"=" * (-len(pending) % 4))
+
+
+class GzipDecoder(AbstractDecoder):
+    """
+    Decoder that decompresses gzip (including concatenated gzip members).
+    """
+
+    def decode(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        import zlib
+
+        decompressor = zlib.decompressobj(wbits=_GZIP_WBITS)
+        for data in chunks:
+            while data:
+                if decompressor.eof:
+                    decompressor = zlib.decompressobj(wbits=_GZIP_WBITS)
+                # output is bounded, the rest of the input is kept in unconsumed_tail:
+                yield decompressor.decompress(data, _CHUNK_SIZE)
+                data = decompressor.unconsumed_tail or decompressor.unused_data
+
+        yield decompressor.flush()
+        if not decompressor.eof:
+            raise ValueError("compressed data is truncated")
+
+
+class _StreamDecompressorDecoder(AbstractDecoder):
+    """
+    Base class of decoders decompressing with bz2 and lzma decompressor objects.
+    """
+
+    @abstractmethod
+    def _new_decompressor(self) -> typing.Any:
+        pass
+
+    def decode(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        decompressor = self._new_decompressor()
+        for data in chunks:
+            while data:
+                if decompressor.eof:
+                    # concatenated streams:
+                    decompressor = self._new_decompressor()
+                # output is bounded, the rest of the input is buffered by the decompressor:
+                yield decompressor.decompress(data, _CHUNK_SIZE)
+                while not decompressor.eof and not decompressor.needs_input:
+                    yield decompressor.decompress(b"", _CHUNK_SIZE)
+                data = decompressor.unused_data
+
+        if not decompressor.eof:
+            raise ValueError("compressed data is truncated")
+
+
+class Bz2Decoder(_StreamDecompressorDecoder):
+    """
+    Decoder that decompresses bzip2.
+    """
+
+    def _new_decompressor(self) -> typing.Any:
+        import bz2
+
+        return bz2.BZ2Decompressor()
+
+
+class LzmaDecoder(_StreamDecompressorDecoder):
+    """
+    Decoder that decompresses xz and legacy lzma.
+    """
+
+    def _new_decompressor(self) -> typing.Any:
+        import lzma
+
+        return lzma.LZMADecompressor()
+
+
+class AutoDecompressDecoder(AbstractDecoder):
+    """
+    Decoder that detects gzip, bzip2 and xz compression by the magic bytes at the start of the data
+    and decompresses it accordingly. Other data is passed through unchanged.
+    """
+
+    def decode(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        chunks = iter(chunks)
+        head = b""
+        for chunk in chunks:
+            head += chunk
+            if len(head) >= len(_XZ_MAGIC):
+                break
+
+        decoder: AbstractDecoder | None = None
+        if head.startswith(_GZIP_MAGIC):
+            decoder = GzipDecoder()
+        elif head.startswith(_BZ2_MAGIC):
+            decoder = Bz2Decoder()
+        elif head.startswith(_XZ_MAGIC):
+            decoder = LzmaDecoder()
+
+        stream = _prepend(head, chunks)
+        yield from (decoder.decode(stream) if decoder else stream)
+
+
+class _DecoderFailure(Exception):
+    """
+    Exception raised by decode when one of the decoders fails, caused by the error of the decoder.
+    """
+
+    decoder: AbstractDecoder
+
+    def __init__(self, decoder: AbstractDecoder):
+        super().__init__(f"{decoder.__class__.__name__} failed")
+        self.decoder = decoder
+
+
+def decode(chunks: Iterable[bytes], decoders: Sequence[AbstractDecoder], binary: bool) -> str | bytes:
+    """
+    Decode the stream of chunks using the decoders in order.
+    :param chunks: encoded chunks (e.g. read from a file).
+    :param decoders: decoders applied in order (e.g. [Base64Decoder(), GzipDecoder()]).
+    :param binary: if set, the decoded bytes are returned, otherwise they are decoded as UTF-8.
+    :raises _DecoderFailure: if one of the decoders fails.
+    """
+
+    stream: Iterable[bytes] = chunks
+    for decoder in decoders:
+        stream = _stage(decoder, stream)
+
+    # the buffer of BytesIO is returned by getvalue without being copied:
+    output = io.BytesIO()
+    for chunk in stream:
+        output.write(chunk)
+
+    if binary:
+        return output.getvalue()
+    try:
+        return output.getvalue().decode()
+    except UnicodeDecodeError as e:
+        raise _DecoderFailure(decoders[-1]) from e
+
+
+def read_chunks(file: typing.BinaryIO) -> Iterator[bytes]:
+    """
+    Iterate over the content of the open file by chunks.
+    """
+
+    while chunk := file.read(_CHUNK_SIZE):
+        yield chunk
+
+
+def _stage(decoder: AbstractDecoder, chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Apply the decoder to the chunks, turning its errors into _DecoderFailure (errors of previous stages pass through).
+    """
+
+    try:
+        yield from decoder.decode(chunks)
+    except _DecoderFailure:
+        raise
+    except Exception as e:
+        raise _DecoderFailure(decoder) from e
+
+
+def _prepend(head: bytes, chunks: Iterator[bytes]) -> Iterator[bytes]:
+    if head:
+        yield head
+    yield from chunks
@@ -1,7 +1,13 @@
-from typing import Any
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
 from .caster import AbstractCaster
+from .interpolation import Template
 from .provider import AbstractProvider
+from .validator import AbstractValidator
+
+if TYPE_CHECKING:
+    from .decoding import AbstractDecoder
 
 
 class CastingError(Exception):
@@ -12,7 +18,7 @@ class CastingError(Exception):
     def __init__(
         self,
         field_name: str,
-        raw_value: str,
+        raw_value: str | bytes,
         caster: AbstractCaster,
     ):
         super().__init__(
@@ -20,6 +26,24 @@ class CastingError(Exception):
         )
 
 
+class ValidationError(Exception):
+    """
+    Exception raised when a cast field value is rejected by a validator.
+    """
+
+    def __init__(self, field_name: str, reason: str):
+        super().__init__(f"value of the field {field_name} is invalid: {reason}")
+
+
+class DecodingError(Exception):
+    """
+    Exception raised when the raw value of a field cannot be decoded by its decoders.
+    """
+
+    def __init__(self, field_name: str, decoder: "AbstractDecoder"):
+        super().__init__(f"failed to decode raw value of the field {field_name} using {decoder.__class__.__name__}")
+
+
 class FieldValueNotProvidedError(Exception):
     """
     Exception raised when a field value is not provided by the provider.
@@ -45,8 +69,15 @@ class Field:
     _caster: AbstractCaster  # caster used to cast raw values
     _description: str  # description of the field in documentation purposes
     _file_field: "Field | None"  # file field attached to the field
+    _secret: bool  # indicates whether the field value is secret
+    _validators: tuple[AbstractValidator, ...]  # validators applied to the cast value
+    _item_validators: tuple[AbstractValidator, ...]  # validators applied to all items of the cast value
+    _template: Template | None  # template of the raw value used when the provider has no value of the field
+    _interpolate: bool  # indicates whether references in the raw value are interpolated
+    _decoders: tuple["AbstractDecoder", ...]  # decoders applied to the raw value before casting
 
     _value: Any  # value determined after field population
+    _raw_value: str | bytes | None  # raw value used during the last population, None if the default value was used
 
     def __init__(
         self,
@@ -55,6 +86,12 @@ class Field:
         caster: AbstractCaster | None = None,
         description: str | None = None,
         attach_file_field: bool = False,
+        secret: bool = False,
+        validators: Iterable[AbstractValidator] | None = None,
+        item_validators: Iterable[AbstractValidator] | None = None,
+        template: str | None = None,
+        interpolate: bool = False,
+        decoders: Iterable["AbstractDecoder"] | None = None,
     ):
         """
         Initialize the field.
@@ -63,15 +100,35 @@ class Field:
         :param caster: caster used to cast raw value to field value.
         :param description: description of the field in documentation purposes.
         :param attach_file_field: indicates whether file field should be attached to the field
+        :param secret: indicates whether the field value is secret and should be masked in reports.
+        :param validators: validators applied to the cast value (default values are not validated).
+        :param item_validators: validators applied to all items of the cast value in one pass (e.g. for ListCaster).
+        :param template: template of the raw value with `${NAME}` references to other fields
+            (e.g. "${DB_HOST}:${DB_PORT}"), used when the provider has no value of the field. Implies interpolate.
+        :param interpolate: indicates whether `${NAME}` references in the provided raw value are interpolated.
+        :param decoders: decoders applied in order to the provided raw value or to the content of the attached file
+            before casting (e.g. [Base64Decoder(), AutoDecompressDecoder()], see minicfg.decoding).
+            The decoded value is stripped text, or bytes if the caster accepts bytes.
         """
 
+        if template is not None and attach_file_field:
+            raise ValueError("fields with a template cannot have an attached file field")
+
         self._name = name
         self._default = default
         self._caster = caster
         self._description = description
         self._file_field = Field(name=f"{self._name}_FILE" if self._name else None, description=f"{self._description} file" if self._description else None) if attach_file_field else None
 
+        self._secret = secret
+        self._validators = tuple(validators or ())
+        self._item_validators = tuple(item_validators or ())
+        self._template = Template(template) if template is not None else None
+        self._interpolate = interpolate or template is not None
+        self._decoders = tuple(decoders or ())
+
         self._value = None
+        self._raw_value = None
 
     @property
     def name(self) -> str | None:
@@ -97,6 +154,10 @@ class Field:
 
         return self._caster
 
+    @caster.setter
+    def caster(self, value: AbstractCaster | None) -> None:
+        self._caster = value
+
     @property
     def description(self) -> str:
         """
@@ -113,6 +174,62 @@ class Field:
 
         return self._value
 
+    @property
+    def raw_value(self) -> str | bytes | None:
+        """
+        Return the raw value used during the last population (None if the default value was used).
+        """
+
+        return self._raw_value
+
+    @property
+    def secret(self) -> bool:
+        """
+        Return True if the field value is secret.
+        """
+
+        return self._secret
+
+    @property
+    def validators(self) -> tuple[AbstractValidator, ...]:
+        """
+        Return the validators applied to the cast value.
+        """
+
+        return self._validators
+
+    @property
+    def item_validators(self) -> tuple[AbstractValidator, ...]:
+        """
+        Return the validators applied to all items of the cast value.
+        """
+
+        return self._item_validators
+
+    @property
+    def template(self) -> Template | None:
+        """
+        Return the template of the raw value.
+        """
+
+        return self._template
+
+    @property
+    def interpolate(self) -> bool:
+        """
+        Return True if references in the raw value are interpolated.
+        """
+
+        return self._interpolate
+
+    @property
+    def decoders(self) -> tuple["AbstractDecoder", ...]:
+        """
+        Return the decoders applied to the raw value before casting.
+        """
+
+        return self._decoders
+
     @property
     def file_field(self) -> "Field | None":
         """
@@ -127,7 +244,7 @@ class Field:
         :param provider: provider to use to get the raw value of the field.
         """
 
-        raw_value: str | None = provider.get(self._name)
+        raw_value: str | bytes | None = provider.get(self._name)
         if raw_value is None:
             if self._file_field:
                 # populate field using attached file field
@@ -137,16 +254,25 @@ class Field:
                     if self._default is not NO_DEFAULT_VALUE:
                         # use the default value if it is provided
                         self._value = self._default
+                        self._raw_value = None
                         return
                     raise FieldValueNotProvidedError(field_name=self._name, provider=provider) from e
-                raw_value = _read_raw_value_from_file(self._file_field.value)
+                if self._decoders:
+                    raw_value = self._read_decoded_file(self._file_field.value)
+                else:
+                    raw_value = _read_raw_value_from_file(
+                        self._file_field.value, binary=bool(self._caster and self._caster.accepts_bytes)
+                    )
             elif self._default is not NO_DEFAULT_VALUE:
                 # use the default value if it is provided
                 self._value = self._default
+                self._raw_value = None
                 return
             else:
                 # raise an error if the value is not provided and no default value is set
                 raise FieldValueNotProvidedError(field_name=self._name, provider=provider)
+        elif self._decoders:
+            raw_value = self._decode_raw_value(raw_value)
 
         populated_value: Any = raw_value
         if self.caster:
@@ -159,15 +285,91 @@ class Field:
                     caster=self._caster,
                 ) from e
 
+        if self._validators or self._item_validators:
+            self._validate(populated_value)
+
         self._value = populated_value
+        self._raw_value = raw_value
 
+    def _decode_raw_value(self, raw_value: str | bytes) -> str | bytes:
+        """
+        Decode the provided raw value using the decoders of the field.
+        :raises DecodingError: if one of the decoders fails.
+        """
 
-def _read_raw_value_from_file(path: str) -> str:
+        return self._decode((raw_value.encode() if isinstance(raw_value, str) else raw_value,))
+
+    def _read_decoded_file(self, path: str) -> str | bytes:
+        """
+        Read the file at the given path by chunks and decode its content using the decoders of the field.
+        :raises DecodingError: if one of the decoders fails.
+        """
+
+        from .decoding import read_chunks
+
+        with open(path, "rb") as file:
+            return self._decode(read_chunks(file))
+
+    def _decode(self, chunks: Iterable[bytes]) -> str | bytes:
+        from .decoding import _DecoderFailure, decode
+
+        binary = bool(self._caster and self._caster.accepts_bytes)
+        try:
+            value = decode(chunks, self._decoders, binary)
+        except _DecoderFailure as e:
+            raise DecodingError(field_name=self._name, decoder=e.decoder) from e.__cause__
+        return value if binary else value.strip()
+
+    def _validate(self, value: Any) -> None:
+        """
+        Validate the cast value using the field validators.
+        :raises ValidationError: if the value is rejected by any of the validators.
+        """
+
+        _validate_value(self._name, value, self._validators, self._item_validators, self._secret)
+
+
+def _validate_value(
+    field_name: str,
+    value: Any,
+    validators: tuple[AbstractValidator, ...],
+    item_validators: tuple[AbstractValidator, ...],
+    secret: bool,
+) -> None:
+    """
+    Validate the cast value of the field.
+    :param field_name: name of the field used in the error message.
+    :param value: cast value.
+    :param validators: validators applied to the value.
+    :param item_validators: validators applied to all items of the value.
+    :param secret: if set, the value is not exposed in the error message.
+    :raises ValidationError: if the value is rejected by any of the validators
+        (including values of a type the validator cannot check, e.g. Pattern given an int).
+    """
+
+    validator: AbstractValidator | None = None
+    try:
+        for validator in validators:
+            validator.validate(value)
+        for validator in item_validators:
+            validator.validate_many(value)
+    except (ValueError, TypeError) as e:
+        # do not expose secret values in error messages:
+        reason = f"rejected by {validator.__class__.__name__}" if secret else str(e)
+        raise ValidationError(field_name=field_name, reason=reason) from e
+
+
+def _read_raw_value_from_file(path: str, binary: bool = False) -> str | bytes:
     """
     Read the raw value from the file at the given path.
     :param path: path to the file.
+    :param binary: if set, the raw bytes are returned as is, without decoding and stripping.
     :return: the raw value read from the file (with leading and trailing whitespaces removed).
     """
 
+    if binary:
+        with open(path, "rb") as file:
+            return file.read()
+
     with open(path, "r") as file:
         return file.read().strip()
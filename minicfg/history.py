@@ -0,0 +1,245 @@
+"""
+Bounded history of the versions of a populated Minicfg instance (see Minicfg.enable_history).
+
+Versions are stored as immutable trees of nodes, one node per minicfg. When a version is recorded, subtrees whose
+fingerprints have not changed since the previous version are shared with it, so the memory used by the history is
+proportional to the amount of change rather than to the number of versions. Rolling back restores only the subtrees
+which differ from the restored version.
+"""
+
+import collections
+import dataclasses
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from .minicfg import FieldChange, Minicfg
+
+
+@dataclasses.dataclass(frozen=True)
+class Version:
+    """
+    Version class represents a recorded version of a Minicfg instance.
+    """
+
+    number: int  # number of the version, increasing from 1
+    timestamp: float  # unix time when the version was recorded
+    fingerprint: bytes  # fingerprint of the Minicfg instance (see Minicfg.fingerprint)
+
+
+class _Node:
+    """
+    Immutable values of a minicfg in a version, shared by all versions in which the minicfg has not changed.
+    Values and raw values are in the order of the fields of the class, children in the order of its child minicfgs.
+    """
+
+    __slots__ = ("fingerprint", "values", "raw_values", "children")
+
+    def __init__(
+        self,
+        fingerprint: bytes,
+        values: tuple[typing.Any, ...],
+        raw_values: tuple[str | bytes | None, ...],
+        children: tuple["_Node", ...],
+    ):
+        self.fingerprint = fingerprint
+        self.values = values
+        self.raw_values = raw_values
+        self.children = children
+
+
+class ConfigHistory:
+    """
+    ConfigHistory class keeps the last versions of a populated Minicfg instance.
+    A version is recorded every time the instance is populated successfully.
+    Lazy child minicfgs are not covered, as they are not covered by fingerprints.
+    """
+
+    _config: "Minicfg"
+    _versions: collections.deque[tuple[Version, _Node]]  # oldest first
+    _next_number: int
+    _dirty: bool  # indicates whether the instance may differ from the current version (e.g. a population failed)
+    _lock: threading.Lock
+
+    def __init__(self, config: "Minicfg", max_versions: int):
+        """
+        Initialize the history and record the current version.
+        :param config: populated Minicfg instance.
+        :param max_versions: maximum number of versions kept. Older versions are discarded.
+        """
+
+        if max_versions < 1:
+            raise ValueError("at least one version must be kept")
+        if config.fingerprint is None:
+            raise ValueError(f"{config.__class__.__name__} is not populated")
+
+        self._config = config
+        self._versions = collections.deque(maxlen=max_versions)
+        self._next_number = 1
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.record()
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    @property
+    def versions(self) -> list[Version]:
+        """
+        Return the kept versions, oldest first. The last one is the current version.
+        """
+
+        return [version for version, _ in self._versions]
+
+    @property
+    def current(self) -> Version:
+        """
+        Return the current (last recorded) version.
+        """
+
+        return self._versions[-1][0]
+
+    def record(self) -> Version:
+        """
+        Record the current state of the Minicfg instance as a new version, unless its fingerprint has not changed.
+        Called by Minicfg.populate after every successful population.
+        :return: the current version.
+        """
+
+        with self._lock:
+            previous_node = self._versions[-1][1] if self._versions else None
+            node = _snapshot(self._config, previous_node)
+            self._dirty = False
+            if node is previous_node:
+                return self._versions[-1][0]
+            return self._append(node)
+
+    def invalidate(self) -> None:
+        """
+        Mark the Minicfg instance as possibly different from the current version, so that the next rollback
+        restores all values. Called by Minicfg.populate when a population fails halfway.
+        """
+
+        with self._lock:
+            self._dirty = True
+
+    def rollback(self, n: int = 1) -> Version:
+        """
+        Restore the Minicfg instance to the version recorded n versions before the current one.
+        The restored state is recorded as a new version (sharing all values with the restored version),
+        so rollbacks show up in the history and can be rolled back too.
+        :param n: number of versions to go back. 0 restores the current version
+            (e.g. after a population failed halfway).
+        :return: the new current version.
+        """
+
+        with self._lock:
+            if not 0 <= n < len(self._versions):
+                raise IndexError(f"cannot roll back {n} version(s), {len(self._versions)} version(s) are kept")
+
+            _, node = self._versions[-1 - n]
+            _restore(self._config, node, None if self._dirty else self._versions[-1][1])
+            self._dirty = False
+            if n == 0:
+                return self._versions[-1][0]
+            return self._append(node)
+
+    def diff(self, old: int, new: int) -> list["FieldChange"]:
+        """
+        Compare two kept versions. Only subtrees which are not shared by the versions are compared.
+        :param old: number of the older version.
+        :param new: number of the newer version.
+        :return: list of changed fields with old and new values. Values of secret fields are masked.
+        """
+
+        changes: list[FieldChange] = []
+        _diff(self._config.__class__, self._get_node(old), self._get_node(new), changes)
+        return changes
+
+    def _get_node(self, number: int) -> _Node:
+        for version, node in self._versions:
+            if version.number == number:
+                return node
+        raise KeyError(f"version {number} is not kept")
+
+    def _append(self, node: _Node) -> Version:
+        version = Version(number=self._next_number, timestamp=time.time(), fingerprint=node.fingerprint)
+        self._next_number += 1
+        self._versions.append((version, node))
+        return version
+
+
+def _eager_children(minicfg_class: type["Minicfg"]) -> typing.Iterator[tuple[str, type["Minicfg"]]]:
+    """
+    Iterate over the child minicfg classes covered by fingerprints (all but lazy ones).
+    """
+
+    for attr_name, child_minicfg_class in minicfg_class._iter_minicfg_classes():
+        if not child_minicfg_class._is_lazy():
+            yield attr_name, child_minicfg_class
+
+
+def _snapshot(config: "Minicfg", previous: _Node | None) -> _Node:
+    """
+    Build the node of the Minicfg instance, sharing the previous node (or its subtrees) if they have not changed.
+    """
+
+    if previous is not None and previous.fingerprint == config._fingerprint:
+        return previous
+
+    minicfg_class = config.__class__
+    attr_names = [attr_name for attr_name, _ in minicfg_class._iter_class_field_instances()]
+    children = tuple(
+        _snapshot(getattr(config, attr_name), previous.children[index] if previous is not None else None)
+        for index, (attr_name, _) in enumerate(_eager_children(minicfg_class))
+    )
+    return _Node(
+        fingerprint=config._fingerprint,
+        values=tuple(getattr(config, attr_name) for attr_name in attr_names),
+        raw_values=tuple(config._raw_values.get(attr_name) for attr_name in attr_names),
+        children=children,
+    )
+
+
+def _restore(config: "Minicfg", node: _Node, current: _Node | None) -> None:
+    """
+    Restore the values of the Minicfg instance from the node.
+    Subtrees shared with the node of the current version are skipped, since the instance already has their values
+    (unless the current node is None).
+    """
+
+    if node is current:
+        return
+
+    attr_names = [attr_name for attr_name, _ in config._iter_field_instances()]
+    for attr_name, value in zip(attr_names, node.values):
+        setattr(config, attr_name, value)
+    config._raw_values = dict(zip(attr_names, node.raw_values))
+    config._fingerprint = node.fingerprint
+
+    for index, ((attr_name, _), child_node) in enumerate(zip(_eager_children(config.__class__), node.children)):
+        _restore(getattr(config, attr_name), child_node, current.children[index] if current is not None else None)
+
+
+def _diff(minicfg_class: type["Minicfg"], old: _Node, new: _Node, changes: list["FieldChange"]) -> None:
+    from .minicfg import _SECRET_MASK, FieldChange
+
+    if old is new or old.fingerprint == new.fingerprint:
+        return
+
+    fields = [field for _, field in minicfg_class._iter_class_field_instances()]
+    for field, old_raw_value, new_raw_value, old_value, new_value in zip(
+        fields, old.raw_values, new.raw_values, old.values, new.values
+    ):
+        if old_raw_value == new_raw_value:
+            continue
+        if field.secret:
+            changes.append(FieldChange(name=field.name, old=_SECRET_MASK, new=_SECRET_MASK))
+        else:
+            changes.append(FieldChange(name=field.name, old=old_value, new=new_value))
+
+    for (_, child_minicfg_class), old_child, new_child in zip(
+        _eager_children(minicfg_class), old.children, new.children
+    ):
+        _diff(child_minicfg_class, old_child, new_child, changes)
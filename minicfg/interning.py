@@ -0,0 +1,204 @@
+"""
+Opt-in deduplication of values across many Minicfg instances (e.g. one per tenant).
+
+Most instances of multi-tenant processes share identical values (hosts, flags, big list or JSON defaults),
+but every population produces its own copies. An Interner passed to Minicfg.populate (or bulk.populate_many)
+replaces equal raw values and equal immutable cast values with a single shared object. Mutable values (lists, dicts)
+are only shared if the interner is asked to freeze them into tuples and FrozenDicts.
+"""
+
+import datetime
+import decimal
+import enum
+import ipaddress
+import threading
+import typing
+import uuid
+from collections.abc import Iterator, Mapping
+
+# types whose instances are immutable, so they can be shared:
+_IMMUTABLE_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    complex,
+    type(None),
+    enum.Enum,
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    datetime.timezone,
+    ipaddress.IPv4Address,
+    ipaddress.IPv6Address,
+    ipaddress.IPv4Network,
+    ipaddress.IPv6Network,
+    uuid.UUID,
+)
+# the most common immutable types, checked by exact type first:
+_SCALAR_TYPES = frozenset((str, bytes, int, float, bool, type(None)))
+
+
+class FrozenDict(Mapping):
+    """
+    Immutable and hashable mapping, used to share dicts (e.g. cast by JSONCaster) between instances.
+    """
+
+    __slots__ = ("_data", "_hash")
+
+    def __init__(self, data: Mapping[typing.Any, typing.Any]):
+        self._data = dict(data)
+        self._hash: int | None = None
+
+    def __getitem__(self, key: typing.Any) -> typing.Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[typing.Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({self._data!r})"
+
+
+class Interner:
+    """
+    Interner class deduplicates equal immutable values: the first value seen is returned for all equal values.
+    Values are compared together with their types, so that e.g. 1, 1.0 and True are not deduplicated with each other.
+    Containers are interned bottom-up, so equal items are shared between different containers too.
+    """
+
+    _values: dict[typing.Hashable, typing.Any]  # key (see _intern) -> shared value
+    _freeze: bool
+    _lock: threading.Lock
+    hits: int  # number of values replaced by shared values
+    misses: int  # number of values seen for the first time
+
+    def __init__(self, freeze: bool = False):
+        """
+        Initialize the interner.
+        :param freeze: if set, lists are converted to tuples and dicts to FrozenDicts (recursively),
+            so that they can be shared too. Otherwise, they are returned as they are.
+        """
+
+        self._values = {}
+        self._freeze = freeze
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def intern(self, value: typing.Any) -> typing.Any:
+        """
+        Return the shared value equal to the given value, or the value itself if it cannot be shared.
+        :param value: value to intern (e.g. a raw value or a cast value).
+        """
+
+        with self._lock:
+            return self._intern(value)[0]
+
+    def clear(self) -> None:
+        """
+        Forget all shared values.
+        """
+
+        with self._lock:
+            self._values.clear()
+
+    def _intern(self, value: typing.Any) -> tuple[typing.Any, bool]:
+        """
+        Return the shared value (or the value itself, frozen if requested) and whether it is shared.
+        Shared values are kept alive by the interner, so containers of shared items are keyed by the ids of the items.
+        """
+
+        value_type = type(value)
+        if value_type in _SCALAR_TYPES:
+            key = (value_type, value.hex() if value_type is float else value)
+        elif value_type is tuple or (value_type is list and self._freeze):
+            items, shared = self._intern_items(value)
+            if not shared:
+                return (items if self._freeze else value), False
+            value = items
+            key = (tuple, tuple(map(id, items)))
+        elif value_type is FrozenDict or (value_type is dict and self._freeze):
+            keys, keys_shared = self._intern_items(value.keys())
+            items, items_shared = self._intern_items(value.values())
+            if not (keys_shared and items_shared):
+                return (FrozenDict(zip(keys, items)) if self._freeze else value), False
+            value = FrozenDict(zip(keys, items))
+            key = (FrozenDict, frozenset(zip(map(id, keys), map(id, items))))
+        elif value_type is frozenset:
+            items, shared = self._intern_items(value)
+            if not shared:
+                return value, False
+            value = frozenset(items)
+            key = (frozenset, frozenset(map(id, items)))
+        elif isinstance(value, tuple) and hasattr(value, "_fields"):
+            # named tuples (e.g. urllib.parse.SplitResult) are immutable if their items are:
+            items, shared = self._intern_items(value)
+            if not shared:
+                return value, False
+            value = value._make(items)
+            key = (value_type, tuple(map(id, items)))
+        elif isinstance(value, _IMMUTABLE_TYPES):
+            key = (value_type, _scalar_key(value))
+        else:
+            # mutable or unknown values are not shared:
+            return value, False
+
+        shared_value = self._values.setdefault(key, value)
+        if shared_value is value:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return shared_value, True
+
+    def _intern_items(self, values: typing.Iterable[typing.Any]) -> tuple[tuple[typing.Any, ...], bool]:
+        items = []
+        all_shared = True
+        for value in values:
+            value, shared = self._intern(value)
+            items.append(value)
+            all_shared = all_shared and shared
+        return tuple(items), all_shared
+
+
+def freeze_value(value: typing.Any) -> typing.Any:
+    """
+    Return an immutable copy of the value if it is a list or a dict: lists are converted to tuples
+    and dicts to FrozenDicts, recursively. Other values are returned as they are.
+    """
+
+    value_type = type(value)
+    if value_type is list:
+        return tuple(map(freeze_value, value))
+    if value_type is dict:
+        return FrozenDict({key: freeze_value(item) for key, item in value.items()})
+    return value
+
+
+def _scalar_key(value: typing.Any) -> typing.Hashable:
+    """
+    Return the key of the immutable scalar value. Equal values which are distinguishable (e.g. 0.0 and -0.0,
+    Decimal("1") and Decimal("1.0"), or datetimes in different timezones) have different keys.
+    """
+
+    if isinstance(value, float):
+        return value.hex()
+    if isinstance(value, complex):
+        return value.real.hex(), value.imag.hex()
+    if isinstance(value, decimal.Decimal):
+        return value.as_tuple()
+    if isinstance(value, (datetime.datetime, datetime.time)):
+        return value, value.tzinfo
+    return value
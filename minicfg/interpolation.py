@@ -0,0 +1,243 @@
+"""
+Interpolation of `${NAME}` references in raw values of fields.
+
+References are full names of fields (e.g. `${DATABASE_HOST}`), resolved across the whole Minicfg tree
+being populated. Names which are not fields of the tree are looked up in the provider. `$$` is an escaped `$`.
+"""
+
+import functools
+import graphlib
+import re
+from collections.abc import Callable, Iterable, Mapping
+
+from .provider import AbstractProvider
+
+_REFERENCE_PATTERN = re.compile(r"\$(?:\{([^{}]*)\}|\$)")
+
+
+class InterpolationError(Exception):
+    """
+    Exception raised when references in the raw value of a field cannot be resolved.
+    """
+
+    def __init__(self, field_name: str, reason: str):
+        super().__init__(f"failed to interpolate the field {field_name}: {reason}")
+
+
+class Template:
+    """
+    Template class represents a string with `${NAME}` references, parsed once.
+    """
+
+    __slots__ = ("_source", "_parts", "_references")
+
+    _source: str
+    _parts: tuple[str, ...]  # literal parts at even indexes, names of the references at odd indexes
+    _references: tuple[str, ...]  # unique names of the references, in order of appearance
+
+    def __init__(self, source: str):
+        """
+        Parse the template.
+        :param source: template string.
+        """
+
+        parts: list[str] = []
+        literal: list[str] = []
+        position = 0
+        for match in _REFERENCE_PATTERN.finditer(source):
+            literal.append(source[position : match.start()])
+            name = match.group(1)
+            if name is None:
+                literal.append("$")
+            elif not name:
+                raise ValueError(f"empty reference in {source!r}")
+            else:
+                parts.append("".join(literal))
+                parts.append(name)
+                literal = []
+            position = match.end()
+        literal.append(source[position:])
+        parts.append("".join(literal))
+
+        self._source = source
+        self._parts = tuple(parts)
+        self._references = tuple(dict.fromkeys(parts[1::2]))
+
+    @property
+    def source(self) -> str:
+        return self._source
+
+    @property
+    def references(self) -> tuple[str, ...]:
+        """
+        Return the unique names of the references.
+        """
+
+        return self._references
+
+    def render(self, resolve: Callable[[str], str]) -> str:
+        """
+        Render the template.
+        :param resolve: function returning the value of the reference with the given name.
+        :return: rendered string.
+        """
+
+        parts = list(self._parts)
+        for i in range(1, len(parts), 2):
+            parts[i] = resolve(parts[i])
+        return "".join(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def parse_template(source: str) -> Template:
+    """
+    Parse the template, caching the recently parsed ones (raw values are usually the same between populations).
+    """
+
+    return Template(source)
+
+
+class InterpolationPlan:
+    """
+    InterpolationPlan class holds the interpolated fields of a Minicfg tree and the dependency graph
+    of their templates. It is built once per Minicfg class, template reference cycles are detected while building.
+    """
+
+    _interpolated: frozenset[str]  # names of the fields whose raw values are interpolated
+    _templates: dict[str, Template]  # field name -> template used when the provider has no value of the field
+    _defaults: dict[str, str]  # field name -> default value used when a referenced field has no value
+
+    def __init__(self, interpolated: Iterable[str], templates: Mapping[str, Template], defaults: Mapping[str, str]):
+        """
+        Initialize the plan.
+        :param interpolated: names of the fields whose raw values are interpolated.
+        :param templates: templates of the fields, by field name.
+        :param defaults: default values of the fields converted to strings, by field name.
+        :raises InterpolationError: if templates reference each other in a cycle.
+        """
+
+        self._interpolated = frozenset(interpolated)
+        self._templates = dict(templates)
+        self._defaults = dict(defaults)
+
+        sorter = graphlib.TopologicalSorter({name: template.references for name, template in self._templates.items()})
+        try:
+            sorter.prepare()
+        except graphlib.CycleError as e:
+            cycle: list[str] = e.args[1]
+            raise InterpolationError(cycle[0], f"reference cycle {' -> '.join(reversed(cycle))}") from None
+
+    @property
+    def interpolated(self) -> frozenset[str]:
+        return self._interpolated
+
+    @property
+    def templates(self) -> dict[str, Template]:
+        return self._templates
+
+    @property
+    def defaults(self) -> dict[str, str]:
+        return self._defaults
+
+    def dependents(self, names: Iterable[str], references: Mapping[str, tuple[str, ...]] | None = None) -> set[str]:
+        """
+        Return the names of the fields depending (directly or transitively) on any of the given names.
+        :param names: names of the changed fields or variables.
+        :param references: references of the raw values resolved during the last population, by field name.
+            Templates of the fields are used for fields without them.
+        """
+
+        graph: dict[str, tuple[str, ...]] = {name: template.references for name, template in self._templates.items()}
+        graph.update(references or {})
+
+        dependents_by_name: dict[str, list[str]] = {}
+        for name, field_references in graph.items():
+            for reference in field_references:
+                dependents_by_name.setdefault(reference, []).append(name)
+
+        result: set[str] = set()
+        pending = list(names)
+        while pending:
+            for dependent in dependents_by_name.get(pending.pop(), ()):
+                if dependent not in result:
+                    result.add(dependent)
+                    pending.append(dependent)
+        return result
+
+
+class Interpolator(AbstractProvider):
+    """
+    A provider wrapper resolving references in raw values of the interpolated fields during a single population.
+    Every key is looked up and every value is interpolated once (memoized), reference cycles are detected.
+    """
+
+    _provider: AbstractProvider
+    _plan: InterpolationPlan
+    _values: dict[str, str | None]  # key -> resolved value
+    _resolving: list[str]  # keys being resolved, used to detect reference cycles
+    _references: dict[str, tuple[str, ...]]  # field name -> references of its resolved raw value
+
+    def __init__(self, provider: AbstractProvider, plan: InterpolationPlan):
+        """
+        Initialize the interpolator.
+        :param provider: provider to get raw values from.
+        :param plan: interpolation plan of the Minicfg tree being populated.
+        """
+
+        self._provider = provider
+        self._plan = plan
+        self._values = {}
+        self._resolving = []
+        self._references = {}
+
+    @property
+    def references(self) -> dict[str, tuple[str, ...]]:
+        """
+        Return the references of the resolved raw values of the interpolated fields, by field name.
+        """
+
+        return self._references
+
+    def get(self, key: str) -> str | None:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        if key not in self._plan.interpolated:
+            value = self._values[key] = self._provider.get(key)
+            return value
+
+        if key in self._resolving:
+            cycle = self._resolving[self._resolving.index(key) :] + [key]
+            raise InterpolationError(key, f"reference cycle {' -> '.join(cycle)}")
+
+        self._resolving.append(key)
+        try:
+            raw_value = self._provider.get(key)
+            if raw_value is None:
+                template = self._plan.templates.get(key)
+            elif "$" in raw_value:
+                template = parse_template(raw_value)
+            else:
+                template = None
+
+            if template is None:
+                value = raw_value
+                self._references[key] = ()
+            else:
+                value = template.render(self._resolve_reference)
+                self._references[key] = template.references
+        finally:
+            self._resolving.pop()
+
+        self._values[key] = value
+        return value
+
+    def _resolve_reference(self, name: str) -> str:
+        value = self.get(name)
+        if value is None:
+            value = self._plan.defaults.get(name)
+        if value is None:
+            raise InterpolationError(self._resolving[-1], f"{name} is not provided")
+        return value
@@ -1,10 +1,53 @@
+import dataclasses
+import hashlib
+import sys
+import threading
 import typing
+from collections.abc import Iterable, Mapping
 
-from .field import Field
+from .blob import _Blob
+from .caster import AbstractCaster, infer_caster
+from .field import NO_DEFAULT_VALUE, CastingError, DecodingError, Field, FieldValueNotProvidedError, ValidationError
+from .interpolation import InterpolationError, InterpolationPlan, Interpolator, Template
 from .provider import AbstractProvider, EnvProvider
 
+if typing.TYPE_CHECKING:
+    from .decoding import AbstractDecoder
+    from .history import ConfigHistory
+    from .interning import Interner
+
 _DEFAULT_PROVIDER = EnvProvider
 _DEFAULT_NAME_SEP = "_"
+_FINGERPRINT_SIZE = 16
+_FINGERPRINT_JOIN_LIMIT = 64 * 1024  # raw values longer than this are hashed without being copied
+_SECRET_MASK = "******"
+
+
+class PopulationError(Exception):
+    """
+    Exception raised when one or more fields could not be populated.
+    Only raised by Minicfg.populate when errors are collected instead of being raised immediately.
+    """
+
+    errors: list[Exception]  # errors raised by the fields, in population order
+
+    def __init__(self, errors: list[Exception]):
+        self.errors = errors
+        super().__init__(
+            f"failed to populate {len(errors)} field(s):\n" + "\n".join(f" - {error}" for error in errors),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldChange:
+    """
+    FieldChange class represents a field whose value differs between two populated Minicfg instances.
+    Values of secret fields are masked.
+    """
+
+    name: str
+    old: typing.Any
+    new: typing.Any
 
 
 class Minicfg:
@@ -22,41 +65,182 @@ class Minicfg:
     """
     _name_sep: str = _DEFAULT_NAME_SEP
 
+    """
+    Casters inferred from the annotations of the fields defined in the class, by attribute name.
+    """
+    _inferred_casters: dict[str, AbstractCaster | None] = {}
+
+    """
+    String annotations of the fields defined in the class which are not resolved yet, by attribute name.
+    """
+    _unresolved_annotations: dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Infer casters from the annotations of the fields defined in the subclass.
+        String annotations (e.g. when using `from __future__ import annotations`) are resolved lazily,
+        when the class is instantiated for the first time.
+        """
+
+        super().__init_subclass__(**kwargs)
+
+        # lazy child minicfgs are created on first access through a descriptor:
+        for attr_name, value in list(cls.__dict__.items()):
+            if isinstance(value, type) and issubclass(value, Minicfg) and value._is_lazy():
+                setattr(cls, attr_name, _LazyChild(attr_name, value))
+
+        cls._inferred_casters = {}
+        cls._unresolved_annotations = {}
+        for attr_name, annotation in cls.__dict__.get("__annotations__", {}).items():
+            field = cls.__dict__.get(attr_name)
+            if not isinstance(field, Field) or field.caster is not None:
+                # explicitly set casters take precedence over annotations:
+                continue
+
+            if isinstance(annotation, str):
+                cls._unresolved_annotations[attr_name] = annotation
+            else:
+                cls._set_inferred_caster(attr_name, infer_caster(annotation))
+
+    """
+    Fingerprint of the raw values of the instance and its children, computed during population.
+    None value means that the instance is not populated.
+    """
+    _fingerprint: bytes | None = None
+
+    """
+    Raw values used to populate the fields of the instance, by attribute name.
+    """
+    _raw_values: dict[str, str | bytes | None]
+
+    """
+    References of the interpolated raw values resolved during the last population, by field name.
+    """
+    _interpolation_references: dict[str, tuple[str, ...]] = {}
+
+    """
+    Provider used to populate lazy child minicfgs on first access, None if there are none to populate.
+    """
+    _lazy_provider: AbstractProvider | None = None
+
+    """
+    Interner used to populate lazy child minicfgs on first access, None if values are not interned.
+    """
+    _lazy_interner: "Interner | None" = None
+
+    """
+    History of the versions of the instance, None if it is not kept (see enable_history).
+    """
+    _history: "ConfigHistory | None" = None
+
+    """
+    Blob the fields of the minicfg are extracted from, None if the minicfg is not a blob minicfg (see minicfg_blob).
+    """
+    _blob: _Blob | None = None
+
     def __init__(self):
         """
         Initialize the Minicfg instance.
-        Generates names for all fields and initialize child minicfgs.
+        Resolves casters and generates names for all fields (once per class) and initialize child minicfgs.
+        """
+
+        if not self.__class__.__dict__.get("_names_generated", False):
+            self.__class__._resolve_annotations()
+            self.__class__._generate_names()
+
+        # initialize the child minicfgs (lazy ones are initialized on first access):
+        for attr_name, child_minicfg_class in self._iter_minicfg_classes():
+            if not child_minicfg_class._is_lazy():
+                setattr(self, attr_name, child_minicfg_class())
+
+    @classmethod
+    def _get_original_class(cls) -> type["Minicfg"]:
+        """
+        Return the Minicfg class the instance was created as, even if its class has been swapped
+        with a generated subclass (see minicfg.telemetry).
+        """
+
+        # (the generated subclass is marked, the original class is its base class)
+        return cls.__base__ if cls.__dict__.get("_class_swapped", False) else cls
+
+    @classmethod
+    def _is_lazy(cls) -> bool:
+        """
+        Return True if instances of the class are created and populated on first access when used as a child minicfg.
+        """
+
+        return cls.__dict__.get("_lazy", False)
+
+    @classmethod
+    def _set_inferred_caster(cls, attr_name: str, caster: AbstractCaster | None) -> None:
+        """
+        Store the inferred caster and set it to the field.
+        """
+
+        cls._inferred_casters[attr_name] = caster
+        cls.__dict__[attr_name].caster = caster
+
+    @classmethod
+    def _resolve_annotations(cls) -> None:
+        """
+        Resolve string annotations of the fields of the class and of its base classes
+        (whose fields are inherited) and infer casters from them.
+        """
+
+        for minicfg_class in cls.__mro__:
+            if not minicfg_class.__dict__.get("_unresolved_annotations"):
+                continue
+
+            module = sys.modules.get(minicfg_class.__module__)
+            globalns = vars(module) if module else {}
+            for attr_name, annotation in minicfg_class._unresolved_annotations.items():
+                try:
+                    resolved_annotation = eval(annotation, globalns, dict(vars(minicfg_class)))
+                except Exception as e:
+                    raise TypeError(f"cannot resolve annotation {annotation!r} of the field {attr_name}") from e
+                minicfg_class._set_inferred_caster(attr_name, infer_caster(resolved_annotation))
+
+            minicfg_class._unresolved_annotations = {}
+
+    @classmethod
+    def _generate_names(cls) -> None:
+        """
+        Generate names for all fields and prepend the minicfg name to the child minicfg names.
+        Field instances and child minicfg classes are shared by all instances, so names are generated only once.
         """
 
         # add the minicfg name prefix to all field names:
-        for attr_name, field in self._iter_field_instances():
+        for attr_name, field in cls._iter_class_field_instances():
             if field.name is None:
                 # use the attribute name as the field name if field name is not set:
                 field.name = attr_name
 
-            if self._name:
+            if cls._name:
                 # prepend the minicfg name to the field name the minicfg has a name:
-                field.name = f"{self._name}{self._name_sep}{field.name}"
+                field.name = f"{cls._name}{cls._name_sep}{field.name}"
 
             if field.file_field:
                 # update the field's attached file field name:
                 field.file_field.name = f"{field.name}_FILE"
 
-        # initialize the child minicfgs:
-        for attr_name in dir(self.__class__):
-            attr_value = getattr(self.__class__, attr_name)
-            if not (isinstance(attr_value, type) and issubclass(attr_value, Minicfg)):
-                continue
-
-            child_minicfg_class = attr_value
-            if self._name:
+        for _, child_minicfg_class in cls._iter_minicfg_classes():
+            if cls._name:
                 # prepend the minicfg name to the child minicfg name if the minicfg has a name:
                 if child_minicfg_class._name:
-                    child_minicfg_class._name = f"{self._name}{self._name_sep}{child_minicfg_class._name}"
+                    child_minicfg_class._name = f"{cls._name}{cls._name_sep}{child_minicfg_class._name}"
                 else:
-                    child_minicfg_class._name = self._name
+                    child_minicfg_class._name = cls._name
+
+            # names of the whole tree are generated at once, so that they do not depend on when
+            # (or whether) lazy child minicfgs are initialized:
+            if not child_minicfg_class.__dict__.get("_names_generated", False):
+                child_minicfg_class._resolve_annotations()
+                child_minicfg_class._generate_names()
 
-            setattr(self, attr_name, child_minicfg_class())
+        if cls._blob is not None:
+            cls._blob.bind(cls)
+
+        cls._names_generated = True
 
     @classmethod
     def new_populated(cls, provider: AbstractProvider | None = None) -> "Minicfg":
@@ -70,6 +254,92 @@ class Minicfg:
         minicfg.populate(provider)
         return minicfg
 
+    @classmethod
+    def prefetch(cls, provider: AbstractProvider | None = None) -> "PrefetchHandle":
+        """
+        Create an instance of the Minicfg class and start populating it in a background thread.
+        Returns immediately, so that provider lookups and file reads overlap with the rest of the application startup.
+        :param provider: provider used to populate the Minicfg instance.
+        :return: handle of the Minicfg instance being populated.
+        """
+
+        return PrefetchHandle(cls(), provider or _DEFAULT_PROVIDER())
+
+    @classmethod
+    def _get_interpolation_plan(cls) -> InterpolationPlan | None:
+        """
+        Return the interpolation plan of the Minicfg class and its children, built once per class.
+        None value means that no field of the tree is interpolated.
+        """
+
+        if "_interpolation_plan" in cls.__dict__:
+            return cls._interpolation_plan
+
+        interpolated: list[str] = []
+        templates: dict[str, Template] = {}
+        defaults: dict[str, str] = {}
+
+        def collect(minicfg_class: type[Minicfg]) -> None:
+            for _, field in minicfg_class._iter_class_field_instances():
+                if field.interpolate:
+                    interpolated.append(field.name)
+                if field.template is not None:
+                    templates[field.name] = field.template
+                if field.default is not NO_DEFAULT_VALUE and field.default is not None:
+                    defaults[field.name] = str(field.default)
+            for _, child_minicfg_class in minicfg_class._iter_minicfg_classes():
+                collect(child_minicfg_class)
+
+        collect(cls)
+        cls._interpolation_plan = InterpolationPlan(interpolated, templates, defaults) if interpolated else None
+        return cls._interpolation_plan
+
+    def dependents_of(self, names: Iterable[str]) -> set[str]:
+        """
+        Return the names of the interpolated fields whose values depend (directly or transitively) on the given names,
+        e.g. to find the fields to populate again when some of the variables change.
+        :param names: names of the changed fields or variables.
+        """
+
+        plan = self.__class__._get_interpolation_plan()
+        if plan is None:
+            return set()
+        return plan.dependents(names, self._interpolation_references)
+
+    def _interpolating(self, provider: AbstractProvider) -> AbstractProvider:
+        """
+        Wrap the provider with an interpolator if any field of the tree is interpolated.
+        """
+
+        plan = self.__class__._get_interpolation_plan()
+        if plan is None:
+            return provider
+        return Interpolator(provider, plan)
+
+    @classmethod
+    def _get_frozen_class(cls) -> type["FrozenMinicfg"]:
+        """
+        Return the frozen class of the Minicfg class, generated once per class.
+        """
+
+        frozen_class = cls.__dict__.get("_frozen_class")
+        if frozen_class is None:
+            field_names = tuple(attr_name for attr_name, _ in cls._iter_class_field_instances())
+            child_names = tuple(attr_name for attr_name, _ in cls._iter_minicfg_classes())
+            frozen_class = type(
+                f"Frozen{cls.__name__}",
+                (FrozenMinicfg,),
+                {
+                    "__slots__": field_names + child_names + ("_fingerprint",),
+                    "__module__": cls.__module__,
+                    "__qualname__": f"Frozen{cls.__qualname__}",
+                    "_field_names": field_names,
+                    "_child_names": child_names,
+                },
+            )
+            cls._frozen_class = frozen_class
+        return frozen_class
+
     @property
     def name(self):
         """
@@ -77,27 +347,438 @@ class Minicfg:
         """
         return self._name
 
-    def populate(self, provider: AbstractProvider | None = None) -> None:
+    def freeze(self) -> "FrozenMinicfg":
+        """
+        Create an immutable copy of the populated Minicfg instance and its children.
+        The copy is an instance of a class with __slots__ generated once per Minicfg class,
+        so attribute reads are faster and instances take less memory. Lists and dicts are copied into tuples
+        and FrozenDicts (see minicfg.interning), so that the copy cannot be changed through them;
+        other values are not copied.
+        :return: frozen copy of the instance.
+        """
+
+        from .interning import freeze_value
+
+        frozen_class = self.__class__._get_frozen_class()
+        frozen = object.__new__(frozen_class)
+        for attr_name in frozen_class._field_names:
+            value = getattr(self, attr_name)
+            if isinstance(value, Field):
+                raise ValueError(f"{self.__class__.__name__}.{attr_name} is not populated")
+            object.__setattr__(frozen, attr_name, freeze_value(value))
+        for attr_name in frozen_class._child_names:
+            object.__setattr__(frozen, attr_name, getattr(self, attr_name).freeze())
+        object.__setattr__(frozen, "_fingerprint", self._fingerprint)
+        return frozen
+
+    def enable_history(self, max_versions: int = 10) -> "ConfigHistory":
+        """
+        Start keeping the history of the versions of the populated instance: a version is recorded
+        every time the instance is populated successfully. Unchanged subtrees are shared by the versions.
+        :param max_versions: maximum number of versions kept. Older versions are discarded.
+        :return: history of the versions, which can be used to roll back or to compare versions.
+        """
+
+        from .history import ConfigHistory
+
+        if self._history is None:
+            self._history = ConfigHistory(self, max_versions)
+        return self._history
+
+    @property
+    def history(self) -> "ConfigHistory | None":
+        """
+        History of the versions of the instance, None if it is not kept (see enable_history).
+        """
+
+        return self._history
+
+    def populate(
+        self,
+        provider: AbstractProvider | None = None,
+        collect_errors: bool = False,
+        only: Iterable[str] | None = None,
+        interner: "Interner | None" = None,
+    ) -> None:
         """
         Populate the Minicfg instance using the given provider.
         All fields and child Minicfg instances will be populated recursively.
 
         :param provider: provider used to populate the Minicfg instance. If not provided, the default _DEFAULT_PROVIDER will be used.
+        :param collect_errors: if set, population continues after a field fails and a single PopulationError
+            listing all failed fields is raised at the end.
+        :param only: if set, only the given fields and child minicfgs of the populated instance are populated again,
+            by attribute paths (e.g. ["Database", "ExternalAPI.KEY"]). Interpolated fields depending on them
+            are populated too, and fingerprints are updated along the paths.
+            Populating a child instance directly (e.g. config.Database.populate(provider)) does not update
+            its parents: their fingerprints, history and interpolated fields are left as they were,
+            so subtrees of a populated instance should be populated again with only instead.
+        :param interner: if set, values and raw values are deduplicated with the values of other instances
+            populated with the same interner (see minicfg.interning).
         """
 
         if not provider:
             provider = _DEFAULT_PROVIDER()
 
+        errors: list[Exception] | None = [] if collect_errors else None
+        try:
+            if only is None:
+                self._populate(self._interpolating(provider), errors, interner=interner)
+            else:
+                self._populate_targets(self._interpolating(provider), errors, self._resolve_targets(only), interner)
+        except BaseException:
+            if self._history is not None:
+                self._history.invalidate()
+            raise
+
+        if errors:
+            if self._history is not None:
+                self._history.invalidate()
+            raise PopulationError(errors)
+        if self._history is not None:
+            self._history.record()
+
+    def _populate(
+        self,
+        provider: AbstractProvider,
+        errors: list[Exception] | None,
+        on_field_populated: typing.Callable[[str], None] | None = None,
+        interner: "Interner | None" = None,
+    ) -> None:
+        """
+        Populate the Minicfg instance and its children recursively.
+        :param provider: provider used to populate the Minicfg instance.
+        :param errors: list to append field errors to. If None, errors are raised immediately.
+        :param on_field_populated: function called with the attribute name of each populated field of the instance.
+        :param interner: interner used to deduplicate values and raw values, if any.
+        """
+
+        if self._blob is not None:
+            provider = self._blob_provider(provider, errors)
+            if provider is None:
+                return
+
+        raw_values: dict[str, str | bytes | None] = {}
+
         # populate all fields:
         for attr_name, field in self._iter_field_instances():
-            field.populate(provider)
-            setattr(
-                self, attr_name, field.value
-            )  #  replace the field attribute with the populated value. Original Field instances will be accessible only in self.__class__
+            if self._populate_field(attr_name, field, provider, errors, raw_values, interner) and on_field_populated:
+                on_field_populated(attr_name)
 
         # populate all child minicfgs:
-        for child_minicfg in self._iter_minicfg_instances():
-            child_minicfg.populate(provider)
+        lazy_provider: AbstractProvider | None = None
+        for attr_name, child_minicfg_class in self._iter_minicfg_classes():
+            if not child_minicfg_class._is_lazy():
+                child_minicfg: Minicfg = getattr(self, attr_name)
+                child_minicfg._populate(provider, errors, interner=interner)
+            elif attr_name in self.__dict__:
+                # the lazy child minicfg is already in use, so it is populated right away:
+                self.__dict__[attr_name]._populate(provider, errors, interner=interner)
+            else:
+                lazy_provider = provider
+
+        self._lazy_provider = lazy_provider
+        self._lazy_interner = interner if lazy_provider is not None else None
+        self._raw_values = raw_values
+        self._fingerprint = self._compute_fingerprint()
+        if isinstance(provider, Interpolator):
+            self._interpolation_references = provider.references
+
+    def _populate_field(
+        self,
+        attr_name: str,
+        field: Field,
+        provider: AbstractProvider,
+        errors: list[Exception] | None,
+        raw_values: dict[str, str | bytes | None],
+        interner: "Interner | None" = None,
+    ) -> bool:
+        """
+        Populate the field and store its value and raw value (deduplicated by the interner, if any).
+        :return: True if the field has been populated, False if its error has been collected.
+        """
+
+        try:
+            field.populate(provider)
+        except (CastingError, DecodingError, FieldValueNotProvidedError, InterpolationError, ValidationError) as e:
+            if errors is None:
+                raise
+            errors.append(e)
+            return False
+
+        value, raw_value = field.value, field.raw_value
+        if interner is not None:
+            value, raw_value = interner.intern(value), interner.intern(raw_value)
+
+        setattr(
+            self, attr_name, value
+        )  #  replace the field attribute with the populated value. Original Field instances will be accessible only in self.__class__
+        raw_values[attr_name] = raw_value
+        return True
+
+    def _populate_targets(
+        self,
+        provider: AbstractProvider,
+        errors: list[Exception] | None,
+        targets: dict[str, typing.Any],
+        interner: "Interner | None" = None,
+    ) -> None:
+        """
+        Populate the targeted fields and child minicfgs of the populated instance (see _resolve_targets),
+        and update the fingerprint.
+        """
+
+        if self._fingerprint is None:
+            raise ValueError(f"{self.__class__.__name__} is not populated, so it cannot be populated partially")
+        if self._blob is not None:
+            provider = self._blob_provider(provider, errors)
+            if provider is None:
+                return
+
+        raw_values = dict(self._raw_values)
+        for attr_name, field in self._iter_field_instances():
+            if attr_name in targets:
+                raw_values.pop(attr_name, None)
+                self._populate_field(attr_name, field, provider, errors, raw_values, interner)
+
+        for attr_name, child_minicfg_class in self._iter_minicfg_classes():
+            if attr_name not in targets:
+                continue
+            if child_minicfg_class._is_lazy() and attr_name not in self.__dict__:
+                # the lazy child minicfg will be populated on first access, from the new provider:
+                self._lazy_provider = provider
+                self._lazy_interner = interner
+                continue
+
+            child_minicfg: Minicfg = getattr(self, attr_name)
+            if targets[attr_name] is None:
+                child_minicfg._populate(provider, errors, interner=interner)
+            else:
+                child_minicfg._populate_targets(provider, errors, targets[attr_name], interner)
+
+        self._raw_values = raw_values
+        self._fingerprint = self._compute_fingerprint()
+        if isinstance(provider, Interpolator):
+            self._interpolation_references = {**self._interpolation_references, **provider.references}
+
+    def _blob_provider(self, provider: AbstractProvider, errors: list[Exception] | None) -> AbstractProvider | None:
+        """
+        Return the provider of the values of the blob of the blob minicfg, parsing the blob if it has changed.
+        :return: provider of the values of the blob, None if the blob is invalid and its error has been collected.
+        """
+
+        try:
+            return self._blob.provider(provider)
+        except (CastingError, DecodingError) as e:
+            if errors is None:
+                raise
+            errors.append(e)
+            return None
+
+    def _resolve_targets(self, paths: Iterable[str]) -> dict[str, typing.Any]:
+        """
+        Resolve attribute paths of fields and child minicfgs into a tree of targets: attribute name -> None
+        if the field or child minicfg is targeted as a whole, or the targets of the child minicfg.
+        Interpolated fields depending on the targeted fields are targeted too.
+        """
+
+        targets: dict[str, typing.Any] = {}
+        field_names: list[str] = []
+        for path in paths:
+            field_names += self.__class__._add_target(targets, path)
+
+        plan = self.__class__._get_interpolation_plan()
+        if plan is not None:
+            field_paths = self.__class__._get_field_paths()
+            for name in plan.dependents(field_names, self._interpolation_references):
+                self.__class__._add_target(targets, field_paths[name])
+        return targets
+
+    @classmethod
+    def _add_target(cls, targets: dict[str, typing.Any], path: str) -> list[str]:
+        """
+        Add the attribute path to the tree of targets.
+        :return: names of the targeted fields.
+        """
+
+        *child_attr_names, attr_name = path.split(".")
+        minicfg_class = cls
+        for child_attr_name in child_attr_names:
+            child_minicfg_class = dict(minicfg_class._get_members()[1]).get(child_attr_name)
+            if child_minicfg_class is None:
+                raise ValueError(f"{path}: {minicfg_class.__name__} has no child minicfg {child_attr_name}")
+            if child_attr_name in targets and targets[child_attr_name] is None:
+                # the whole child minicfg is already targeted
+                return []
+            targets = targets.setdefault(child_attr_name, {})
+            minicfg_class = child_minicfg_class
+
+        fields, children = (dict(members) for members in minicfg_class._get_members())
+        if attr_name in fields:
+            targets[attr_name] = None
+            return [fields[attr_name].name]
+        if attr_name in children:
+            targets[attr_name] = None
+            return list(children[attr_name]._get_field_paths())
+        raise ValueError(f"{path}: {minicfg_class.__name__} has no field or child minicfg {attr_name}")
+
+    @classmethod
+    def _get_field_paths(cls) -> dict[str, str]:
+        """
+        Return the attribute paths of the fields of the class and its children by field name, collected once per class.
+        """
+
+        field_paths = cls.__dict__.get("_field_paths")
+        if field_paths is None:
+            field_paths = {field.name: attr_name for attr_name, field in cls._iter_class_field_instances()}
+            for attr_name, child_minicfg_class in cls._iter_minicfg_classes():
+                for name, path in child_minicfg_class._get_field_paths().items():
+                    field_paths[name] = f"{attr_name}.{path}"
+            cls._field_paths = field_paths
+        return field_paths
+
+    def _compute_fingerprint(self) -> bytes:
+        """
+        Compute the fingerprint of the populated fields and the (non-lazy) child minicfgs of the instance.
+        """
+
+        hasher = hashlib.blake2b(digest_size=_FINGERPRINT_SIZE)
+        for attr_name, _ in self._iter_field_instances():
+            if attr_name in self._raw_values:
+                _update_fingerprint(hasher, attr_name, self._raw_values[attr_name])
+        for attr_name, child_minicfg_class in self._iter_minicfg_classes():
+            if not child_minicfg_class._is_lazy():
+                _update_fingerprint(hasher, attr_name, getattr(self, attr_name)._fingerprint)
+        return hasher.digest()
+
+    @property
+    def fingerprint(self) -> bytes | None:
+        """
+        Fingerprint of the raw values of the instance and its children (None if the instance is not populated).
+        Fingerprints are computed per subtree, so equal fingerprints of two instances mean equal subtrees
+        (lazy child minicfgs aside, they are not covered by fingerprints).
+        """
+
+        return self._fingerprint
+
+    def diff(self, other: "Minicfg") -> list[FieldChange]:
+        """
+        Compare the instance with another populated instance of the same class.
+        Only subtrees with different fingerprints are compared.
+        :param other: populated instance to compare with, considered to be the newer one.
+        :return: list of changed fields with old (self) and new (other) values. Values of secret fields are masked.
+        """
+
+        if self._get_original_class() is not other._get_original_class():
+            raise TypeError(f"cannot compare {self.__class__.__name__} with {other.__class__.__name__}")
+        if self._fingerprint is None or other._fingerprint is None:
+            raise ValueError("only populated instances can be compared")
+
+        changes: list[FieldChange] = []
+        self._diff(other, changes)
+        return changes
+
+    def _diff(self, other: "Minicfg", changes: list[FieldChange]) -> None:
+        if self._fingerprint == other._fingerprint:
+            # equal fingerprints do not cover the lazy child minicfgs of the subtree:
+            self._diff_lazy_children(other, changes)
+            return
+
+        for attr_name, field in self._iter_field_instances():
+            if self._raw_values.get(attr_name) == other._raw_values.get(attr_name):
+                continue
+
+            if field.secret:
+                changes.append(FieldChange(name=field.name, old=_SECRET_MASK, new=_SECRET_MASK))
+            else:
+                changes.append(
+                    FieldChange(name=field.name, old=getattr(self, attr_name), new=getattr(other, attr_name))
+                )
+
+        for attr_name, child_minicfg_class in self._iter_minicfg_classes():
+            if child_minicfg_class._is_lazy():
+                pair = self._get_populated_lazy_children(other, attr_name)
+                if pair is not None:
+                    pair[0]._diff(pair[1], changes)
+            else:
+                getattr(self, attr_name)._diff(getattr(other, attr_name), changes)
+
+    def _diff_lazy_children(self, other: "Minicfg", changes: list[FieldChange]) -> None:
+        """
+        Compare the lazy child minicfgs of the subtree that are populated in both instances.
+        Lazy child minicfgs are not covered by fingerprints, so they are compared separately.
+        """
+
+        if not self.__class__._has_lazy_descendants():
+            return
+        for attr_name, child_minicfg_class in self._iter_minicfg_classes():
+            if child_minicfg_class._is_lazy():
+                pair = self._get_populated_lazy_children(other, attr_name)
+                if pair is not None:
+                    pair[0]._diff(pair[1], changes)
+            else:
+                getattr(self, attr_name)._diff_lazy_children(getattr(other, attr_name), changes)
+
+    def _lazy_children_equal(self, other: "Minicfg") -> bool:
+        """
+        Check whether the lazy child minicfgs of the subtree that are populated in both instances are equal.
+        """
+
+        if not self.__class__._has_lazy_descendants():
+            return True
+        for attr_name, child_minicfg_class in self._iter_minicfg_classes():
+            if child_minicfg_class._is_lazy():
+                pair = self._get_populated_lazy_children(other, attr_name)
+                if pair is not None and pair[0] != pair[1]:
+                    return False
+            elif not getattr(self, attr_name)._lazy_children_equal(getattr(other, attr_name)):
+                return False
+        return True
+
+    def _get_populated_lazy_children(self, other: "Minicfg", attr_name: str) -> tuple["Minicfg", "Minicfg"] | None:
+        """
+        Return the lazy child minicfgs of both instances if they have been created and populated in both,
+        without creating them.
+        """
+
+        child = self.__dict__.get(attr_name)
+        other_child = other.__dict__.get(attr_name)
+        if child is None or other_child is None or child._fingerprint is None or other_child._fingerprint is None:
+            return None
+        return child, other_child
+
+    @classmethod
+    def _has_lazy_descendants(cls) -> bool:
+        """
+        Check whether the class has lazy child minicfgs recursively, once per class.
+        """
+
+        has_lazy = cls.__dict__.get("_lazy_descendants")
+        if has_lazy is None:
+            has_lazy = any(
+                child_minicfg_class._is_lazy() or child_minicfg_class._has_lazy_descendants()
+                for _, child_minicfg_class in cls._iter_minicfg_classes()
+            )
+            cls._lazy_descendants = has_lazy
+        return has_lazy
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Populated instances of the same class are equal if their fingerprints are equal
+        and their lazy child minicfgs populated in both instances are equal.
+        """
+
+        if not isinstance(other, Minicfg) or self._get_original_class() is not other._get_original_class():
+            return NotImplemented
+        if self._fingerprint is None or other._fingerprint is None:
+            return self is other
+        return self._fingerprint == other._fingerprint and self._lazy_children_equal(other)
+
+    def __hash__(self) -> int:
+        # note: the hash of an instance changes when it is populated again with different values
+        if self._fingerprint is None:
+            return id(self)
+        return hash((self._get_original_class(), self._fingerprint))
 
     def _iter_field_instances(self) -> typing.Generator[typing.Tuple[str, Field], None, None]:
         """
@@ -105,10 +786,44 @@ class Minicfg:
         """
 
         # (using self.__class__ to access the original Field instances even if minicfg is populated)
-        for attr_name in dir(self.__class__):
-            attr_value = getattr(self.__class__, attr_name)
-            if isinstance(attr_value, Field):
-                yield attr_name, attr_value
+        return self.__class__._iter_class_field_instances()
+
+    @classmethod
+    def _iter_class_field_instances(cls) -> typing.Generator[typing.Tuple[str, Field], None, None]:
+        """
+        Iterate over all field instances of the class.
+        """
+
+        yield from cls._get_members()[0]
+
+    @classmethod
+    def _iter_minicfg_classes(cls) -> typing.Generator[typing.Tuple[str, typing.Type["Minicfg"]], None, None]:
+        """
+        Iterate over all child minicfg classes.
+        """
+
+        yield from cls._get_members()[1]
+
+    @classmethod
+    def _get_members(cls) -> tuple[tuple[tuple[str, Field], ...], tuple[tuple[str, type["Minicfg"]], ...]]:
+        """
+        Return the fields and the child minicfg classes of the class with their attribute names,
+        collected once per class (walking dir() on every initialization and population is expensive).
+        """
+
+        members = cls.__dict__.get("_members")
+        if members is None:
+            fields: list[tuple[str, Field]] = []
+            children: list[tuple[str, type[Minicfg]]] = []
+            for attr_name in dir(cls):
+                attr_value = getattr(cls, attr_name)
+                if isinstance(attr_value, Field):
+                    fields.append((attr_name, attr_value))
+                elif isinstance(attr_value, type) and issubclass(attr_value, Minicfg):
+                    children.append((attr_name, attr_value))
+            members = (tuple(fields), tuple(children))
+            cls._members = members
+        return members
 
     def _iter_minicfg_instances(self) -> typing.Generator["Minicfg", None, None]:
         """
@@ -130,6 +845,173 @@ class Minicfg:
             yield minicfg
 
 
+def _update_fingerprint(hasher: "hashlib._Hash", name: str, value: str | bytes | None) -> None:
+    """
+    Update the fingerprint with the name and the (length-prefixed) raw value.
+    """
+
+    if value is None:
+        hasher.update(name.encode() + b"\x00")
+        return
+
+    data = value.encode("utf-8", "surrogatepass") if isinstance(value, str) else value
+    header = b"".join((name.encode(), b"\x01", len(data).to_bytes(8, "little")))
+    if len(data) > _FINGERPRINT_JOIN_LIMIT:
+        # large values (e.g. decoded blobs) are not copied
+        hasher.update(header)
+        hasher.update(data)
+    else:
+        # (hashed at once, which is cheaper than many small updates)
+        hasher.update(header + data)
+
+
+class PrefetchHandle:
+    """
+    Handle of a Minicfg instance being populated in a background thread (see Minicfg.prefetch).
+
+    Attribute access on the handle blocks until the requested value is ready: fields of the root minicfg
+    are available as soon as they are populated, child minicfgs once the whole tree is populated.
+    """
+
+    _config: Minicfg
+    _field_names: frozenset[str]  # attribute names of the fields of the root minicfg
+    _populated_field_names: set[str]
+    _condition: threading.Condition
+    _done: bool
+    _error: BaseException | None
+
+    def __init__(self, config: Minicfg, provider: AbstractProvider):
+        """
+        Initialize the handle and start populating the Minicfg instance.
+        :param config: Minicfg instance to populate.
+        :param provider: provider used to populate the Minicfg instance.
+        """
+
+        self._config = config
+        self._field_names = frozenset(attr_name for attr_name, _ in config._iter_field_instances())
+        self._populated_field_names = set()
+        self._condition = threading.Condition()
+        self._done = False
+        self._error = None
+
+        threading.Thread(
+            target=self._run, args=(provider,), name=f"minicfg-prefetch-{config.__class__.__name__}", daemon=True
+        ).start()
+
+    def _run(self, provider: AbstractProvider) -> None:
+        try:
+            self._config._populate(
+                self._config._interpolating(provider), None, on_field_populated=self._on_field_populated
+            )
+        except BaseException as e:
+            self._error = e
+        finally:
+            with self._condition:
+                self._done = True
+                self._condition.notify_all()
+
+    def _on_field_populated(self, attr_name: str) -> None:
+        with self._condition:
+            self._populated_field_names.add(attr_name)
+            self._condition.notify_all()
+
+    def done(self) -> bool:
+        """
+        Return True if the population has finished (successfully or not).
+        """
+
+        return self._done
+
+    def result(self, timeout: float | None = None) -> Minicfg:
+        """
+        Wait until the whole tree is populated.
+        :param timeout: maximum time to wait in seconds. Wait forever if not set.
+        :return: populated Minicfg instance.
+        :raises TimeoutError: if the population has not finished in time.
+        :raises Exception: the error raised during the population, if any.
+        """
+
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._done, timeout):
+                raise TimeoutError(f"{self._config.__class__.__name__} was not populated in time")
+
+        if self._error is not None:
+            raise self._error
+        return self._config
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name not in self._field_names:
+            return getattr(self.result(), name)
+
+        with self._condition:
+            self._condition.wait_for(lambda: name in self._populated_field_names or self._done)
+
+        if name not in self._populated_field_names:
+            # the population has failed before the field was populated:
+            self.result()
+        return getattr(self._config, name)
+
+
+class FrozenMinicfg:
+    """
+    Base class for immutable copies of populated Minicfg instances (see Minicfg.freeze).
+    Subclasses are generated once per Minicfg class, with a slot for each field and child minicfg.
+    """
+
+    __slots__ = ()
+
+    _field_names: tuple[str, ...] = ()  # attribute names of the fields
+    _child_names: tuple[str, ...] = ()  # attribute names of the child minicfgs
+
+    @property
+    def fingerprint(self) -> bytes | None:
+        """
+        Fingerprint of the Minicfg instance the copy was created from (see Minicfg.fingerprint).
+        """
+
+        return self._fingerprint
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Frozen copies of the same class are equal if their fingerprints are equal.
+        """
+
+        if not isinstance(other, FrozenMinicfg) or self.__class__ is not other.__class__:
+            return NotImplemented
+        return self._fingerprint == other._fingerprint
+
+    def __hash__(self) -> int:
+        return hash((self.__class__, self._fingerprint))
+
+
+class _LazyChild:
+    """
+    Descriptor creating a lazy child minicfg on first access (see minicfg_lazy).
+    The instance is stored in the instance __dict__, which takes precedence over the descriptor afterwards.
+    """
+
+    def __init__(self, attr_name: str, minicfg_class: type[Minicfg]):
+        self._attr_name = attr_name
+        self._minicfg_class = minicfg_class
+
+    def __get__(self, instance: Minicfg | None, owner: type[Minicfg]) -> typing.Any:
+        if instance is None:
+            # class attribute access returns the child minicfg class, as for eager child minicfgs:
+            return self._minicfg_class
+
+        child_minicfg = self._minicfg_class()
+        if instance._lazy_provider is not None:
+            child_minicfg._populate(instance._lazy_provider, None, interner=instance._lazy_interner)
+        # the child minicfg may have been created by another thread meanwhile:
+        return instance.__dict__.setdefault(self._attr_name, child_minicfg)
+
+
 def minicfg_name(name: str):
     """
     Decorator used to set the name of the mincfg.
@@ -154,3 +1036,45 @@ def minicfg_name_sep(sep: str):
         return cls
 
     return decorator
+
+
+def minicfg_lazy(cls: type[Minicfg]) -> type[Minicfg]:
+    """
+    Decorator used to make the child minicfg lazy: it is created and populated on first access
+    (with the provider of the last population of its parent) instead of together with its parent,
+    so that processes do not pay for sections they never use. Errors are raised on first access.
+    Lazy child minicfgs are not covered by the fingerprint (and equality and diff) of their parent.
+    """
+
+    cls._lazy = True
+    return cls
+
+
+def minicfg_blob(
+    format: str = "json",
+    pointers: Mapping[str, str] | None = None,
+    attach_file_field: bool = False,
+    decoders: Iterable["AbstractDecoder"] | None = None,
+):
+    """
+    Decorator used to extract the fields of the minicfg from a single JSON or TOML blob (see minicfg.blob).
+    The blob is provided under the name of the minicfg (e.g. "SERVICE_CONFIG_JSON"), which is required,
+    and is parsed once per population (and not again while it does not change). A missing blob provides no values.
+    Blob minicfgs cannot have child minicfgs.
+    :param format: format of the blob, "json" or "toml" (which requires Python 3.11+ or the tomli package).
+    :param pointers: JSON pointers of the values of the fields in the blob (e.g. {"PORT": "/server/port"}),
+        by attribute name. Fields without a pointer are mapped onto their lowercase attribute name (e.g. "/port").
+        Arrays of scalars mapped onto fields cast with ListCaster are joined with its separator,
+        other arrays and objects are passed to the fields as JSON.
+    :param attach_file_field: indicates whether a file field (e.g. "SERVICE_CONFIG_JSON_FILE") should be attached
+        to the blob, used when the blob is not provided.
+    :param decoders: decoders applied to the raw blob (see minicfg.decoding).
+    """
+
+    blob = _Blob(format, pointers or {}, attach_file_field, decoders)
+
+    def decorator(cls: type[Minicfg]) -> type[Minicfg]:
+        cls._blob = blob
+        return cls
+
+    return decorator
@@ -1,5 +1,20 @@
+import contextlib
+import dataclasses
 import os
+import threading
+import time
+import typing
+import urllib.parse
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Mapping
+
+if typing.TYPE_CHECKING:
+    import asyncio
+    import http.client
+    import sqlite3
+
+_KUBERNETES_DATA_DIR = "..data"  # symlink atomically swapped by kubernetes when a mounted volume is updated
+_SQLITE_MAX_PARAMETERS = 500  # keys looked up by one query, below the limit of bound parameters of old SQLite versions
 
 
 class AbstractProvider(ABC):
@@ -16,6 +31,21 @@ class AbstractProvider(ABC):
         """
         pass
 
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """
+        Get the values for all the given keys at once.
+        Providers able to read many keys in one go (or from one consistent state) should override this method.
+        :param keys: keys to get the values for.
+        :return: mapping of the found keys to their values.
+        """
+
+        result: dict[str, str] = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                result[key] = value
+        return result
+
 
 class EnvProvider(AbstractProvider):
     """
@@ -24,3 +54,858 @@ class EnvProvider(AbstractProvider):
 
     def get(self, key: str) -> str | None:
         return os.getenv(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        # copy the environment once, so that all values are read from the same state:
+        environ = os.environ.copy()
+        return {key: environ[key] for key in keys if key in environ}
+
+
+class DictProvider(AbstractProvider):
+    """
+    A provider that reads values from a mapping (e.g. a parsed dotenv file or a copy of os.environ).
+    """
+
+    def __init__(self, data: Mapping[str, str]):
+        """
+        Initialize the dict provider.
+        :param data: mapping of keys to raw values.
+        """
+
+        self._data = data
+
+    @property
+    def data(self) -> Mapping[str, str]:
+        """
+        Return the underlying mapping.
+        """
+
+        return self._data
+
+    def get(self, key: str) -> str | None:
+        return self._data.get(key)
+
+
+class DirectoryProvider(AbstractProvider):
+    """
+    A provider that reads values from a directory containing one file per key,
+    e.g. docker secrets (/run/secrets) or kubernetes ConfigMap and Secret volumes.
+
+    The directory is indexed once, files are read lazily (with leading and trailing whitespaces removed)
+    and cached until the directory changes.
+    """
+
+    _path: str
+    _name_mapper: Callable[[str], str] | None
+    _index: dict[str, str]  # key -> path to the file
+    _cache: dict[str, str]  # key -> value read from the file
+    _version: str | int | None  # target of the kubernetes ..data symlink or modification time of the directory
+
+    def __init__(self, path: str, name_mapper: Callable[[str], str] | None = None):
+        """
+        Initialize the directory provider.
+        :param path: path to the directory.
+        :param name_mapper: function used to map file names onto keys (e.g. `lambda name: name.upper()`).
+            If not set, file names are used as keys.
+        """
+
+        self._path = path
+        self._name_mapper = name_mapper
+        self._index = {}
+        self._cache = {}
+        self._version = None
+
+        self._load_index()
+
+    def get(self, key: str) -> str | None:
+        value = self._cache.get(key)
+        if value is not None:
+            return value
+
+        path = self._index.get(key)
+        if path is None:
+            return None
+
+        with open(path, "r") as file:
+            value = file.read().strip()
+        self._cache[key] = value
+        return value
+
+    def refresh(self) -> bool:
+        """
+        Re-index the directory if it has changed since it was indexed.
+        For kubernetes volumes, a change is detected by the atomic swap of the ..data symlink,
+        otherwise by the modification time of the directory (files added, removed or replaced).
+        :return: True if the directory has changed, False otherwise.
+        """
+
+        if self._read_version() == self._version:
+            return False
+
+        self._load_index()
+        return True
+
+    def _read_version(self) -> str | int:
+        """
+        Read the current version of the directory.
+        """
+
+        try:
+            return os.readlink(os.path.join(self._path, _KUBERNETES_DATA_DIR))
+        except OSError:
+            return os.stat(self._path).st_mtime_ns
+
+    def _load_index(self) -> None:
+        """
+        Index the directory and drop the cached values.
+        """
+
+        self._version = self._read_version()
+
+        index: dict[str, str] = {}
+        with os.scandir(self._path) as entries:
+            for entry in entries:
+                # skip hidden files, including kubernetes ..data and timestamped directories:
+                if entry.name.startswith(".") or not entry.is_file():
+                    continue
+
+                key = self._name_mapper(entry.name) if self._name_mapper else entry.name
+                index[key] = entry.path
+
+        self._index = index
+        self._cache = {}
+
+
+class _InFlightLookup:
+    """
+    Lookup of a key completed by another thread (see CoalescingProvider and ResilientProvider).
+    """
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: str | None = None
+        self.error: BaseException | None = None
+
+
+class CoalescingProvider(AbstractProvider):
+    """
+    A provider wrapper that coalesces concurrent lookups of the same key (singleflight):
+    while a lookup of a key is in flight, other callers asking for the same key wait for its result
+    instead of calling the wrapped provider again. Values are not cached once the lookup has completed.
+
+    Both threads (get) and asyncio tasks (get_async) are supported and share in-flight lookups.
+    """
+
+    _provider: AbstractProvider
+    _lock: threading.Lock
+    _in_flight: dict[str, _InFlightLookup]
+    _tasks: dict[tuple["asyncio.AbstractEventLoop", str], "asyncio.Task[str | None]"]
+
+    def __init__(self, provider: AbstractProvider):
+        """
+        Initialize the coalescing provider.
+        :param provider: provider to coalesce lookups to.
+        """
+
+        self._provider = provider
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._tasks = {}
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            lookup = self._in_flight.get(key)
+            is_leader = lookup is None
+            if is_leader:
+                lookup = self._in_flight[key] = _InFlightLookup()
+
+        if not is_leader:
+            lookup.done.wait()
+            if lookup.error is not None:
+                raise lookup.error
+            return lookup.value
+
+        try:
+            lookup.value = self._provider.get(key)
+        except BaseException as e:
+            lookup.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            lookup.done.set()
+
+        return lookup.value
+
+    async def get_async(self, key: str) -> str | None:
+        """
+        Get the value for the given key without blocking the event loop.
+        The wrapped provider is called in a worker thread, concurrent tasks asking for the same key share the call.
+        :param key: key to get the value for.
+        :return: value for the given key or None if the key is not found.
+        """
+
+        import asyncio  # imported lazily, as importing asyncio noticeably slows down the startup
+
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = self._tasks[task_key] = loop.create_task(asyncio.to_thread(self.get, key))
+                task.add_done_callback(lambda _: self._forget_task(task_key))
+
+        # shield the shared task, so that cancelling one caller does not cancel the others:
+        return await asyncio.shield(task)
+
+    def _forget_task(self, task_key: tuple["asyncio.AbstractEventLoop", str]) -> None:
+        with self._lock:
+            self._tasks.pop(task_key, None)
+
+
+class HTTPProviderError(Exception):
+    """
+    Exception raised when the key/value HTTP API responds with an unexpected status.
+    """
+
+    def __init__(self, url: str, status: int, reason: str):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        super().__init__(f"{url} responded with {status} {reason}")
+
+
+class HTTPProvider(AbstractProvider):
+    """
+    A provider that reads values from a Consul-style key/value HTTP API
+    (`GET <url><prefix>?recurse=true` returning a JSON list of {"Key": ..., "Value": <base64>} entries).
+
+    All keys under the prefix are fetched in one request on the first lookup and served from memory
+    until the provider is refreshed. Connections are kept alive and reused. Refreshes are conditional
+    (If-None-Match with the last ETag, blocking queries with the last X-Consul-Index),
+    so they cost a 304 or an empty blocking query response when nothing has changed.
+    """
+
+    _url: urllib.parse.SplitResult
+    _prefix: str
+    _headers: dict[str, str]
+    _timeout: float
+    _pool_size: int
+    _pool: list["http.client.HTTPConnection"]  # idle keep-alive connections
+    _pool_lock: threading.Lock
+    _fetch_lock: threading.Lock  # serializes fetches of the prefix
+    _data: dict[str, str] | None  # key (without the prefix) -> value, None until the prefix is fetched
+    _etag: str | None
+    _index: str | None  # X-Consul-Index of the last response
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str = "",
+        headers: Mapping[str, str] | None = None,
+        timeout: float = 5.0,
+        pool_size: int = 4,
+    ):
+        """
+        Initialize the HTTP provider. Nothing is fetched until the first lookup.
+        :param url: URL of the key/value endpoint (e.g. "http://127.0.0.1:8500/v1/kv/").
+        :param prefix: prefix of the keys to fetch (e.g. "service/"). The prefix is stripped from the keys.
+        :param headers: additional request headers (e.g. {"X-Consul-Token": token}).
+        :param timeout: timeout of a request in seconds.
+        :param pool_size: maximum number of idle connections kept alive.
+        """
+
+        self._url = urllib.parse.urlsplit(url)
+        if self._url.scheme not in ("http", "https"):
+            raise ValueError(f"unsupported URL scheme {self._url.scheme!r}")
+
+        self._prefix = prefix
+        self._headers = dict(headers or {})
+        self._timeout = timeout
+        self._pool_size = pool_size
+        self._pool = []
+        self._pool_lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._data = None
+        self._etag = None
+        self._index = None
+
+    def get(self, key: str) -> str | None:
+        data = self._data
+        if data is None:
+            with self._fetch_lock:
+                # the prefix may have been fetched by another thread meanwhile:
+                if self._data is None:
+                    self._fetch(wait=None)
+                data = self._data
+        return data.get(key)
+
+    def refresh(self, wait: float | None = None) -> bool:
+        """
+        Fetch the prefix again if it has changed since it was fetched.
+        :param wait: if set, make a blocking query (long polling) which returns as soon as the prefix changes,
+            or after the given number of seconds if it does not.
+        :return: True if any value has changed, False otherwise.
+        """
+
+        with self._fetch_lock:
+            return self._fetch(wait)
+
+    def close(self) -> None:
+        """
+        Close all idle connections.
+        """
+
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        for connection in pool:
+            connection.close()
+
+    def _fetch(self, wait: float | None) -> bool:
+        """
+        Fetch the prefix and replace the values if they have changed.
+        """
+
+        query = {"recurse": "true"}
+        headers = dict(self._headers)
+        if self._data is not None:
+            if self._etag is not None:
+                headers["If-None-Match"] = self._etag
+            if wait is not None and self._index is not None:
+                query["index"] = self._index
+                query["wait"] = f"{wait:g}s"
+
+        path = f"{self._url.path}{urllib.parse.quote(self._prefix)}?{urllib.parse.urlencode(query)}"
+        status, reason, response_headers, body = self._request(path, headers, self._timeout + (wait or 0))
+        if status == 304:
+            return False
+
+        index = response_headers.get("X-Consul-Index")
+        if self._data is not None and index is not None and index == self._index:
+            # the blocking query has timed out without any change:
+            return False
+
+        if status == 200:
+            data = self._parse(body)
+        elif status == 404:
+            # no keys under the prefix:
+            data = {}
+        else:
+            raise HTTPProviderError(self._url.geturl(), status, reason)
+
+        self._etag = response_headers.get("ETag")
+        self._index = index
+        changed = data != self._data
+        self._data = data
+        return changed
+
+    def _parse(self, body: bytes) -> dict[str, str]:
+        """
+        Parse the list of entries, skipping entries without values (e.g. folders) and keys outside of the prefix.
+        """
+
+        import base64
+        import json
+
+        data: dict[str, str] = {}
+        for entry in json.loads(body):
+            key: str = entry["Key"]
+            value: str | None = entry.get("Value")
+            if value is None or not key.startswith(self._prefix):
+                continue
+            data[key[len(self._prefix) :]] = base64.b64decode(value).decode()
+        return data
+
+    def _request(self, path: str, headers: dict[str, str], timeout: float) -> tuple[int, str, Mapping[str, str], bytes]:
+        """
+        Make a GET request using an idle connection from the pool (or a new one).
+        A request failing on a reused connection (closed by the server while idle) is retried once on a new connection.
+        """
+
+        import http.client
+
+        with self._pool_lock:
+            connection = self._pool.pop() if self._pool else None
+
+        while True:
+            reused = connection is not None
+            if connection is None:
+                connection_class = (
+                    http.client.HTTPSConnection if self._url.scheme == "https" else http.client.HTTPConnection
+                )
+                connection = connection_class(self._url.hostname, self._url.port, timeout=timeout)
+            else:
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, ConnectionError):
+                connection.close()
+                if not reused:
+                    raise
+                connection = None
+                continue
+            except BaseException:
+                connection.close()
+                raise
+            break
+
+        if response.will_close:
+            connection.close()
+        else:
+            with self._pool_lock:
+                if len(self._pool) < self._pool_size:
+                    self._pool.append(connection)
+                    connection = None
+            if connection is not None:
+                connection.close()
+
+        return response.status, response.reason, response.headers, body
+
+
+class SQLiteProvider(AbstractProvider):
+    """
+    A provider that reads values from a table of a SQLite database (e.g. a per-environment file shipped with the
+    deployment), with the keys in the primary key (or otherwise indexed) column.
+
+    All keys under the prefix (e.g. the name of the minicfg and its separator, "SERVICE_") are loaded by one
+    indexed range query on the first lookup and served from memory until the provider is refreshed.
+    Other keys are looked up one by one and cached. The database is opened read-only and the connection
+    is shared by all threads (queries are serialized). Statements are constant, so they are prepared once
+    and reused from the statement cache of the connection.
+    """
+
+    _connection: "sqlite3.Connection"
+    _lock: threading.Lock  # serializes the use of the connection
+    _prefix: str
+    _range_query: str
+    _range_parameters: tuple[str, ...]
+    _key_query: str
+    _keys_query: str  # query of _SQLITE_MAX_PARAMETERS keys at once
+    _data: dict[str, str] | None  # keys under the prefix -> values, None until the prefix is loaded
+    _cache: dict[str, str | None]  # keys outside of the prefix -> values (None if not found)
+    _data_version: int | None  # PRAGMA data_version when the prefix was loaded
+
+    def __init__(
+        self, path: str, prefix: str = "", table: str = "config", key_column: str = "key", value_column: str = "value"
+    ):
+        """
+        Initialize the SQLite provider. Nothing is loaded until the first lookup.
+        :param path: path to the database file.
+        :param prefix: prefix of the keys to load at once (keys are not stripped of it).
+            All keys of the table are loaded if not set.
+        :param table: name of the table.
+        :param key_column: name of the column of the keys.
+        :param value_column: name of the column of the values. NULL values are considered missing.
+        """
+
+        import sqlite3
+
+        for identifier in (table, key_column, value_column):
+            if not identifier.isidentifier():
+                raise ValueError(f"invalid SQL identifier {identifier!r}")
+
+        self._connection = sqlite3.connect(
+            f"file:{urllib.parse.quote(os.path.abspath(path))}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        self._prefix = prefix
+
+        select = f"SELECT {key_column}, CAST({value_column} AS TEXT) FROM {table} WHERE {value_column} IS NOT NULL"
+        upper_bound = _prefix_upper_bound(prefix)
+        if not prefix:
+            self._range_query, self._range_parameters = select, ()
+        elif upper_bound is None:
+            self._range_query, self._range_parameters = f"{select} AND {key_column} >= ?", (prefix,)
+        else:
+            self._range_query = f"{select} AND {key_column} >= ? AND {key_column} < ?"
+            self._range_parameters = (prefix, upper_bound)
+        self._key_query = f"{select} AND {key_column} = ?"
+        self._keys_query = f"{select} AND {key_column} IN ({', '.join('?' * _SQLITE_MAX_PARAMETERS)})"
+
+        self._data = None
+        self._cache = {}
+        self._data_version = None
+
+    def get(self, key: str) -> str | None:
+        if key.startswith(self._prefix):
+            data = self._data
+            if data is None:
+                with self._lock:
+                    # the prefix may have been loaded by another thread meanwhile:
+                    if self._data is None:
+                        self._load()
+                    data = self._data
+            return data.get(key)
+
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            row = self._connection.execute(self._key_query, (key,)).fetchone()
+        value = row[1] if row is not None else None
+        self._cache[key] = value
+        return value
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        result: dict[str, str] = {}
+        missing: list[str] = []
+        for key in keys:
+            if key.startswith(self._prefix) or key in self._cache:
+                value = self.get(key)
+                if value is not None:
+                    result[key] = value
+            else:
+                missing.append(key)
+
+        # keys outside of the prefix are looked up by queries of many keys at once:
+        with self._lock:
+            for start in range(0, len(missing), _SQLITE_MAX_PARAMETERS):
+                chunk = missing[start : start + _SQLITE_MAX_PARAMETERS]
+                parameters = chunk + [None] * (_SQLITE_MAX_PARAMETERS - len(chunk))  # (NULL matches no key)
+                values = dict(self._connection.execute(self._keys_query, parameters).fetchall())
+                for key in chunk:
+                    self._cache[key] = values.get(key)
+                result.update(values)
+        return result
+
+    def refresh(self) -> bool:
+        """
+        Load the prefix again if the database has been changed since it was loaded.
+        Checking for changes is cheap (PRAGMA data_version), so it can be done often.
+        :return: True if any value under the prefix has changed, False otherwise.
+        """
+
+        with self._lock:
+            if self._data is not None and self._read_data_version() == self._data_version:
+                return False
+
+            data = self._data
+            self._load()
+            self._cache = {}
+            return data != self._data
+
+    def close(self) -> None:
+        """
+        Close the connection to the database.
+        """
+
+        with self._lock:
+            self._connection.close()
+
+    def _load(self) -> None:
+        """
+        Load all keys under the prefix, remembering the data version of the database.
+        """
+
+        # both are read in one transaction, so that no change between them can be missed:
+        with self._connection:
+            self._connection.execute("BEGIN")
+            data_version = self._read_data_version()
+            data = dict(self._connection.execute(self._range_query, self._range_parameters).fetchall())
+        self._data = data
+        self._data_version = data_version
+
+    def _read_data_version(self) -> int:
+        return self._connection.execute("PRAGMA data_version").fetchone()[0]
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """
+    Return the smallest string greater than all strings with the given prefix (None if there is no such string),
+    so that keys with the prefix can be selected by an indexed range query instead of LIKE.
+    """
+
+    while prefix:
+        last = ord(prefix[-1])
+        if last < 0x10FFFF:
+            # (surrogates cannot be encoded, so they are skipped)
+            return prefix[:-1] + chr(0xE000 if 0xD7FF <= last < 0xE000 else last + 1)
+        prefix = prefix[:-1]
+    return None
+
+
+class ProviderUnavailableError(Exception):
+    """
+    Exception raised by ResilientProvider when a lookup fails and no last-known-good value of the key is available.
+    """
+
+    def __init__(self, key: str, reason: str):
+        self.key = key
+        self.reason = reason
+        super().__init__(f"cannot get {key}: {reason}")
+
+
+@dataclasses.dataclass
+class ResilientProviderStats:
+    """
+    Counters of a ResilientProvider.
+    """
+
+    lookups: int = 0  # lookups made by the callers
+    failures: int = 0  # failed attempts, including timeouts
+    timeouts: int = 0  # attempts which have timed out
+    retries: int = 0  # attempts made after a failed one
+    fallbacks: int = 0  # lookups served from the last-known-good values
+    circuit_opens: int = 0  # how many times the circuit breaker has opened
+
+
+class ResilientProvider(AbstractProvider):
+    """
+    A provider wrapper protecting the callers from a slow or flapping provider.
+
+    Each lookup is bounded by a timeout and retried with jittered exponential backoff.
+    After `failure_threshold` consecutive failures, the circuit breaker opens and lookups are not attempted
+    for `reset_timeout` seconds, then a single trial lookup decides whether it closes again.
+    Lookups which cannot be made are served from the last-known-good values: values of successful lookups,
+    which can be persisted to a fallback file and are loaded from it on startup.
+
+    Use deadline() to bound a whole populate call:
+
+        with provider.deadline(5):
+            config.populate(provider)
+    """
+
+    _provider: AbstractProvider
+    _timeout: float | None
+    _retries: int
+    _backoff: float
+    _failure_threshold: int
+    _reset_timeout: float
+    _fallback_path: str | None
+    _last_known_good: dict[str, str | None]  # key -> value of the last successful lookup
+    _stats: ResilientProviderStats
+    _lock: threading.Lock
+    _local: threading.local  # deadline and number of fallbacks of the deadline block of the current thread
+    _consecutive_failures: int
+    _opened_at: float | None  # time the circuit breaker has opened at, None if it is closed
+    _half_open: bool  # a trial lookup is in progress
+
+    def __init__(
+        self,
+        provider: AbstractProvider,
+        timeout: float | None = 1.0,
+        retries: int = 2,
+        backoff: float = 0.05,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        fallback_path: str | None = None,
+    ):
+        """
+        Initialize the resilient provider.
+        :param provider: provider to protect.
+        :param timeout: timeout of a single lookup in seconds. Not limited if set to None.
+            Lookups with a timeout are made in separate threads, timed out lookups are abandoned.
+        :param retries: number of retries of a failed lookup.
+        :param backoff: base delay between retries in seconds, doubled with each retry (a random part of it is used).
+        :param failure_threshold: number of consecutive failures opening the circuit breaker.
+        :param reset_timeout: time in seconds after which an open circuit breaker lets a trial lookup through.
+        :param fallback_path: path to the JSON file storing the last-known-good values (see save()).
+        """
+
+        self._provider = provider
+        self._timeout = timeout
+        self._retries = retries
+        self._backoff = backoff
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._fallback_path = fallback_path
+        self._last_known_good = {}
+        self._stats = ResilientProviderStats()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._half_open = False
+
+        if fallback_path is not None and os.path.exists(fallback_path):
+            import json
+
+            with open(fallback_path, "r") as file:
+                self._last_known_good = json.load(file)
+
+    @property
+    def stats(self) -> ResilientProviderStats:
+        """
+        Return a copy of the counters.
+        """
+
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            self._stats.lookups += 1
+
+        deadline: float | None = getattr(self._local, "deadline", None)
+        reason = "no attempt made"
+        for attempt in range(self._retries + 1):
+            if attempt:
+                import random
+
+                delay = random.uniform(0, self._backoff * 2 ** (attempt - 1))
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    reason = "deadline exceeded"
+                    break
+                with self._lock:
+                    self._stats.retries += 1
+                time.sleep(delay)
+
+            timeout = self._timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    reason = "deadline exceeded"
+                    break
+                timeout = remaining if timeout is None else min(timeout, remaining)
+
+            if not self._allow_attempt():
+                reason = "circuit breaker is open"
+                break
+
+            try:
+                value = self._call(key, timeout)
+            except TimeoutError:
+                reason = f"timed out after {timeout:g}s"
+                self._record_failure(timed_out=True)
+                continue
+            except Exception as e:
+                reason = f"{e.__class__.__name__}: {e}"
+                self._record_failure(timed_out=False)
+                continue
+
+            self._record_success(key, value)
+            return value
+
+        return self._fallback(key, reason)
+
+    @contextlib.contextmanager
+    def deadline(self, seconds: float) -> typing.Iterator[None]:
+        """
+        Bound all lookups made by the current thread within the block by a total deadline.
+        Lookups which cannot be completed before the deadline are served from the last-known-good values.
+        If the block completes without any fallback and the fallback path is set, the last-known-good values are saved.
+        :param seconds: time available to the whole block in seconds.
+        """
+
+        local = self._local
+        previous_deadline: float | None = getattr(local, "deadline", None)
+        previous_fallbacks: int = getattr(local, "fallbacks", 0)
+
+        local.deadline = time.monotonic() + seconds
+        if previous_deadline is not None:
+            # nested blocks cannot extend the outer deadline:
+            local.deadline = min(local.deadline, previous_deadline)
+        local.fallbacks = 0
+        try:
+            yield
+        finally:
+            fallbacks = local.fallbacks
+            local.deadline = previous_deadline
+            local.fallbacks = previous_fallbacks + fallbacks
+
+        if not fallbacks and self._fallback_path is not None:
+            self.save()
+
+    def save(self) -> None:
+        """
+        Atomically write the last-known-good values to the fallback file, readable by the owner only.
+        """
+
+        import json
+        import tempfile
+
+        if self._fallback_path is None:
+            raise ValueError("fallback path is not set")
+
+        with self._lock:
+            data = dict(self._last_known_good)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self._fallback_path)), prefix=".minicfg-")
+        try:
+            with open(fd, "w") as file:
+                json.dump(data, file)
+            os.replace(tmp_path, self._fallback_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _call(self, key: str, timeout: float | None) -> str | None:
+        """
+        Call the wrapped provider, in a daemon thread if the lookup has a timeout
+        (so that an abandoned lookup which never returns does not block the interpreter exit).
+        """
+
+        if timeout is None:
+            return self._provider.get(key)
+
+        lookup = _InFlightLookup()
+
+        def run() -> None:
+            try:
+                lookup.value = self._provider.get(key)
+            except BaseException as e:
+                lookup.error = e
+            finally:
+                lookup.done.set()
+
+        threading.Thread(target=run, name=f"minicfg-lookup-{key}", daemon=True).start()
+        if not lookup.done.wait(timeout):
+            raise TimeoutError
+        if lookup.error is not None:
+            raise lookup.error
+        return lookup.value
+
+    def _allow_attempt(self) -> bool:
+        """
+        Check the circuit breaker, letting a single trial attempt through once the reset timeout has passed.
+        """
+
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._half_open or time.monotonic() - self._opened_at < self._reset_timeout:
+                return False
+            self._half_open = True
+            return True
+
+    def _record_success(self, key: str, value: str | None) -> None:
+        with self._lock:
+            self._last_known_good[key] = value
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._half_open = False
+
+    def _record_failure(self, timed_out: bool) -> None:
+        with self._lock:
+            self._stats.failures += 1
+            if timed_out:
+                self._stats.timeouts += 1
+
+            self._consecutive_failures += 1
+            if self._half_open or (self._opened_at is None and self._consecutive_failures >= self._failure_threshold):
+                self._opened_at = time.monotonic()
+                self._half_open = False
+                self._stats.circuit_opens += 1
+
+    def _fallback(self, key: str, reason: str) -> str | None:
+        """
+        Serve the last-known-good value of the key.
+        """
+
+        with self._lock:
+            if key not in self._last_known_good:
+                raise ProviderUnavailableError(key, reason)
+            self._stats.fallbacks += 1
+            value = self._last_known_good[key]
+
+        self._local.fallbacks = getattr(self._local, "fallbacks", 0) + 1
+        return value
@@ -0,0 +1,250 @@
+"""
+Process-wide registry of Minicfg classes.
+
+Services often define many independent Minicfg classes (e.g. one per module). Populating them separately repeats
+lookups and may observe the environment at different moments. The registry reads the union of their keys
+from the provider once, and populates all registered classes from that snapshot.
+"""
+
+import dataclasses
+import threading
+import typing
+
+from .field import NO_DEFAULT_VALUE, Field
+from .minicfg import Minicfg, PopulationError
+from .provider import AbstractProvider, EnvProvider
+
+_M = typing.TypeVar("_M", bound=type[Minicfg])
+
+
+@dataclasses.dataclass(frozen=True)
+class KeyConflict:
+    """
+    KeyConflict class represents a key defined differently by fields of the registered classes.
+    """
+
+    key: str
+    definitions: list[str]  # descriptions of the conflicting definitions, e.g. "module.Config.PORT: int"
+
+
+class ConflictError(Exception):
+    """
+    Exception raised when the registered classes define the same keys differently.
+    """
+
+    conflicts: list[KeyConflict]
+
+    def __init__(self, conflicts: list[KeyConflict]):
+        self.conflicts = conflicts
+        super().__init__(
+            f"{len(conflicts)} key(s) defined differently:\n"
+            + "\n".join(f" - {conflict.key}: {', '.join(conflict.definitions)}" for conflict in conflicts),
+        )
+
+
+class _SnapshotProvider(AbstractProvider):
+    """
+    A provider serving values from a snapshot, and other keys (e.g. references of interpolated values)
+    from the wrapped provider, remembering them.
+    """
+
+    def __init__(self, provider: AbstractProvider, values: dict[str, str], keys: frozenset[str]):
+        self._provider = provider
+        self._values: dict[str, str | None] = dict(values)
+        self._keys = keys  # keys covered by the snapshot
+
+    def get(self, key: str) -> str | None:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        value = None if key in self._keys else self._provider.get(key)
+        self._values[key] = value
+        return value
+
+
+class Registry:
+    """
+    Registry class collects Minicfg classes and populates all of them consistently, from one snapshot of the provider.
+    """
+
+    _configs: dict[type[Minicfg], Minicfg | None]  # registered class -> its instance, None until it is needed
+    _lock: threading.RLock
+
+    def __init__(self):
+        self._configs = {}
+        self._lock = threading.RLock()
+
+    def register(self, config_class: _M) -> _M:
+        """
+        Register the Minicfg class. Can be used as a decorator.
+        The class is instantiated only when it is needed, so that decorators applied after registration
+        (e.g. minicfg_name above register) and forward references of annotations are taken into account.
+        :param config_class: Minicfg class to register.
+        :return: the registered class.
+        """
+
+        if not (isinstance(config_class, type) and issubclass(config_class, Minicfg)):
+            raise TypeError(f"{config_class!r} is not a Minicfg class")
+
+        with self._lock:
+            self._configs.setdefault(config_class, None)
+        return config_class
+
+    def get(self, config_class: type[Minicfg]) -> Minicfg:
+        """
+        Return the instance of the registered class (populated once the registry is populated).
+        :param config_class: registered Minicfg class.
+        """
+
+        with self._lock:
+            if config_class not in self._configs:
+                raise KeyError(f"{config_class.__qualname__} is not registered")
+            return self._get_instance(config_class)
+
+    def keys(self) -> set[str]:
+        """
+        Return the union of the keys (field names and attached file field names) of all registered classes.
+        """
+
+        with self._lock:
+            return set(self._definitions())
+
+    def conflicts(self) -> list[KeyConflict]:
+        """
+        Return the keys defined by more than one field with different casters or default values.
+        Fields defined the same way may share a key (e.g. LOG_LEVEL read by many modules).
+        """
+
+        with self._lock:
+            definitions = self._definitions()
+
+        conflicts: list[KeyConflict] = []
+        for key, fields in sorted(definitions.items()):
+            first_field = fields[0][1]
+            if any(not _same_definition(first_field, field) for _, field in fields[1:]):
+                conflicts.append(
+                    KeyConflict(key=key, definitions=[f"{path}: {_describe(field)}" for path, field in fields])
+                )
+        return conflicts
+
+    def populate(self, provider: AbstractProvider | None = None, collect_errors: bool = False) -> None:
+        """
+        Populate all registered classes from one snapshot of the provider.
+        :param provider: provider to take the snapshot from. If not set, environment variables are used.
+        :param collect_errors: if set, all classes are populated and a single PopulationError
+            listing the failed fields of all classes is raised at the end.
+        :raises ConflictError: if the registered classes define the same keys differently.
+        """
+
+        if not provider:
+            provider = EnvProvider()
+
+        with self._lock:
+            conflicts = self.conflicts()
+            if conflicts:
+                raise ConflictError(conflicts)
+
+            keys = frozenset(self._definitions())
+            snapshot = _SnapshotProvider(provider, provider.get_many(keys), keys)
+
+            errors: list[Exception] = []
+            for config in map(self._get_instance, list(self._configs)):
+                try:
+                    config.populate(snapshot, collect_errors=collect_errors)
+                except PopulationError as e:
+                    errors += e.errors
+
+            if errors:
+                raise PopulationError(errors)
+
+    def _get_instance(self, config_class: type[Minicfg]) -> Minicfg:
+        """
+        Return the instance of the registered class, creating it on first use. Must be called with the lock held.
+        """
+
+        config = self._configs[config_class]
+        if config is None:
+            config = self._configs[config_class] = config_class()
+        return config
+
+    def _definitions(self) -> dict[str, list[tuple[str, Field]]]:
+        """
+        Return the fields defining each key, with their attribute paths.
+        """
+
+        definitions: dict[str, list[tuple[str, Field]]] = {}
+        for config_class in list(self._configs):
+            self._get_instance(config_class)  # generate the field names
+            path = f"{config_class.__module__}.{config_class.__qualname__}"
+            _collect_definitions(config_class, path, definitions)
+        return definitions
+
+
+def _collect_definitions(
+    minicfg_class: type[Minicfg], path: str, definitions: dict[str, list[tuple[str, Field]]]
+) -> None:
+    """
+    Collect the fields of the Minicfg class and its children recursively by key.
+    """
+
+    if minicfg_class._blob is not None:
+        # the fields of blob minicfgs are extracted from the blob, which is the only key:
+        blob_field = minicfg_class._blob.field
+        definitions.setdefault(blob_field.name, []).append((path, blob_field))
+        if blob_field.file_field:
+            definitions.setdefault(blob_field.file_field.name, []).append((path, blob_field.file_field))
+        return
+
+    for attr_name, field in minicfg_class._iter_class_field_instances():
+        definitions.setdefault(field.name, []).append((f"{path}.{attr_name}", field))
+        if field.file_field:
+            definitions.setdefault(field.file_field.name, []).append((f"{path}.{attr_name}", field.file_field))
+
+    for attr_name, child_minicfg_class in minicfg_class._iter_minicfg_classes():
+        _collect_definitions(child_minicfg_class, f"{path}.{attr_name}", definitions)
+
+
+def _describe(field: Field) -> str:
+    """
+    Describe the type and the default value of the field.
+    """
+
+    description = (field.caster and field.caster.typename) or "str"
+    if field.default is not NO_DEFAULT_VALUE:
+        description += f" = {'******' if field.secret else repr(field.default)}"
+    return description
+
+
+def _same_definition(field: Field, other: Field) -> bool:
+    """
+    Check whether both fields cast the raw value the same way and have the same default value.
+    """
+
+    if type(field.caster) is not type(other.caster):
+        return False
+    if field.caster is not None and field.caster.typename != other.caster.typename:
+        return False
+    if (field.default is NO_DEFAULT_VALUE) != (other.default is NO_DEFAULT_VALUE):
+        return False
+    try:
+        return bool(field.default == other.default)
+    except Exception:
+        return field.default is other.default
+
+
+"""
+Default registry of the process.
+"""
+registry = Registry()
+
+
+def register(config_class: _M) -> _M:
+    """
+    Register the Minicfg class in the default registry. Can be used as a decorator.
+    :param config_class: Minicfg class to register.
+    :return: the registered class.
+    """
+
+    return registry.register(config_class)
@@ -0,0 +1,328 @@
+"""
+Read-only binary snapshots of populated Minicfg trees.
+
+A snapshot is frozen once (e.g. in the master process of a pre-forking server) into shared memory or a file,
+and attached by worker processes, which read values straight from the shared buffer instead of
+re-populating the config or inheriting it through copy-on-write pages.
+
+Snapshot layout (little-endian):
+ - header: magic, format version, number of entries;
+ - index: one fixed-size record per entry (key offset, key length, value type, value offset, value length);
+ - data: UTF-8 encoded keys followed by encoded values.
+
+Keys are attribute paths of the fields (e.g. "Database.HOST").
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import sys
+import typing
+from multiprocessing import shared_memory
+
+from .field import Field
+from .minicfg import Minicfg
+
+_MAGIC = b"MCFG"
+_VERSION = 1
+
+_HEADER = struct.Struct("<4sHI")  # magic, version, number of entries
+_ENTRY = struct.Struct("<IIBII")  # key offset, key length, value type, value offset, value length
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+
+_PATH_SEP = "."
+
+# value types:
+_TYPE_NONE = 0
+_TYPE_BOOL = 1
+_TYPE_INT = 2
+_TYPE_FLOAT = 3
+_TYPE_STR = 4
+_TYPE_BYTES = 5
+_TYPE_PICKLE = 6  # any other value (lists, dicts, enums, etc.)
+
+_INT_MIN = -(2**63)
+_INT_MAX = 2**63 - 1
+
+# names of the shared memory blocks created by share() in this process (or in the parent it was forked from,
+# which shares its resource tracker):
+_shared_names: set[str] = set()
+
+
+def dumps(config: Minicfg) -> bytes:
+    """
+    Freeze the populated Minicfg instance into a snapshot.
+    :param config: populated Minicfg instance.
+    :return: snapshot bytes.
+    """
+
+    values: list[tuple[str, typing.Any]] = []
+    _collect_values(config, "", values)
+    values.sort(key=lambda item: item[0])
+
+    keys_data = bytearray()
+    values_data = bytearray()
+    entries: list[tuple[int, int, int, int, int]] = []
+    for key, value in values:
+        value_type, encoded_value = _encode_value(value)
+        encoded_key = key.encode()
+        entries.append((len(keys_data), len(encoded_key), value_type, len(values_data), len(encoded_value)))
+        keys_data += encoded_key
+        values_data += encoded_value
+
+    data_offset = _HEADER.size + _ENTRY.size * len(entries)
+    values_offset = data_offset + len(keys_data)
+
+    result = bytearray(_HEADER.pack(_MAGIC, _VERSION, len(entries)))
+    for key_offset, key_length, value_type, value_offset, value_length in entries:
+        result += _ENTRY.pack(
+            data_offset + key_offset, key_length, value_type, values_offset + value_offset, value_length
+        )
+    result += keys_data
+    result += values_data
+
+    return bytes(result)
+
+
+def _collect_values(config: Minicfg, prefix: str, values: list[tuple[str, typing.Any]]) -> None:
+    """
+    Collect (attribute path, value) pairs of the Minicfg instance and its children recursively.
+    """
+
+    for attr_name, _ in config._iter_field_instances():
+        value = getattr(config, attr_name)
+        if isinstance(value, Field):
+            raise ValueError(f"{config.__class__.__name__} is not populated")
+        values.append((f"{prefix}{attr_name}", value))
+
+    for attr_name, _ in config._iter_minicfg_classes():
+        _collect_values(getattr(config, attr_name), f"{prefix}{attr_name}{_PATH_SEP}", values)
+
+
+def _encode_value(value: typing.Any) -> tuple[int, bytes]:
+    """
+    Encode the value.
+    Exact types are checked, so that subclasses (e.g. enums based on int or str) are pickled and preserved.
+    :return: value type and encoded value.
+    """
+
+    value_type = type(value)
+    if value is None:
+        return _TYPE_NONE, b""
+    if value_type is bool:
+        return _TYPE_BOOL, b"\x01" if value else b"\x00"
+    if value_type is int and _INT_MIN <= value <= _INT_MAX:
+        return _TYPE_INT, _INT.pack(value)
+    if value_type is float:
+        return _TYPE_FLOAT, _FLOAT.pack(value)
+    if value_type is str:
+        return _TYPE_STR, value.encode("utf-8", "surrogatepass")
+    if value_type is bytes:
+        return _TYPE_BYTES, value
+    return _TYPE_PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class Snapshot:
+    """
+    Snapshot class provides read access to a snapshot stored in a buffer (bytes, shared memory or mmap).
+    Scalars and strings are decoded straight from the buffer on each access, other values are unpickled once.
+    """
+
+    _buffer: memoryview
+    _entries: dict[str, tuple[int, int, int]]  # key -> (value type, value offset, value length)
+    _children: frozenset[str]  # attribute paths of child minicfgs
+    _unpickled: dict[str, typing.Any]  # cache of unpickled values
+    _resource: typing.Any  # object owning the buffer (shared memory or mmap), closed by close()
+
+    def __init__(self, buffer: typing.Any, resource: typing.Any = None):
+        """
+        Initialize the snapshot.
+        :param buffer: buffer containing the snapshot.
+        :param resource: object owning the buffer, closed when the snapshot is closed.
+        """
+
+        self._buffer = memoryview(buffer)
+        self._resource = resource
+        self._unpickled = {}
+
+        magic, version, count = _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC:
+            raise ValueError("the provided buffer is not a minicfg snapshot")
+        if version != _VERSION:
+            raise ValueError(f"unsupported snapshot version {version}")
+
+        entries: dict[str, tuple[int, int, int]] = {}
+        children: set[str] = set()
+        for key_offset, key_length, value_type, value_offset, value_length in _ENTRY.iter_unpack(
+            self._buffer[_HEADER.size : _HEADER.size + _ENTRY.size * count]
+        ):
+            key = str(self._buffer[key_offset : key_offset + key_length], "utf-8")
+            entries[key] = (value_type, value_offset, value_length)
+
+            # register all parent paths of the key as children:
+            sep_index = key.find(_PATH_SEP)
+            while sep_index != -1:
+                children.add(key[:sep_index])
+                sep_index = key.find(_PATH_SEP, sep_index + 1)
+
+        self._entries = entries
+        self._children = frozenset(children)
+
+    @property
+    def config(self) -> "SnapshotView":
+        """
+        Return the view of the root minicfg.
+        """
+
+        return SnapshotView(self, "")
+
+    def keys(self) -> list[str]:
+        """
+        Return attribute paths of all fields stored in the snapshot.
+        """
+
+        return list(self._entries)
+
+    def get(self, key: str) -> typing.Any:
+        """
+        Get the value of the field.
+        :param key: attribute path of the field (e.g. "Database.HOST").
+        """
+
+        value_type, offset, length = self._entries[key]
+        if value_type == _TYPE_STR:
+            return str(self._buffer[offset : offset + length], "utf-8", "surrogatepass")
+        if value_type == _TYPE_INT:
+            return _INT.unpack_from(self._buffer, offset)[0]
+        if value_type == _TYPE_BOOL:
+            return self._buffer[offset] == 1
+        if value_type == _TYPE_FLOAT:
+            return _FLOAT.unpack_from(self._buffer, offset)[0]
+        if value_type == _TYPE_NONE:
+            return None
+        if value_type == _TYPE_BYTES:
+            return self._buffer[offset : offset + length].tobytes()
+        if value_type == _TYPE_PICKLE:
+            try:
+                return self._unpickled[key]
+            except KeyError:
+                value = self._unpickled[key] = pickle.loads(self._buffer[offset : offset + length])
+                return value
+
+        raise ValueError(f"unexpected value type {value_type} of {key}")
+
+    def close(self) -> None:
+        """
+        Release the buffer and close the resource owning it (if any).
+        """
+
+        self._buffer.release()
+        if self._resource is not None:
+            self._resource.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class SnapshotView:
+    """
+    SnapshotView class provides attribute access to the fields and child minicfgs stored in a snapshot,
+    mirroring the populated Minicfg instance (e.g. `snapshot.config.Database.HOST`).
+    """
+
+    __slots__ = ("_snapshot", "_prefix")
+
+    def __init__(self, snapshot: Snapshot, prefix: str):
+        self._snapshot = snapshot
+        self._prefix = prefix
+
+    def __getattr__(self, name: str) -> typing.Any:
+        key = f"{self._prefix}{name}"
+        if key in self._snapshot._entries:
+            return self._snapshot.get(key)
+        if key in self._snapshot._children:
+            return SnapshotView(self._snapshot, f"{key}{_PATH_SEP}")
+        raise AttributeError(name)
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        if name in SnapshotView.__slots__:
+            object.__setattr__(self, name, value)
+            return
+        raise AttributeError("snapshot views are read-only")
+
+
+def share(config: Minicfg, name: str | None = None) -> shared_memory.SharedMemory:
+    """
+    Freeze the populated Minicfg instance into a new shared memory block.
+    The caller owns the block and must close and unlink it when it is not needed anymore.
+    :param config: populated Minicfg instance.
+    :param name: name of the shared memory block. A random name is generated if not set.
+    :return: shared memory block containing the snapshot, pass its name to attach().
+    """
+
+    data = dumps(config)
+    shm = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+    shm.buf[: len(data)] = data
+    _shared_names.add(shm.name)
+    return shm
+
+
+def attach(name: str) -> Snapshot:
+    """
+    Attach to the snapshot stored in the shared memory block with the given name.
+    :param name: name of the shared memory block.
+    :return: snapshot reading values straight from the shared memory.
+    """
+
+    # attaching processes must not unlink the block when they exit:
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+        if os.name == "posix" and shm.name not in _shared_names:
+            # the block is registered with the resource tracker of the process, which unlinks it at exit
+            # (unless the tracker is the one of the process which created the block):
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(shm._name, "shared_memory")
+    return Snapshot(shm.buf, resource=shm)
+
+
+def dump_file(config: Minicfg, path: str) -> None:
+    """
+    Freeze the populated Minicfg instance into a snapshot file, written atomically and readable by the owner only
+    (snapshots contain the values of secret fields too).
+    :param config: populated Minicfg instance.
+    :param path: path to the file.
+    """
+
+    import tempfile
+
+    data = dumps(config)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".minicfg-")
+    try:
+        with open(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def open_file(path: str) -> Snapshot:
+    """
+    Open the snapshot file by memory-mapping it read-only.
+    Values other than scalars and strings are unpickled, so only trusted snapshot files
+    (e.g. written by dump_file and not writable by others) may be opened.
+    :param path: path to the snapshot file.
+    :return: snapshot reading values straight from the mapped file.
+    """
+
+    with open(path, "rb") as file:
+        mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return Snapshot(mapped_file, resource=mapped_file)
@@ -0,0 +1,229 @@
+"""
+Opt-in telemetry of field reads, used to find configuration which is never read (and can be deleted)
+or read very often (and is worth optimizing).
+
+Recording is enabled per populated Minicfg instance by swapping the classes of the instance and its children
+with generated subclasses whose descriptors count reads of the fields, so other attributes and instances
+without telemetry are not slowed down at all.
+Reports of many processes can be dumped to JSON files and merged (see `minicfg telemetry`).
+"""
+
+import dataclasses
+import json
+import threading
+import time
+import typing
+from collections.abc import Iterable
+
+from .field import Field
+from .minicfg import Minicfg, _LazyChild
+
+_time = time.time
+
+
+@dataclasses.dataclass
+class FieldAccess:
+    """
+    FieldAccess class represents the reads of a field.
+    """
+
+    name: str  # full name of the field
+    reads: int = 0
+    first_read: float | None = None  # unix time of the first read, None if the field has never been read
+    last_read: float | None = None  # unix time of the last read, None if the field has never been read
+
+
+class _RecordingField:
+    """
+    Descriptor recording reads of a field of an instrumented Minicfg instance.
+    """
+
+    __slots__ = ("_attr_name", "_field", "reads", "first_read", "last_read")
+
+    def __init__(self, attr_name: str, field: Field):
+        self._attr_name = attr_name
+        self._field = field
+        self.reads = 0
+        self.first_read: float | None = None
+        self.last_read: float | None = None
+
+    def __get__(self, instance: Minicfg | None, owner: type[Minicfg]) -> typing.Any:
+        if instance is None:
+            # class attribute access returns the original field, as for non-instrumented classes:
+            return self._field
+
+        now = _time()
+        if not self.reads:
+            self.first_read = now
+        self.reads += 1
+        self.last_read = now
+        return instance.__dict__.get(self._attr_name, self._field)
+
+    def __set__(self, instance: Minicfg, value: typing.Any) -> None:
+        instance.__dict__[self._attr_name] = value
+
+
+class _InstrumentingLazyChild(_LazyChild):
+    """
+    Descriptor creating a lazy child minicfg of an instrumented Minicfg instance on first access
+    and instrumenting it.
+    """
+
+    def __init__(self, attr_name: str, minicfg_class: type[Minicfg], recorder: "AccessRecorder"):
+        super().__init__(attr_name, minicfg_class)
+        self._recorder = recorder
+
+    def __get__(self, instance: Minicfg | None, owner: type[Minicfg]) -> typing.Any:
+        child_minicfg = super().__get__(instance, owner)
+        if instance is not None:
+            self._recorder._instrument_lazy(child_minicfg)
+        return child_minicfg
+
+
+class AccessRecorder:
+    """
+    AccessRecorder class records the reads of the fields of a Minicfg instance and its children (see enable()).
+    Lazy child minicfgs are recorded from their creation, their fields are not reported before.
+    Counts may be slightly lower than the actual number of reads when fields are read by many threads at once.
+    """
+
+    _config: Minicfg
+    _fields: dict[str, _RecordingField]  # field name -> descriptor recording its reads
+    _instrumented: list[tuple[Minicfg, type[Minicfg]]]  # instrumented instances and their original classes
+    _lock: threading.Lock
+
+    def __init__(self, config: Minicfg):
+        """
+        Initialize the recorder and start recording.
+        :param config: Minicfg instance to record the reads of.
+        """
+
+        self._config = config
+        self._fields = {}
+        self._instrumented = []
+        self._lock = threading.Lock()
+        with self._lock:
+            self._instrument(config)
+
+    def _instrument(self, config: Minicfg) -> None:
+        """
+        Swap the class of the Minicfg instance and its children with subclasses counting reads of the fields.
+        """
+
+        original_class = config.__class__
+        if original_class.__dict__.get("_access_recorded", False):
+            raise ValueError(f"reads of {original_class.__name__} are already recorded")
+
+        # data descriptors of the subclass take precedence over the values stored in the instance __dict__:
+        namespace: dict[str, typing.Any] = {}
+        for attr_name, field in config._iter_field_instances():
+            namespace[attr_name] = self._fields[field.name] = _RecordingField(attr_name, field)
+        for attr_name, child_minicfg_class in original_class._iter_minicfg_classes():
+            if child_minicfg_class._is_lazy():
+                # lazy child minicfgs which are not created yet are instrumented on creation, not created here:
+                namespace[attr_name] = _InstrumentingLazyChild(attr_name, child_minicfg_class, self)
+        namespace.update(
+            _access_recorded=True,
+            _class_swapped=True,  # instances are still compared as instances of the original class
+            __module__=original_class.__module__,
+            __qualname__=original_class.__qualname__,
+        )
+        config.__class__ = type(original_class.__name__, (original_class,), namespace)
+        self._instrumented.append((config, original_class))
+
+        for attr_name, child_minicfg_class in original_class._iter_minicfg_classes():
+            if not child_minicfg_class._is_lazy():
+                self._instrument(getattr(config, attr_name))
+            elif attr_name in config.__dict__:
+                self._instrument(config.__dict__[attr_name])
+
+    def _instrument_lazy(self, config: Minicfg) -> None:
+        """
+        Instrument the lazy child minicfg just created, unless recording has been disabled meanwhile
+        or another thread has instrumented it already.
+        """
+
+        with self._lock:
+            if self._instrumented and not config.__class__.__dict__.get("_access_recorded", False):
+                self._instrument(config)
+
+    def disable(self) -> None:
+        """
+        Stop recording by restoring the original classes. Recorded reads are kept.
+        """
+
+        with self._lock:
+            for config, original_class in self._instrumented:
+                config.__class__ = original_class
+            self._instrumented = []
+
+    def report(self) -> dict[str, FieldAccess]:
+        """
+        Return the reads of all fields (including never read ones), by field name.
+        """
+
+        return {
+            name: FieldAccess(name=name, reads=field.reads, first_read=field.first_read, last_read=field.last_read)
+            for name, field in self._fields.items()
+        }
+
+    def dump(self, path: str) -> None:
+        """
+        Dump the report to a JSON file, which can be merged with the dumps of other processes.
+        :param path: path to the file.
+        """
+
+        config_class = self._config.__class__
+        with open(path, "w") as file:
+            json.dump(
+                {
+                    "config": f"{config_class.__module__}.{config_class.__qualname__}",
+                    "fields": [dataclasses.asdict(access) for access in self.report().values()],
+                },
+                file,
+            )
+
+
+def enable(config: Minicfg) -> AccessRecorder:
+    """
+    Start recording the reads of the fields of the populated Minicfg instance and its children.
+    :param config: populated Minicfg instance.
+    :return: recorder of the reads.
+    """
+
+    return AccessRecorder(config)
+
+
+def load(path: str) -> dict[str, FieldAccess]:
+    """
+    Load the report dumped by AccessRecorder.dump.
+    :param path: path to the file.
+    :return: reads of the fields, by field name.
+    """
+
+    with open(path, "r") as file:
+        data = json.load(file)
+    return {access["name"]: FieldAccess(**access) for access in data["fields"]}
+
+
+def merge(reports: Iterable[dict[str, FieldAccess]]) -> dict[str, FieldAccess]:
+    """
+    Merge the reports of many processes: reads are summed up, the earliest first and the latest last reads are kept.
+    :param reports: reports to merge.
+    :return: merged report, by field name.
+    """
+
+    result: dict[str, FieldAccess] = {}
+    for report in reports:
+        for name, access in report.items():
+            merged = result.get(name)
+            if merged is None:
+                result[name] = dataclasses.replace(access)
+                continue
+
+            merged.reads += access.reads
+            if access.first_read is not None:
+                merged.first_read = min(access.first_read, merged.first_read or access.first_read)
+            if access.last_read is not None:
+                merged.last_read = max(access.last_read, merged.last_read or access.last_read)
+    return result
@@ -0,0 +1,173 @@
+import re
+import typing
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Sequence
+
+
+class AbstractValidator(ABC):
+    """
+    Abstract validator class.
+    Validators are created once, together with the fields they are attached to, so all the preparation work
+    (compiling regular expressions, building sets, etc.) should be done in __init__.
+    """
+
+    @abstractmethod
+    def validate(self, value: typing.Any) -> None:
+        """
+        Validate the provided value.
+        :param value: value to be validated.
+        :raises ValueError: if the value is invalid.
+        """
+
+        pass
+
+    def validate_many(self, values: Sequence[typing.Any]) -> None:
+        """
+        Validate all the provided values (e.g. items of a list) in one pass.
+        :param values: values to be validated.
+        :raises ValueError: if any of the values is invalid.
+        """
+
+        for value in values:
+            self.validate(value)
+
+
+class Range(AbstractValidator):
+    """
+    Validator that checks that the value is within the given range (inclusive).
+    """
+
+    def __init__(self, min: typing.Any = None, max: typing.Any = None):
+        """
+        Initialize the range validator.
+        :param min: minimum allowed value. Not checked if set to None.
+        :param max: maximum allowed value. Not checked if set to None.
+        """
+
+        self.min = min
+        self.max = max
+
+    def validate(self, value: typing.Any) -> None:
+        if self.min is not None and value < self.min:
+            raise ValueError(f"{value!r} is less than {self.min!r}")
+        if self.max is not None and value > self.max:
+            raise ValueError(f"{value!r} is greater than {self.max!r}")
+
+    def validate_many(self, values: Sequence[typing.Any]) -> None:
+        if not values:
+            return
+        # only the extremes need to be checked:
+        extremes = []
+        if self.min is not None:
+            extremes.append(min(values))
+        if self.max is not None:
+            extremes.append(max(values))
+        if any(extreme != extreme for extreme in extremes):
+            # min and max are not reliable with NaN (NaN compares false with everything), check all values:
+            super().validate_many(values)
+            return
+        for extreme in extremes:
+            self.validate(extreme)
+
+
+class Length(AbstractValidator):
+    """
+    Validator that checks that the length of the value is within the given range (inclusive).
+    """
+
+    def __init__(self, min: int | None = None, max: int | None = None):
+        """
+        Initialize the length validator.
+        :param min: minimum allowed length. Not checked if set to None.
+        :param max: maximum allowed length. Not checked if set to None.
+        """
+
+        self._range = Range(min=min, max=max)
+
+    def validate(self, value: typing.Any) -> None:
+        try:
+            self._range.validate(len(value))
+        except ValueError as e:
+            raise ValueError(f"length of {value!r} is invalid: {e}") from None
+
+    def validate_many(self, values: Sequence[typing.Any]) -> None:
+        try:
+            self._range.validate_many(list(map(len, values)))
+        except ValueError:
+            # find the invalid value to report it:
+            super().validate_many(values)
+
+
+class Pattern(AbstractValidator):
+    """
+    Validator that checks that the whole value matches the given regular expression.
+    """
+
+    def __init__(self, pattern: str | re.Pattern[str], flags: int = 0):
+        """
+        Initialize the pattern validator.
+        :param pattern: regular expression, compiled once.
+        :param flags: regular expression flags.
+        """
+
+        self._pattern = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+
+    def validate(self, value: typing.Any) -> None:
+        if self._pattern.fullmatch(value) is None:
+            raise ValueError(f"{value!r} does not match the pattern {self._pattern.pattern!r}")
+
+    def validate_many(self, values: Sequence[typing.Any]) -> None:
+        if all(map(self._pattern.fullmatch, values)):
+            return
+        # find the invalid value to report it:
+        super().validate_many(values)
+
+
+class Choices(AbstractValidator):
+    """
+    Validator that checks that the value is one of the allowed values.
+    """
+
+    def __init__(self, choices: Iterable[typing.Any]):
+        """
+        Initialize the choices validator.
+        :param choices: allowed values (must be hashable).
+        """
+
+        self._choices = frozenset(choices)
+
+    def validate(self, value: typing.Any) -> None:
+        if value not in self._choices:
+            raise ValueError(f"{value!r} is not one of {sorted(map(repr, self._choices))}")
+
+    def validate_many(self, values: Sequence[typing.Any]) -> None:
+        if self._choices.issuperset(values):
+            return
+        # find the invalid value to report it:
+        super().validate_many(values)
+
+
+class Custom(AbstractValidator):
+    """
+    Validator that checks the value using the given function.
+    """
+
+    def __init__(self, check: Callable[[typing.Any], bool], message: str = "is invalid"):
+        """
+        Initialize the custom validator.
+        :param check: function returning True if the value is valid.
+        :param message: message used to describe invalid values.
+        """
+
+        self._check = check
+        self._message = message
+
+    def validate(self, value: typing.Any) -> None:
+        if not self._check(value):
+            raise ValueError(f"{value!r} {self._message}")
+
+    def validate_many(self, values: Sequence[typing.Any]) -> None:
+        if all(map(self._check, values)):
+            return
+        # find the invalid value to report it:
+        super().validate_many(values)
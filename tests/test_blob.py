@@ -0,0 +1,178 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from minicfg import Field, Minicfg, minicfg_blob, minicfg_name
+from minicfg.caster import IntCaster, JSONCaster, ListCaster
+from minicfg.checker import Checker
+from minicfg.field import CastingError, FieldValueNotProvidedError
+from minicfg.minicfg import PopulationError
+from minicfg.registry import Registry
+
+from ._mock_provider import MockProvider
+
+_BLOB = {
+    "port": 8080,
+    "debug": True,
+    "server": {"host": "example.com", "timeouts": [1.5, 3]},
+    "a/b": {"~c": "escaped"},
+    "tags": {"team": "core"},
+    "missing": None,
+    "hosts": ["a.example.com", "b.example.com"],
+    "ports": [8080, 8081],
+}
+
+
+@minicfg_name("SERVICE")
+class _Config(Minicfg):
+    NAME = Field(default="service")
+
+    @minicfg_name("CONFIG_JSON")
+    @minicfg_blob(
+        pointers={
+            "HOST": "/server/host",
+            "TIMEOUT": "/server/timeouts/1",
+            "ESCAPED": "/a~1b/~0c",
+            "REGION": "/server/region",
+        },
+        attach_file_field=True,
+    )
+    class Settings(Minicfg):
+        PORT: int = Field()
+        DEBUG: bool = Field(default=False)
+        HOST = Field()
+        TIMEOUT: float = Field()
+        ESCAPED = Field()
+        TAGS = Field(caster=JSONCaster())
+        REGION = Field(default="eu")
+        MISSING = Field(default="default")
+        HOSTS: list[str] = Field()
+        PORTS = Field(caster=ListCaster(sep=";", item_caster=IntCaster()))
+
+
+@minicfg_name("APP")
+class _TomlConfig(Minicfg):
+    @minicfg_name("CONFIG")
+    @minicfg_blob(format="toml", pointers={"HOST": "/database/host", "STARTED": "/started"})
+    class Settings(Minicfg):
+        HOST = Field()
+        PORT: int = Field(default=5432)
+        STARTED = Field(default=None)
+
+
+def _provider(blob: dict | None = None) -> MockProvider:
+    return MockProvider({"SERVICE_CONFIG_JSON": json.dumps(_BLOB if blob is None else blob)})
+
+
+class TestBlob(unittest.TestCase):
+    def test_extract(self):
+        config = _Config.new_populated(_provider())
+        settings = config.Settings
+        self.assertEqual(8080, settings.PORT)
+        self.assertIs(True, settings.DEBUG)
+        self.assertEqual("example.com", settings.HOST)
+        self.assertEqual(3.0, settings.TIMEOUT)
+        self.assertEqual("escaped", settings.ESCAPED)
+        self.assertEqual({"team": "core"}, settings.TAGS)
+        self.assertEqual("eu", settings.REGION)
+        self.assertEqual("default", settings.MISSING)
+        self.assertEqual(["a.example.com", "b.example.com"], settings.HOSTS)
+        self.assertEqual([8080, 8081], settings.PORTS)
+        self.assertEqual("service", config.NAME)
+
+    def test_toml(self):
+        blob = 'started = 2024-01-02T03:04:05Z\n[database]\nhost = "db"\n'
+        config = _TomlConfig.new_populated(MockProvider({"APP_CONFIG": blob}))
+        self.assertEqual("db", config.Settings.HOST)
+        self.assertEqual(5432, config.Settings.PORT)
+        self.assertEqual("2024-01-02T03:04:05+00:00", config.Settings.STARTED)
+
+    def test_parsed_once(self):
+        blob = {**_BLOB, "unused": "parsed once"}  # not parsed by other tests
+        load = mock.Mock(side_effect=json.loads)
+        with mock.patch("minicfg.blob._resolve_json_load", return_value=load):
+            config = _Config.new_populated(_provider(blob))
+            self.assertEqual(1, load.call_count)
+
+            config.populate(_provider(blob))
+            self.assertEqual(1, load.call_count)
+
+            config.populate(_provider({**_BLOB, "port": 9090}))
+            self.assertEqual(2, load.call_count)
+        self.assertEqual(9090, config.Settings.PORT)
+
+    def test_fingerprint(self):
+        config = _Config.new_populated(_provider())
+        fingerprint = config.fingerprint
+        config.populate(_provider({**_BLOB, "unused": 1}))
+        self.assertEqual(fingerprint, config.fingerprint)
+        config.populate(_provider({**_BLOB, "port": 9090}))
+        self.assertNotEqual(fingerprint, config.fingerprint)
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "config.json")
+            with open(path, "w") as file:
+                json.dump(_BLOB, file)
+            config = _Config.new_populated(MockProvider({"SERVICE_CONFIG_JSON_FILE": path}))
+        self.assertEqual(8080, config.Settings.PORT)
+
+    def test_errors(self):
+        with self.assertRaises(FieldValueNotProvidedError):
+            _Config.new_populated(MockProvider({}))
+        with self.assertRaises(CastingError):
+            _Config.new_populated(MockProvider({"SERVICE_CONFIG_JSON": "{"}))
+        with self.assertRaises(CastingError) as cm:
+            _Config.new_populated(_provider({**_BLOB, "port": "port"}))
+        self.assertIn("SERVICE_CONFIG_JSON_PORT", str(cm.exception))
+
+        with self.assertRaises(PopulationError) as cm:
+            _Config().populate(MockProvider({"SERVICE_CONFIG_JSON": "{"}), collect_errors=True)
+        self.assertEqual([CastingError], [error.__class__ for error in cm.exception.errors])
+
+    def test_toml_unavailable(self):
+        # (tomllib is only available on Python 3.11+)
+        with mock.patch.dict(sys.modules, {"tomllib": None, "tomli": None}):
+            with self.assertRaisesRegex(ImportError, "tomli"):
+                minicfg_blob(format="toml")
+
+    def test_invalid_definitions(self):
+        with self.assertRaises(ValueError):
+            minicfg_blob(format="yaml")
+        with self.assertRaises(ValueError):
+            minicfg_blob(pointers={"PORT": "port"})
+
+        @minicfg_blob()
+        class Unnamed(Minicfg):
+            PORT = Field()
+
+        @minicfg_name("NESTED")
+        @minicfg_blob()
+        class Nested(Minicfg):
+            class Child(Minicfg):
+                pass
+
+        @minicfg_name("UNKNOWN")
+        @minicfg_blob(pointers={"OTHER": "/other"})
+        class UnknownPointer(Minicfg):
+            PORT = Field()
+
+        for minicfg_class in (Unnamed, Nested, UnknownPointer):
+            with self.subTest(minicfg_class=minicfg_class.__name__), self.assertRaises(ValueError):
+                minicfg_class()
+
+    def test_blob_key_is_known(self):
+        report = Checker(_Config()).check({"SERVICE_CONFIG_JSON": json.dumps(_BLOB), "SERVICE_OTHER": "1"})
+        self.assertEqual([], report.errors)
+        self.assertEqual(["SERVICE_OTHER"], report.unknown)
+
+        registry = Registry()
+        registry.register(_Config)
+        self.assertEqual({"SERVICE_NAME", "SERVICE_CONFIG_JSON", "SERVICE_CONFIG_JSON_FILE"}, registry.keys())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+from minicfg import Field, Minicfg, minicfg_lazy, minicfg_name
+from minicfg.bulk import RowError, populate_many
+from minicfg.caster import JSONCaster
+from minicfg.field import CastingError, FieldValueNotProvidedError, ValidationError
+from minicfg.minicfg import PopulationError
+from minicfg.validator import Choices, Range
+
+from ._mock_provider import MockProvider
+
+
+@minicfg_name("TENANT")
+class _TenantConfig(Minicfg):
+    NAME = Field()
+    ENABLED: bool = Field(default=False)
+    TIMEOUT: datetime.timedelta = Field(default=datetime.timedelta(seconds=1))
+    QUOTA: int = Field(default=10, validators=[Range(min=0)])
+
+    @minicfg_name("DB")
+    class Database(Minicfg):
+        PORT: int = Field(default=5432)
+        OPTIONS = Field(default={}, caster=JSONCaster(), attach_file_field=True)
+
+
+class TestPopulateMany(unittest.TestCase):
+    def setUp(self):
+        self.columns = {
+            "TENANT_ID": ["1", "2", "3"],  # not a field, ignored
+            "TENANT_NAME": ["a", "b", "c"],
+            "TENANT_ENABLED": ["true", None, "off"],
+            "TENANT_TIMEOUT": ["30s", "30s", "1m"],
+            "TENANT_DB_PORT": ["5433", None, "5434"],
+        }
+
+    def test_columns(self):
+        configs = populate_many(_TenantConfig, self.columns)
+        self.assertEqual(3, len(configs))
+        self.assertEqual(["a", "b", "c"], configs.column("TENANT_NAME"))
+        self.assertEqual([True, False, False], configs.column("TENANT_ENABLED"))
+        self.assertEqual([5433, 5432, 5434], configs.column("TENANT_DB_PORT"))
+        self.assertEqual([10, 10, 10], configs.column("TENANT_QUOTA"))
+        with self.assertRaises(KeyError):
+            configs.column("TENANT_ID")
+
+    def test_instances_equal_populated(self):
+        configs = populate_many(_TenantConfig, self.columns)
+        instances = configs.instances()
+        for index, config in enumerate(instances):
+            row = {name: column[index] for name, column in self.columns.items() if column[index] is not None}
+            expected = _TenantConfig.new_populated(MockProvider(row))
+            self.assertEqual(expected, config)
+            self.assertEqual(expected.TIMEOUT, config.TIMEOUT)
+            self.assertEqual(expected.Database.PORT, config.Database.PORT)
+            self.assertEqual([], expected.diff(config))
+
+        self.assertEqual(instances[2], configs.row(-1))
+        self.assertIsNot(configs.row(2), configs.row(2))
+        with self.assertRaises(IndexError):
+            configs.row(3)
+
+    def test_lazy_child(self):
+        @minicfg_name("TENANT")
+        class Config(Minicfg):
+            NAME = Field()
+
+            @minicfg_lazy
+            @minicfg_name("DB")
+            class Database(Minicfg):
+                PORT: int = Field(default=5432)
+
+        configs = populate_many(Config, self.columns)
+        expected = Config.new_populated(MockProvider({"TENANT_NAME": "a", "TENANT_DB_PORT": "5433"}))
+        row = configs.row(0)
+        self.assertEqual(expected.fingerprint, row.fingerprint)
+        self.assertEqual(expected, row)
+        self.assertEqual(5433, row.Database.PORT)
+        self.assertEqual(expected.Database, row.Database)
+
+    def test_file_field(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "options.json")
+            with open(path, "w") as file:
+                file.write('{"ssl": true}')
+
+            columns = {**self.columns, "TENANT_DB_OPTIONS_FILE": [path, None, path]}
+            configs = populate_many(_TenantConfig, columns)
+
+        self.assertEqual([{"ssl": True}, {}, {"ssl": True}], configs.column("TENANT_DB_OPTIONS"))
+
+    def test_errors(self):
+        columns = {**self.columns, "TENANT_DB_PORT": ["x", None, "5434"], "TENANT_QUOTA": ["1", "-1", "2"]}
+        with self.assertRaises(RowError) as context:
+            populate_many(_TenantConfig, columns)
+        self.assertEqual(0, context.exception.row)
+        self.assertIsInstance(context.exception.error, CastingError)
+
+    def test_validator_type_error(self):
+        @minicfg_name("TENANT")
+        class Config(Minicfg):
+            TAGS = Field(caster=JSONCaster(), item_validators=[Choices(["a", "b"])])
+
+        with self.assertRaises(PopulationError) as context:
+            populate_many(Config, {"TENANT_TAGS": ['["a"]', '[["b"]]']}, collect_errors=True)
+        self.assertEqual([1], [error.row for error in context.exception.errors])
+        self.assertIsInstance(context.exception.errors[0].error, ValidationError)
+
+    def test_collect_errors(self):
+        columns = {
+            **self.columns,
+            "TENANT_NAME": ["a", None, "c"],
+            "TENANT_DB_PORT": ["x", None, "5434"],
+            "TENANT_QUOTA": ["1", "-1", "2"],
+        }
+        with self.assertRaises(PopulationError) as context:
+            populate_many(_TenantConfig, columns, collect_errors=True)
+
+        errors = context.exception.errors
+        self.assertEqual([0, 1, 1], [error.row for error in errors])
+        self.assertEqual(
+            [CastingError, FieldValueNotProvidedError, ValidationError], [type(error.error) for error in errors]
+        )
+
+    def test_invalid_columns(self):
+        with self.assertRaises(ValueError):
+            populate_many(_TenantConfig, {})
+        with self.assertRaises(ValueError):
+            populate_many(_TenantConfig, {"TENANT_NAME": ["a"], "TENANT_QUOTA": ["1", "2"]})
+
+    def test_interpolated(self):
+        class Config(Minicfg):
+            URL = Field(template="${HOST}")
+
+        with self.assertRaises(ValueError):
+            populate_many(Config, {"HOST": ["h"]})
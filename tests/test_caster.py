@@ -1,6 +1,36 @@
+import datetime
+import enum
+import ipaddress
+import pathlib
+import typing
 import unittest
 
-from minicfg.caster import AbstractCaster, BoolCaster, FloatCaster, IntCaster, JSONCaster, ListCaster
+from minicfg.caster import (
+    AbstractCaster,
+    BoolCaster,
+    ByteSizeCaster,
+    DateTimeCaster,
+    DurationCaster,
+    EnumCaster,
+    FloatCaster,
+    IntCaster,
+    IPAddressCaster,
+    IPNetworkCaster,
+    JSONCaster,
+    ListCaster,
+    URLCaster,
+    infer_caster,
+)
+
+
+class _Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class _Level(enum.IntEnum):
+    LOW = 1
+    HIGH = 2
 
 
 class TestIntCaster(unittest.TestCase):
@@ -72,6 +102,34 @@ class TestBoolCaster(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.caster.cast("invalid")
 
+    def test_case_insensitive(self):
+        for value in ["True", "YES", "On", "eNaBlEd"]:
+            self.assertTrue(self.caster.cast(value))
+        for value in ["False", "NO", "Off", "DISABLED"]:
+            self.assertFalse(self.caster.cast(value))
+
+    def test_custom_values(self):
+        class CustomBoolCaster(BoolCaster):
+            true = {"y"}
+            false = {"n"}
+
+        caster = CustomBoolCaster()
+        self.assertTrue(caster.cast("Y"))
+        self.assertFalse(caster.cast("n"))
+        with self.assertRaises(ValueError):
+            caster.cast("yes")
+
+    def test_long_custom_values(self):
+        class CustomBoolCaster(BoolCaster):
+            true = {"definitely-enabled-feature"}
+            false = {"definitely-disabled-feature"}
+
+        caster = CustomBoolCaster()
+        self.assertTrue(caster.cast("Definitely-ENABLED-feature"))
+        self.assertEqual([True, False], caster.cast_many(["DEFINITELY-ENABLED-FEATURE", "definitely-Disabled-feature"]))
+        with self.assertRaises(ValueError):
+            caster.cast_many(["definitely-enabled-feature", "enabled"])
+
 
 class TestListCaster(unittest.TestCase):
     def setUp(self):
@@ -153,6 +211,7 @@ class TestJSONCaster(unittest.TestCase):
 
         caster = JSONCaster(load=custom_load)
         self.assertEqual({"custom": "test"}, caster.cast("test"))
+        self.assertFalse(caster.accepts_bytes)
 
     def test_invalid_json(self):
         json = "bla bla bla"
@@ -160,6 +219,241 @@ class TestJSONCaster(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.caster.cast(json)
 
+    def test_bytes(self):
+        self.assertTrue(self.caster.accepts_bytes)
+        self.assertEqual({"a": [1, 2]}, self.caster.cast(b' {"a": [1, 2]}\n'))
+
+    def test_keys(self):
+        caster = JSONCaster(keys=["a", "b"])
+        self.assertEqual({"a": 1, "b": 2}, caster.cast('{"a": 1, "b": 2, "c": 3}'))
+
+    def test_keys_missing(self):
+        caster = JSONCaster(keys=["a", "b"])
+        with self.assertRaises(ValueError):
+            caster.cast('{"a": 1}')
+
+    def test_keys_not_object(self):
+        caster = JSONCaster(keys=["a"])
+        with self.assertRaises(ValueError):
+            caster.cast("[1, 2]")
+
+
+class TestEnumCaster(unittest.TestCase):
+    def setUp(self):
+        self.caster = EnumCaster(_Color)
+
+    def test_typename(self):
+        self.assertEqual("_Color", self.caster.typename)
+
+    def test_value(self):
+        self.assertEqual(_Color.RED, self.caster.cast("red"))
+
+    def test_name(self):
+        self.assertEqual(_Color.GREEN, self.caster.cast("GREEN"))
+
+    def test_int_value(self):
+        self.assertEqual(_Level.HIGH, EnumCaster(_Level).cast("2"))
+
+    def test_invalid_value(self):
+        with self.assertRaises(ValueError):
+            self.caster.cast("blue")
+
+
+class TestDurationCaster(unittest.TestCase):
+    def setUp(self):
+        self.caster = DurationCaster()
+
+    def test_typename(self):
+        self.assertEqual("duration", self.caster.typename)
+
+    def test_units(self):
+        self.assertEqual(datetime.timedelta(seconds=30), self.caster.cast("30s"))
+        self.assertEqual(datetime.timedelta(milliseconds=500), self.caster.cast("500ms"))
+        self.assertEqual(datetime.timedelta(microseconds=10), self.caster.cast("10us"))
+        self.assertEqual(datetime.timedelta(minutes=5), self.caster.cast("5m"))
+        self.assertEqual(datetime.timedelta(days=1, hours=12), self.caster.cast("1.5d"))
+        self.assertEqual(datetime.timedelta(weeks=2), self.caster.cast("2w"))
+
+    def test_components(self):
+        self.assertEqual(datetime.timedelta(hours=1, minutes=30, seconds=15), self.caster.cast("1h30m15s"))
+
+    def test_seconds(self):
+        self.assertEqual(datetime.timedelta(seconds=2.5), self.caster.cast("2.5"))
+
+    def test_invalid(self):
+        for value in ["", "s", "10x", "10 s", "1h 30m", "h1"]:
+            with self.assertRaises(ValueError, msg=value):
+                self.caster.cast(value)
+
+
+class TestByteSizeCaster(unittest.TestCase):
+    def setUp(self):
+        self.caster = ByteSizeCaster()
+
+    def test_typename(self):
+        self.assertEqual("bytesize", self.caster.typename)
+
+    def test_units(self):
+        self.assertEqual(512, self.caster.cast("512"))
+        self.assertEqual(512, self.caster.cast("512B"))
+        self.assertEqual(10_000, self.caster.cast("10kB"))
+        self.assertEqual(512 * 1024**2, self.caster.cast("512MiB"))
+        self.assertEqual(1_500_000_000, self.caster.cast("1.5GB"))
+        self.assertEqual(2 * 1024**4, self.caster.cast("2 tib"))
+
+    def test_invalid(self):
+        for value in ["", "MB", "10XB", "-1", "1.2.3MB"]:
+            with self.assertRaises(ValueError, msg=value):
+                self.caster.cast(value)
+
+
+class TestURLCaster(unittest.TestCase):
+    def test_typename(self):
+        self.assertEqual("url", URLCaster().typename)
+
+    def test_cast(self):
+        result = URLCaster().cast("postgres://user:password@db:5432/name")
+        self.assertEqual("postgres", result.scheme)
+        self.assertEqual("db", result.hostname)
+        self.assertEqual(5432, result.port)
+        self.assertEqual("/name", result.path)
+
+    def test_schemes(self):
+        caster = URLCaster(schemes=["http", "https"])
+        caster.cast("https://example.com")
+        with self.assertRaises(ValueError):
+            caster.cast("ftp://example.com")
+
+    def test_invalid(self):
+        for value in ["example.com", "http://", "http://example.com:port"]:
+            with self.assertRaises(ValueError, msg=value):
+                URLCaster().cast(value)
+
+
+class TestIPCasters(unittest.TestCase):
+    def test_typename(self):
+        self.assertEqual("ip_address", IPAddressCaster().typename)
+        self.assertEqual("ip_network", IPNetworkCaster().typename)
+
+    def test_address(self):
+        self.assertEqual(ipaddress.IPv4Address("10.0.0.1"), IPAddressCaster().cast("10.0.0.1"))
+        self.assertEqual(ipaddress.IPv6Address("::1"), IPAddressCaster().cast("::1"))
+        with self.assertRaises(ValueError):
+            IPAddressCaster().cast("10.0.0.256")
+
+    def test_network(self):
+        self.assertEqual(ipaddress.IPv4Network("10.0.0.0/8"), IPNetworkCaster().cast("10.0.0.0/8"))
+        with self.assertRaises(ValueError):
+            IPNetworkCaster().cast("10.0.0.1/8")
+        self.assertEqual(ipaddress.IPv4Network("10.0.0.0/8"), IPNetworkCaster(strict=False).cast("10.0.0.1/8"))
+
+    def test_version(self):
+        self.assertEqual("ipv4_address", IPAddressCaster(version=4).typename)
+        self.assertEqual(ipaddress.IPv6Address("::1"), IPAddressCaster(version=6).cast("::1"))
+        with self.assertRaises(ValueError):
+            IPAddressCaster(version=4).cast("::1")
+        self.assertEqual("ipv6_network", IPNetworkCaster(version=6).typename)
+        self.assertEqual(
+            ipaddress.IPv4Network("10.0.0.0/8"), IPNetworkCaster(strict=False, version=4).cast("10.0.0.1/8")
+        )
+        with self.assertRaises(ValueError):
+            IPNetworkCaster(version=6).cast("10.0.0.0/8")
+        with self.assertRaises(ValueError):
+            IPAddressCaster(version=5)
+
+
+class TestDateTimeCaster(unittest.TestCase):
+    def test_typename(self):
+        self.assertEqual("datetime", DateTimeCaster().typename)
+
+    def test_iso(self):
+        self.assertEqual(
+            datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+            DateTimeCaster().cast("2024-01-02T03:04:05+00:00"),
+        )
+
+    def test_format(self):
+        self.assertEqual(datetime.datetime(2024, 1, 2), DateTimeCaster(format="%d.%m.%Y").cast("02.01.2024"))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            DateTimeCaster().cast("yesterday")
+
+
+class TestCastMany(unittest.TestCase):
+    def test_cast_many(self):
+        cases = [
+            (IntCaster(), ["1", "-2"]),
+            (FloatCaster(), ["1.5", "2"]),
+            (BoolCaster(), ["Yes", "off"]),
+            (EnumCaster(_Color), ["red", "GREEN"]),
+            (DurationCaster(), ["1h", "30s", "1h"]),
+            (ByteSizeCaster(), ["1KiB", "2MB"]),
+            (ListCaster(item_caster=IntCaster()), ["1,2", "3"]),
+        ]
+        for caster, values in cases:
+            with self.subTest(caster=caster.__class__.__name__):
+                self.assertEqual([caster.cast(value) for value in values], caster.cast_many(values))
+
+    def test_empty(self):
+        self.assertEqual([], IntCaster().cast_many([]))
+        self.assertEqual([], DurationCaster().cast_many([]))
+
+    def test_invalid(self):
+        for caster in (IntCaster(), BoolCaster(), EnumCaster(_Color), DurationCaster()):
+            with self.subTest(caster=caster.__class__.__name__):
+                with self.assertRaises(ValueError):
+                    caster.cast_many(["1", "invalid"])
+
+
+class TestInferCaster(unittest.TestCase):
+    def test_str(self):
+        self.assertIsNone(infer_caster(str))
+        self.assertIsNone(infer_caster(typing.Any))
+
+    def test_scalars(self):
+        self.assertIsInstance(infer_caster(int), IntCaster)
+        self.assertIsInstance(infer_caster(float), FloatCaster)
+        self.assertIsInstance(infer_caster(bool), BoolCaster)
+
+    def test_singletons(self):
+        self.assertIs(infer_caster(int), infer_caster(int))
+        self.assertIs(infer_caster(list[int]), infer_caster(list[int]))
+        self.assertIs(infer_caster(int), infer_caster(list[int]).item_caster)
+
+    def test_list(self):
+        self.assertEqual("list[str]", infer_caster(list).typename)
+        self.assertEqual("list[str]", infer_caster(list[str]).typename)
+        self.assertEqual([1, 2], infer_caster(list[int]).cast("1,2"))
+        self.assertEqual([1, 2], infer_caster(typing.List[int]).cast("1,2"))
+
+    def test_dict(self):
+        self.assertIsInstance(infer_caster(dict), JSONCaster)
+        self.assertIsInstance(infer_caster(dict[str, int]), JSONCaster)
+
+    def test_optional(self):
+        self.assertIs(infer_caster(int), infer_caster(typing.Optional[int]))
+        self.assertIs(infer_caster(int), infer_caster(int | None))
+
+    def test_enum(self):
+        self.assertEqual(_Color.RED, infer_caster(_Color).cast("red"))
+
+    def test_stdlib_types(self):
+        self.assertIsInstance(infer_caster(datetime.timedelta), DurationCaster)
+        self.assertIsInstance(infer_caster(datetime.datetime), DateTimeCaster)
+        self.assertEqual(4, infer_caster(ipaddress.IPv4Address).version)
+        self.assertEqual(6, infer_caster(ipaddress.IPv6Network).version)
+        with self.assertRaises(ValueError):
+            infer_caster(ipaddress.IPv4Address).cast("::1")
+
+    def test_unsupported(self):
+        # values are left as strings:
+        self.assertIsNone(infer_caster(typing.Union[int, float]))
+        self.assertIsNone(infer_caster(object))
+        self.assertIsNone(infer_caster(pathlib.Path))
+        self.assertIsNone(infer_caster(typing.Literal["a", "b"]))
+        self.assertIsNone(infer_caster(list[pathlib.Path]).item_caster)
+
 
 if __name__ == "__main__":
     unittest.main()
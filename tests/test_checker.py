@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import unittest
+
+from minicfg import Field, Minicfg, minicfg_name
+from minicfg.caster import IntCaster
+from minicfg.checker import Checker, load_env_file, parse_dotenv
+from minicfg.field import CastingError, FieldValueNotProvidedError
+
+
+@minicfg_name("SERVICE")
+class _Config(Minicfg):
+    HOST = Field(attach_file_field=True)
+
+    @minicfg_name("DATABASE")
+    class Database(Minicfg):
+        PORT = Field(caster=IntCaster())
+        NAME = Field(default="db")
+
+
+class TestChecker(unittest.TestCase):
+    def setUp(self):
+        self.checker = Checker(_Config())
+
+    def test_ok(self):
+        report = self.checker.check({"SERVICE_HOST": "localhost", "SERVICE_DATABASE_PORT": "5432"})
+        self.assertTrue(report.ok)
+        self.assertEqual("SERVICE", report.config_name)
+
+    def test_reports_all_errors(self):
+        report = self.checker.check({"SERVICE_DATABASE_PORT": "port"}, source="test.env")
+        self.assertFalse(report.ok)
+        self.assertEqual("test.env", report.source)
+        self.assertEqual(2, len(report.errors))
+        self.assertIsInstance(report.errors[0], FieldValueNotProvidedError)
+        self.assertIsInstance(report.errors[1], CastingError)
+
+    def test_unknown(self):
+        report = self.checker.check(
+            {
+                "SERVICE_HOST_FILE": "/dev/null",
+                "SERVICE_DATABASE_PORT": "5432",
+                "SERVICE_DATABSE_NAME": "typo",
+                "OTHER": "value",
+            }
+        )
+        self.assertEqual([], report.errors)
+        self.assertEqual(["SERVICE_DATABSE_NAME"], report.unknown)
+
+    def test_reuse(self):
+        self.assertFalse(self.checker.check({}).ok)
+        self.assertTrue(self.checker.check({"SERVICE_HOST": "localhost", "SERVICE_DATABASE_PORT": "1"}).ok)
+
+
+class TestEnvFiles(unittest.TestCase):
+    def test_parse_dotenv(self):
+        text = """
+        # comment
+        export A=1
+        B = "quoted # value"
+        C='single'
+        D=value # comment
+        E=
+        """
+        self.assertEqual({"A": "1", "B": "quoted # value", "C": "single", "D": "value", "E": ""}, parse_dotenv(text))
+
+    def test_parse_dotenv_invalid(self):
+        with self.assertRaises(ValueError):
+            parse_dotenv("INVALID")
+
+    def test_load_json(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "env.json")
+            with open(path, "w") as file:
+                json.dump({"A": "1", "B": 2, "C": True, "D": None}, file)
+
+            self.assertEqual({"A": "1", "B": "2", "C": "true"}, load_env_file(path))
+
+    def test_load_dotenv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, ".env")
+            with open(path, "w") as file:
+                file.write("A=1\n")
+
+            self.assertEqual({"A": "1"}, load_env_file(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import base64
+import gzip
+import os
+import tempfile
+import types
+import unittest
+
+from minicfg import Field, Minicfg, minicfg_name
+from minicfg.caster import IntCaster, JSONCaster
+from minicfg.codegen import generate
+from minicfg.decoding import AutoDecompressDecoder, Base64Decoder
+from minicfg.validator import Range
+
+from ._mock_provider import MockProvider
+
+
+@minicfg_name("SERVICE")
+class _Config(Minicfg):
+    NAME = Field(default="service")
+    PORT: int = Field(validators=[Range(min=1)])
+    TOKEN = Field(attach_file_field=True, secret=True)
+    EXTRA = Field(caster=JSONCaster(), attach_file_field=True, default=None)
+    CERT = Field(decoders=[Base64Decoder(), AutoDecompressDecoder()], attach_file_field=True, default=None)
+
+    @minicfg_name("DATABASE")
+    class Database(Minicfg):
+        HOST = Field()
+        PORT = Field(caster=IntCaster(), default=5432)
+
+        class Empty(Minicfg):
+            pass
+
+    class Database_Empty(Minicfg):  # its generated names must not collide with those of Database.Empty
+        FLAG: int = Field(default=1)
+
+
+class _InterpolatedConfig(Minicfg):
+    HOST = Field()
+    URL = Field(template="http://${HOST}")
+
+
+_DATA = {"SERVICE_PORT": "8080", "SERVICE_TOKEN": "token", "SERVICE_DATABASE_HOST": "db"}
+
+
+def _load_module() -> types.ModuleType:
+    module = types.ModuleType("generated_loader")
+    exec(compile(generate(_Config), "generated_loader.py", "exec"), module.__dict__)
+    return module
+
+
+def _to_dict(value) -> dict:
+    """
+    Convert the populated Minicfg instance or the generated value object to a nested dict.
+    """
+
+    if isinstance(value, Minicfg):
+        result = {attr_name: getattr(value, attr_name) for attr_name, _ in value._iter_field_instances()}
+        for attr_name, _ in value._iter_minicfg_classes():
+            result[attr_name] = _to_dict(getattr(value, attr_name))
+        return result
+
+    return {
+        slot: (
+            _to_dict(getattr(value, slot))
+            if type(getattr(value, slot)).__module__ == "generated_loader"
+            else getattr(value, slot)
+        )
+        for slot in value.__slots__
+    }
+
+
+class TestCodegen(unittest.TestCase):
+    def setUp(self):
+        self.module = _load_module()
+
+    def assertSameResult(self, data: dict[str, str]):
+        provider = MockProvider(data)
+        expected_error: Exception | None = None
+        try:
+            expected = _to_dict(_Config.new_populated(provider))
+        except Exception as e:
+            expected_error = e
+
+        if expected_error is None:
+            self.assertEqual(expected, _to_dict(self.module.load(provider)))
+        else:
+            with self.assertRaises(expected_error.__class__) as cm:
+                self.module.load(provider)
+            self.assertEqual(str(expected_error), str(cm.exception))
+
+    def test_values(self):
+        self.assertSameResult(_DATA)
+        self.assertSameResult({**_DATA, "SERVICE_NAME": "name", "SERVICE_EXTRA": '{"a": 1}'})
+
+    def test_missing(self):
+        self.assertSameResult({})
+        self.assertSameResult({"SERVICE_PORT": "8080"})
+
+    def test_casting_error(self):
+        self.assertSameResult({**_DATA, "SERVICE_PORT": "port"})
+
+    def test_validation_error(self):
+        self.assertSameResult({**_DATA, "SERVICE_PORT": "0"})
+
+    def test_file_fields(self):
+        with tempfile.TemporaryDirectory() as directory:
+            token_path = os.path.join(directory, "token")
+            with open(token_path, "w") as file:
+                file.write("token\n")
+            extra_path = os.path.join(directory, "extra.json")
+            with open(extra_path, "w") as file:
+                file.write('{"a": [1, 2]}')
+
+            data = {**_DATA, "SERVICE_TOKEN_FILE": token_path, "SERVICE_EXTRA_FILE": extra_path}
+            del data["SERVICE_TOKEN"]
+            self.assertSameResult(data)
+
+    def test_decoders(self):
+        self.assertSameResult({**_DATA, "SERVICE_CERT": base64.b64encode(gzip.compress(b"cert")).decode()})
+        self.assertSameResult({**_DATA, "SERVICE_CERT": "!"})
+        with tempfile.TemporaryDirectory() as directory:
+            cert_path = os.path.join(directory, "cert")
+            with open(cert_path, "wb") as file:
+                file.write(base64.encodebytes(b"cert\n"))
+            self.assertSameResult({**_DATA, "SERVICE_CERT_FILE": cert_path})
+
+    def test_slots(self):
+        config = self.module.load(MockProvider(_DATA))
+        with self.assertRaises(AttributeError):
+            config.UNKNOWN = 1
+        self.assertEqual(5432, config.Database.PORT)
+        self.assertEqual((), config.Database.Empty.__slots__)
+        self.assertEqual(1, config.Database_Empty.FLAG)
+
+    def test_not_importable(self):
+        class Config(Minicfg):
+            pass
+
+        with self.assertRaises(ValueError):
+            generate(Config)
+
+    def test_interpolated(self):
+        with self.assertRaises(ValueError):
+            generate(_InterpolatedConfig)
+
+    def test_not_minicfg(self):
+        with self.assertRaises(TypeError):
+            generate(object)
+
+
+if __name__ == "__main__":
+    unittest.main()
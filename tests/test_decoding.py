@@ -0,0 +1,132 @@
+import base64
+import bz2
+import gzip
+import lzma
+import os
+import tempfile
+import unittest
+
+from minicfg import Field, Minicfg, minicfg_name
+from minicfg.bulk import RowError, populate_many
+from minicfg.caster import JSONCaster
+from minicfg.decoding import (
+    AutoDecompressDecoder,
+    Base64Decoder,
+    Bz2Decoder,
+    GzipDecoder,
+    LzmaDecoder,
+    _DecoderFailure,
+    decode,
+)
+from minicfg.field import DecodingError
+from minicfg.minicfg import PopulationError
+
+from ._mock_provider import MockProvider
+
+_DATA = b"".join(b"line %d of a large certificate\n" % i for i in range(20000))
+
+
+def _chunks(data: bytes, size: int = 1000) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestDecoders(unittest.TestCase):
+    def test_base64(self):
+        encoded = base64.encodebytes(_DATA)  # with line breaks
+        self.assertEqual(_DATA, decode(_chunks(encoded, 1001), [Base64Decoder()], binary=True))
+
+        encoded = base64.urlsafe_b64encode(b"\xfb\xff\xfe?").rstrip(b"=")
+        self.assertEqual(b"\xfb\xff\xfe?", decode([encoded], [Base64Decoder(urlsafe=True)], binary=True))
+        # padding split across chunks:
+        self.assertEqual(b"a", decode([b"YQ=", b"=\n"], [Base64Decoder()], binary=True))
+
+    def test_base64_invalid(self):
+        for chunks in ([b"YW!j"], [b"YQ==YQ=="], [b"YQ=", b"=YQ"], [b"YW=J"], [b"=YWJj"], [b"YQ==="]):
+            with self.subTest(chunks=chunks), self.assertRaises(_DecoderFailure):
+                decode(chunks, [Base64Decoder()], binary=True)
+
+    def test_decompress(self):
+        for compress, decoder in (
+            (gzip.compress, GzipDecoder()),
+            (bz2.compress, Bz2Decoder()),
+            (lzma.compress, LzmaDecoder()),
+        ):
+            with self.subTest(decoder=decoder.__class__.__name__):
+                compressed = compress(_DATA)
+                self.assertEqual(_DATA, decode(_chunks(compressed), [decoder], binary=True))
+                # concatenated streams:
+                self.assertEqual(_DATA * 2, decode([compressed + compressed], [decoder], binary=True))
+                with self.assertRaises(_DecoderFailure):
+                    decode([compressed[:-10]], [decoder], binary=True)
+
+    def test_bounded_output(self):
+        compressed = gzip.compress(b"\x00" * 10_000_000)
+        sizes = {len(chunk) for chunk in GzipDecoder().decode([compressed])}
+        self.assertLessEqual(max(sizes), 64 * 1024)
+
+    def test_auto_decompress(self):
+        for compress in (gzip.compress, bz2.compress, lzma.compress, lambda data: data):
+            self.assertEqual(_DATA, decode(_chunks(compress(_DATA), 3), [AutoDecompressDecoder()], binary=True))
+        self.assertEqual(b"", decode([], [AutoDecompressDecoder()], binary=True))
+
+    def test_pipeline(self):
+        encoded = base64.b64encode(gzip.compress(_DATA))
+        self.assertEqual(_DATA.decode(), decode([encoded], [Base64Decoder(), AutoDecompressDecoder()], binary=False))
+
+        with self.assertRaises(_DecoderFailure) as cm:
+            decode([b"!!!!"], [Base64Decoder(), GzipDecoder()], binary=True)
+        self.assertIsInstance(cm.exception.decoder, Base64Decoder)
+
+        with self.assertRaises(_DecoderFailure) as cm:
+            decode([base64.b64encode(b"not gzip")], [Base64Decoder(), GzipDecoder()], binary=True)
+        self.assertIsInstance(cm.exception.decoder, GzipDecoder)
+
+
+@minicfg_name("APP")
+class _Config(Minicfg):
+    CERT = Field(decoders=[Base64Decoder(), AutoDecompressDecoder()], attach_file_field=True, default=None)
+    OPTIONS = Field(caster=JSONCaster(), decoders=[GzipDecoder()], attach_file_field=True, default=None)
+
+
+class TestFieldDecoders(unittest.TestCase):
+    def test_provided_value(self):
+        provider = MockProvider({"APP_CERT": base64.b64encode(gzip.compress(b"  cert\n")).decode()})
+        config = _Config.new_populated(provider)
+        self.assertEqual("cert", config.CERT)
+        self.assertEqual("cert", config._raw_values["CERT"])
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cert_path = os.path.join(directory, "cert")
+            with open(cert_path, "wb") as file:
+                file.write(base64.encodebytes(bz2.compress(_DATA)))
+            options_path = os.path.join(directory, "options")
+            with open(options_path, "wb") as file:
+                file.write(gzip.compress(b'{"a": 1}'))
+
+            config = _Config.new_populated(MockProvider({"APP_CERT_FILE": cert_path, "APP_OPTIONS_FILE": options_path}))
+        self.assertEqual(_DATA.decode().strip(), config.CERT)
+        self.assertEqual({"a": 1}, config.OPTIONS)
+
+    def test_error(self):
+        with self.assertRaises(DecodingError) as cm:
+            _Config.new_populated(MockProvider({"APP_CERT": base64.b64encode(b"\xff").decode()}))  # invalid UTF-8
+        self.assertIn("APP_CERT using AutoDecompressDecoder", str(cm.exception))
+
+        with self.assertRaises(PopulationError) as cm:
+            _Config().populate(MockProvider({"APP_CERT": "!", "APP_OPTIONS": "{}"}), collect_errors=True)
+        self.assertEqual([DecodingError, DecodingError], [error.__class__ for error in cm.exception.errors])
+
+    def test_populate_many(self):
+        cert = base64.b64encode(lzma.compress(b"cert")).decode()
+        configs = populate_many(_Config, {"APP_CERT": [cert, None]})
+        self.assertEqual(["cert", None], configs.column("APP_CERT"))
+
+        with self.assertRaises(RowError) as cm:
+            populate_many(_Config, {"APP_CERT": [cert, "!"]})
+        self.assertEqual(1, cm.exception.row)
+        self.assertIsInstance(cm.exception.error, DecodingError)
+
+
+if __name__ == "__main__":
+    unittest.main()
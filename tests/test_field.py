@@ -1,8 +1,11 @@
+import os
+import tempfile
 import unittest
 import unittest.mock
 
-from minicfg.caster import AbstractCaster
-from minicfg.field import NO_DEFAULT_VALUE, CastingError, Field, FieldValueNotProvidedError
+from minicfg.caster import AbstractCaster, IntCaster, JSONCaster, ListCaster
+from minicfg.field import NO_DEFAULT_VALUE, CastingError, Field, FieldValueNotProvidedError, ValidationError
+from minicfg.validator import Choices, Length, Pattern, Range
 
 from ._mock_provider import MockProvider
 
@@ -98,6 +101,79 @@ class TestField(unittest.TestCase):
         field.populate(provider)
         self.assertEqual(field.value, "default value")
 
+    def test_populate_with_file_field_bytes(self):
+        class BytesCaster(AbstractCaster):
+            accepts_bytes = True
+
+            def typename(self) -> str | None:
+                return None
+
+            def cast(self, value: bytes) -> bytes:
+                return value
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "value.json")
+            with open(path, "wb") as file:
+                file.write(b' {"a": 1}\n')
+
+            provider = MockProvider({"test_field_FILE": path})
+            field = Field(name="test_field", caster=BytesCaster(), attach_file_field=True)
+            field.populate(provider)
+            self.assertEqual(b' {"a": 1}\n', field.value)
+
+            field = Field(name="test_field", caster=JSONCaster(), attach_file_field=True)
+            field.populate(provider)
+            self.assertEqual({"a": 1}, field.value)
+
+            # custom load functions are given stripped strings, as without bytes support:
+            field = Field(name="test_field", caster=JSONCaster(load=str.upper), attach_file_field=True)
+            field.populate(provider)
+            self.assertEqual('{"A": 1}', field.value)
+
+    def test_populate_with_validators(self):
+        field = Field(name="test_field", caster=IntCaster(), validators=[Range(min=1, max=10)])
+        field.populate(MockProvider({"test_field": "5"}))
+        self.assertEqual(5, field.value)
+
+        with self.assertRaisesRegex(ValidationError, "test_field"):
+            field.populate(MockProvider({"test_field": "11"}))
+
+    def test_populate_default_not_validated(self):
+        field = Field(name="test_field", default=0, validators=[Range(min=1)])
+        field.populate(MockProvider({}))
+        self.assertEqual(0, field.value)
+
+    def test_populate_with_item_validators(self):
+        field = Field(
+            name="test_field",
+            caster=ListCaster(item_caster=IntCaster()),
+            validators=[Length(max=3)],
+            item_validators=[Choices([1, 2, 3])],
+        )
+        field.populate(MockProvider({"test_field": "1,2,3"}))
+        self.assertEqual([1, 2, 3], field.value)
+
+        with self.assertRaises(ValidationError):
+            field.populate(MockProvider({"test_field": "1,2,4"}))
+        with self.assertRaises(ValidationError):
+            field.populate(MockProvider({"test_field": "1,2,3,1"}))
+
+    def test_validator_type_error(self):
+        # values of a type the validator cannot check are rejected as invalid:
+        field = Field(name="test_field", caster=IntCaster(), validators=[Pattern(r"\d+")])
+        with self.assertRaisesRegex(ValidationError, "test_field"):
+            field.populate(MockProvider({"test_field": "1"}))
+
+        field = Field(name="test_field", caster=JSONCaster(), item_validators=[Choices([1, 2])])
+        with self.assertRaises(ValidationError):
+            field.populate(MockProvider({"test_field": "[1, [2]]"}))
+
+    def test_validation_error_secret(self):
+        field = Field(name="test_field", secret=True, validators=[Length(min=8)])
+        with self.assertRaises(ValidationError) as cm:
+            field.populate(MockProvider({"test_field": "hunter2"}))
+        self.assertNotIn("hunter2", str(cm.exception))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+
+from minicfg import Field, Minicfg, minicfg_name
+from minicfg.field import CastingError
+from minicfg.minicfg import FieldChange
+
+from ._mock_provider import MockProvider
+
+
+@minicfg_name("APP")
+class _Config(Minicfg):
+    PORT: int = Field(default=80)
+    TOKEN = Field(default="token", secret=True)
+
+    @minicfg_name("DB")
+    class Database(Minicfg):
+        HOST = Field(default="db")
+        PORT: int = Field(default=5432)
+
+    @minicfg_name("CACHE")
+    class Cache(Minicfg):
+        SIZE: int = Field(default=100)
+
+
+class TestHistory(unittest.TestCase):
+    def setUp(self):
+        self.config = _Config.new_populated(MockProvider({}))
+        self.history = self.config.enable_history(max_versions=3)
+
+    def test_record(self):
+        self.assertIs(self.history, self.config.history)
+        self.assertEqual([1], [version.number for version in self.history.versions])
+
+        self.config.populate(MockProvider({"APP_PORT": "81"}))
+        self.config.populate(MockProvider({"APP_PORT": "81"}))  # unchanged, not recorded
+        self.assertEqual([1, 2], [version.number for version in self.history.versions])
+        self.assertEqual(self.config.fingerprint, self.history.current.fingerprint)
+        self.assertLessEqual(self.history.versions[0].timestamp, self.history.versions[1].timestamp)
+
+    def test_bounded(self):
+        for port in range(81, 86):
+            self.config.populate(MockProvider({"APP_PORT": str(port)}))
+        self.assertEqual([4, 5, 6], [version.number for version in self.history.versions])
+
+    def test_structural_sharing(self):
+        self.config.populate(MockProvider({"APP_DB_HOST": "other"}))
+        (_, old_node), (_, new_node) = self.history._versions
+        self.assertIsNot(old_node, new_node)
+        self.assertIsNot(old_node.children[1], new_node.children[1])  # Database changed
+        self.assertIs(old_node.children[0], new_node.children[0])  # Cache is shared
+
+    def test_rollback(self):
+        old_values = (self.config.PORT, self.config.Database.HOST)
+        old_fingerprint = self.config.fingerprint
+        self.config.populate(MockProvider({"APP_PORT": "81", "APP_DB_HOST": "other"}))
+
+        version = self.history.rollback()
+        self.assertEqual(3, version.number)
+        self.assertEqual(old_values, (self.config.PORT, self.config.Database.HOST))
+        self.assertEqual(old_fingerprint, self.config.fingerprint)
+        self.assertEqual(_Config.new_populated(MockProvider({})), self.config)
+
+        # the rollback can be rolled back too:
+        self.history.rollback()
+        self.assertEqual(81, self.config.PORT)
+        self.assertEqual("other", self.config.Database.HOST)
+
+        with self.assertRaises(IndexError):
+            self.history.rollback(3)
+
+    def test_rollback_failed_population(self):
+        with self.assertRaises(CastingError):
+            self.config.populate(MockProvider({"APP_CACHE_SIZE": "1", "APP_DB_PORT": "x"}))
+        self.assertEqual(1, self.config.Cache.SIZE)
+
+        self.history.rollback(0)
+        self.assertEqual(100, self.config.Cache.SIZE)
+        self.assertEqual(1, len(self.history))
+
+    def test_diff(self):
+        self.config.populate(MockProvider({"APP_PORT": "81", "APP_TOKEN": "secret"}))
+        self.config.populate(MockProvider({"APP_PORT": "81", "APP_TOKEN": "secret", "APP_CACHE_SIZE": "5"}))
+
+        self.assertEqual(
+            [
+                FieldChange(name="APP_PORT", old=80, new=81),
+                FieldChange(name="APP_TOKEN", old="******", new="******"),
+                FieldChange(name="APP_CACHE_SIZE", old=100, new=5),
+            ],
+            self.history.diff(1, 3),
+        )
+        self.assertEqual([FieldChange(name="APP_CACHE_SIZE", old=5, new=100)], self.history.diff(3, 2))
+        with self.assertRaises(KeyError):
+            self.history.diff(1, 4)
+
+    def test_not_populated(self):
+        with self.assertRaises(ValueError):
+            _Config().enable_history()
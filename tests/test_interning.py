@@ -0,0 +1,109 @@
+import unittest
+
+from minicfg import Field, Minicfg, minicfg_lazy, minicfg_name
+from minicfg.bulk import populate_many
+from minicfg.caster import JSONCaster, ListCaster
+from minicfg.interning import FrozenDict, Interner
+
+from ._mock_provider import MockProvider
+
+
+@minicfg_name("TENANT")
+class _TenantConfig(Minicfg):
+    HOST = Field()
+    PORT: int = Field(default=80)
+    HOSTS = Field(caster=ListCaster(), default=[])
+    OPTIONS = Field(caster=JSONCaster(), default={})
+
+    @minicfg_name("CACHE")
+    @minicfg_lazy
+    class Cache(Minicfg):
+        URL = Field(default="redis://cache")
+
+
+def _provider(host: str) -> MockProvider:
+    return MockProvider(
+        {
+            "TENANT_HOST": host,
+            "TENANT_PORT": "8080",
+            "TENANT_HOSTS": "a,b",
+            "TENANT_OPTIONS": '{"pool": {"size": 10}, "hosts": ["a"]}',
+            "TENANT_CACHE_URL": "redis://" + host,
+        }
+    )
+
+
+class TestInterner(unittest.TestCase):
+    def test_intern(self):
+        interner = Interner()
+        value = "".join(["ho", "st"])
+        self.assertIs(value, interner.intern(value))
+        self.assertIs(value, interner.intern("".join(["ho", "st"])))
+        self.assertEqual((1, 1), (interner.misses, interner.hits))
+        self.assertEqual(1, len(interner))
+
+        interner.clear()
+        self.assertEqual(0, len(interner))
+
+    def test_types_are_not_mixed(self):
+        interner = Interner()
+        self.assertIs(True, interner.intern(True))
+        self.assertIs(int, type(interner.intern(1)))
+        self.assertIs(float, type(interner.intern(1.0)))
+        self.assertEqual((1, True), interner.intern((1, True)))
+        self.assertIs(float, type(interner.intern((1.0, 1))[0]))
+
+    def test_mutable_values_are_not_shared(self):
+        interner = Interner()
+        value = [1, 2]
+        self.assertIs(value, interner.intern(value))
+        self.assertIsNot(value, interner.intern([1, 2]))
+        self.assertEqual(0, len(interner))
+
+    def test_freeze(self):
+        interner = Interner(freeze=True)
+        value = interner.intern({"hosts": ["a", "b"], "pool": {"size": 10}})
+        self.assertEqual(FrozenDict({"hosts": ("a", "b"), "pool": FrozenDict({"size": 10})}), value)
+        self.assertIs(value, interner.intern({"pool": {"size": 10}, "hosts": ["a", "b"]}))
+        self.assertEqual(hash(value), hash(FrozenDict(value)))
+        with self.assertRaises(TypeError):
+            value["hosts"] = ()
+
+
+class TestPopulateInterned(unittest.TestCase):
+    def test_populate(self):
+        interner = Interner(freeze=True)
+        first, second = _TenantConfig(), _TenantConfig()
+        first.populate(_provider("one"), interner=interner)
+        second.populate(_provider("two"), interner=interner)
+
+        self.assertEqual("one", first.HOST)
+        self.assertEqual("two", second.HOST)
+        self.assertIs(first.PORT, second.PORT)
+        self.assertEqual(("a", "b"), second.HOSTS)
+        self.assertIs(first.HOSTS, second.HOSTS)
+        self.assertIs(first.OPTIONS, second.OPTIONS)
+        self.assertIs(first._raw_values["OPTIONS"], second._raw_values["OPTIONS"])
+
+        # lazy child minicfgs are interned on first access:
+        self.assertIs(first.Cache.URL, interner.intern("redis://one"))
+
+    def test_fingerprint_is_unchanged(self):
+        config = _TenantConfig.new_populated(_provider("one"))
+        interned = _TenantConfig()
+        interned.populate(_provider("one"), interner=Interner(freeze=True))
+        self.assertEqual(config.fingerprint, interned.fingerprint)
+
+    def test_populate_many(self):
+        interner = Interner()
+        configs = populate_many(
+            _TenantConfig, {"TENANT_HOST": ["one", "two"], "TENANT_HOSTS": ["a,b", "a,b"]}, interner=interner
+        )
+        first, second = configs.instances()
+        self.assertIs(first.PORT, second.PORT)
+        self.assertIs(first._raw_values["HOSTS"], second._raw_values["HOSTS"])
+        self.assertIsNot(first.HOSTS, second.HOSTS)  # lists are not frozen
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+
+from minicfg import Field, Minicfg, minicfg_name
+from minicfg.field import FieldValueNotProvidedError
+from minicfg.interpolation import InterpolationError, Template
+from minicfg.minicfg import PopulationError
+
+from ._mock_provider import MockProvider
+
+
+class _CountingProvider(MockProvider):
+    """
+    A mock provider counting lookups of each key.
+    """
+
+    def __init__(self, data: dict[str, str]):
+        super().__init__(data)
+        self.calls: dict[str, int] = {}
+
+    def get(self, key: str) -> str | None:
+        self.calls[key] = self.calls.get(key, 0) + 1
+        return super().get(key)
+
+
+class TestTemplate(unittest.TestCase):
+    def test_render(self):
+        template = Template("postgres://${USER}@${HOST}:${PORT}/${USER}")
+        self.assertEqual(("USER", "HOST", "PORT"), template.references)
+        self.assertEqual("postgres://u@h:p/u", template.render(lambda name: name[0].lower()))
+
+    def test_escape(self):
+        template = Template("$${NOT_A_REFERENCE} costs $5 and ${PRICE}$$")
+        self.assertEqual(("PRICE",), template.references)
+        self.assertEqual("${NOT_A_REFERENCE} costs $5 and 10$", template.render(lambda name: "10"))
+
+    def test_no_references(self):
+        template = Template("plain")
+        self.assertEqual((), template.references)
+        self.assertEqual("plain", template.render(lambda name: self.fail("unexpected reference")))
+
+    def test_empty_reference(self):
+        with self.assertRaises(ValueError):
+            Template("${}")
+
+
+class TestInterpolation(unittest.TestCase):
+    def setUp(self):
+        @minicfg_name("APP")
+        class Config(Minicfg):
+            DATABASE_URL = Field(template="postgres://${APP_DB_USER}@${APP_DB_HOST}:${APP_DB_PORT}")
+            GREETING = Field(interpolate=True, default="hello")
+
+            @minicfg_name("DB")
+            class Database(Minicfg):
+                USER = Field()
+                HOST = Field()
+                PORT: int = Field(default=5432)
+
+        self.Config = Config
+        self.data = {"APP_DB_USER": "user", "APP_DB_HOST": "db"}
+
+    def test_template(self):
+        config = self.Config.new_populated(MockProvider(self.data))
+        self.assertEqual("postgres://user@db:5432", config.DATABASE_URL)
+        self.assertEqual("hello", config.GREETING)
+
+    def test_provided_value_overrides_template(self):
+        config = self.Config.new_populated(MockProvider({**self.data, "APP_DATABASE_URL": "sqlite://"}))
+        self.assertEqual("sqlite://", config.DATABASE_URL)
+
+    def test_interpolate_provided_value(self):
+        provider = MockProvider({**self.data, "APP_GREETING": "hello ${APP_DB_USER} from ${HOSTNAME}", "HOSTNAME": "h"})
+        config = self.Config.new_populated(provider)
+        self.assertEqual("hello user from h", config.GREETING)
+
+    def test_values_resolved_once(self):
+        provider = _CountingProvider({**self.data, "APP_GREETING": "${APP_DATABASE_URL} ${APP_DB_USER}"})
+        config = self.Config.new_populated(provider)
+        self.assertEqual("postgres://user@db:5432 user", config.GREETING)
+        self.assertTrue(all(calls == 1 for calls in provider.calls.values()), provider.calls)
+
+    def test_missing_reference(self):
+        with self.assertRaisesRegex(InterpolationError, "APP_DATABASE_URL.*APP_DB_USER is not provided"):
+            self.Config.new_populated(MockProvider({"APP_DB_HOST": "db"}))
+
+    def test_collect_errors(self):
+        with self.assertRaises(PopulationError) as context:
+            self.Config().populate(MockProvider({"APP_DB_HOST": "db"}), collect_errors=True)
+        # APP_DATABASE_URL cannot be interpolated and APP_DB_USER is not provided:
+        self.assertEqual(
+            [InterpolationError, FieldValueNotProvidedError], [type(error) for error in context.exception.errors]
+        )
+
+    def test_template_cycle(self):
+        class Config(Minicfg):
+            A = Field(template="${B}")
+            B = Field(template="x${C}")
+            C = Field(template="${A}")
+
+        # cycles of templates are detected before any value is looked up:
+        with self.assertRaisesRegex(InterpolationError, "reference cycle A -> B -> C -> A"):
+            Config.new_populated(MockProvider({"C": "c"}))
+
+    def test_provided_value_cycle(self):
+        class Config(Minicfg):
+            URL = Field(template="${USER}@host")
+            USER = Field(interpolate=True)
+
+        with self.assertRaisesRegex(InterpolationError, "reference cycle URL -> USER -> URL"):
+            Config.new_populated(MockProvider({"USER": "${URL}"}))
+
+    def test_dependents_of(self):
+        config = self.Config.new_populated(MockProvider({**self.data, "APP_GREETING": "hi ${APP_DATABASE_URL}"}))
+        self.assertEqual({"APP_DATABASE_URL", "APP_GREETING"}, config.dependents_of(["APP_DB_HOST"]))
+        self.assertEqual({"APP_GREETING"}, config.dependents_of(["APP_DATABASE_URL"]))
+        self.assertEqual(set(), config.dependents_of(["APP_GREETING"]))
+
+        # references of provided values are taken from the last population:
+        config.populate(MockProvider(self.data))
+        self.assertEqual({"APP_DATABASE_URL"}, config.dependents_of(["APP_DB_HOST"]))
+
+    def test_no_interpolated_fields(self):
+        class Config(Minicfg):
+            A = Field()
+
+        config = Config.new_populated(MockProvider({"A": "${B}"}))
+        self.assertEqual("${B}", config.A)
+        self.assertEqual(set(), config.dependents_of(["B"]))
+
+    def test_template_with_file_field(self):
+        with self.assertRaises(ValueError):
+            Field(template="${A}", attach_file_field=True)
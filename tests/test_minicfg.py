@@ -1,9 +1,16 @@
+import pathlib
+import threading
 import unittest
 import unittest.mock
+from typing import Optional
 
-from minicfg import Field, Minicfg, minicfg_name
-from minicfg.minicfg import _DEFAULT_NAME_SEP, minicfg_name_sep
+from minicfg import Field, Minicfg, minicfg_lazy, minicfg_name
+from minicfg.caster import FloatCaster, IntCaster, JSONCaster, infer_caster
+from minicfg.field import FieldValueNotProvidedError, ValidationError
+from minicfg.interning import FrozenDict
+from minicfg.minicfg import _DEFAULT_NAME_SEP, FieldChange, FrozenMinicfg, PopulationError, minicfg_name_sep
 from minicfg.provider import AbstractProvider
+from minicfg.validator import Range
 
 from ._mock_provider import MockProvider
 
@@ -51,6 +58,18 @@ class TestMinicfg(unittest.TestCase):
         config = Config()
         self.assertEqual(f"config_field_name_FILE", config.field_name.file_field.name)
 
+    def test_init_twice(self):
+        @minicfg_name("config")
+        class Config(Minicfg):
+            @minicfg_name("nested")
+            class Nested(Minicfg):
+                field_name = Field(attach_file_field=True)
+
+        Config()
+        config = Config()
+        self.assertEqual("config_nested_field_name", config.Nested.field_name.name)
+        self.assertEqual("config_nested_field_name_FILE", config.Nested.field_name.file_field.name)
+
     def test_init_nested_sep(self):
         sep1 = "-"
         sep2 = "_"
@@ -111,6 +130,40 @@ class TestMinicfg(unittest.TestCase):
         self.assertEqual("2", config.Nested1.field_name)
         self.assertEqual("3", config.Nested1.Nested2.field_name)
 
+    def test_populate_collect_errors(self):
+        class Config(Minicfg):
+            missing = Field()
+            provided = Field()
+
+            class Child(Minicfg):
+                child_missing = Field()
+
+        config = Config()
+        with self.assertRaises(PopulationError) as cm:
+            config.populate(MockProvider({"provided": "hello"}), collect_errors=True)
+
+        self.assertEqual(2, len(cm.exception.errors))
+        self.assertTrue(all(isinstance(e, FieldValueNotProvidedError) for e in cm.exception.errors))
+        self.assertEqual("hello", config.provided)
+
+    def test_populate_collect_validation_errors(self):
+        class Config(Minicfg):
+            port: int = Field(validators=[Range(min=1)])
+            missing = Field()
+
+        with self.assertRaises(PopulationError) as cm:
+            Config().populate(MockProvider({"port": "0"}), collect_errors=True)
+
+        self.assertEqual(2, len(cm.exception.errors))
+        self.assertIsInstance(cm.exception.errors[1], ValidationError)
+
+    def test_populate_raises_first_error(self):
+        class Config(Minicfg):
+            missing = Field()
+
+        with self.assertRaises(FieldValueNotProvidedError):
+            Config().populate(MockProvider({}))
+
     def test_iter(self):
         class Config(Minicfg):
             field_name = Field()
@@ -124,6 +177,435 @@ class TestMinicfg(unittest.TestCase):
             self.assertTrue(isinstance(child, Field) or isinstance(child, Minicfg))
 
 
+class _BlockingProvider(AbstractProvider):
+    """
+    A provider which blocks lookups of the given keys until released.
+    """
+
+    def __init__(self, data: dict[str, str], blocking_keys: set[str]):
+        self.data = data
+        self.blocking_keys = blocking_keys
+        self.release = threading.Event()
+
+    def get(self, key: str) -> str | None:
+        if key in self.blocking_keys:
+            self.release.wait(timeout=5)
+        return self.data.get(key)
+
+
+class TestPrefetch(unittest.TestCase):
+    def test_prefetch(self):
+        class Config(Minicfg):
+            A = Field()
+
+            class Child(Minicfg):
+                B = Field()
+
+        provider = _BlockingProvider({"A": "a", "B": "b"}, {"B"})
+        handle = Config.prefetch(provider)
+
+        self.assertEqual("a", handle.A)  # available before the whole tree is populated
+        self.assertFalse(handle.done())
+        with self.assertRaises(TimeoutError):
+            handle.result(timeout=0.01)
+
+        provider.release.set()
+        self.assertEqual("b", handle.Child.B)
+        self.assertTrue(handle.done())
+        self.assertIsInstance(handle.result(), Config)
+
+    def test_prefetch_error(self):
+        class Config(Minicfg):
+            A = Field()
+            B = Field()
+
+        handle = Config.prefetch(MockProvider({"B": "b"}))
+        with self.assertRaises(FieldValueNotProvidedError):
+            handle.result()
+        with self.assertRaises(FieldValueNotProvidedError):
+            handle.B
+
+
+class TestFingerprint(unittest.TestCase):
+    def setUp(self):
+        @minicfg_name("APP")
+        class Config(Minicfg):
+            PORT: int = Field()
+            TOKEN = Field(secret=True)
+            NAME = Field(default="app")
+
+            @minicfg_name("DB")
+            class Database(Minicfg):
+                HOST = Field()
+
+            @minicfg_name("CACHE")
+            class Cache(Minicfg):
+                HOST = Field()
+
+        self.Config = Config
+        self.data = {"APP_PORT": "80", "APP_TOKEN": "secret", "APP_DB_HOST": "db", "APP_CACHE_HOST": "cache"}
+
+    def test_not_populated(self):
+        config = self.Config()
+        self.assertIsNone(config.fingerprint)
+        self.assertEqual(config, config)
+        self.assertNotEqual(config, self.Config())
+        with self.assertRaises(ValueError):
+            config.diff(self.Config())
+
+    def test_equal(self):
+        config1 = self.Config.new_populated(MockProvider(self.data))
+        config2 = self.Config.new_populated(MockProvider(self.data))
+        self.assertEqual(config1.fingerprint, config2.fingerprint)
+        self.assertEqual(config1, config2)
+        self.assertEqual(hash(config1), hash(config2))
+        self.assertEqual(config1.Database.fingerprint, config2.Database.fingerprint)
+        self.assertEqual([], config1.diff(config2))
+
+    def test_diff(self):
+        config1 = self.Config.new_populated(MockProvider(self.data))
+        config2 = self.Config.new_populated(
+            MockProvider({**self.data, "APP_PORT": "81", "APP_TOKEN": "new", "APP_DB_HOST": "db2", "APP_NAME": "x"})
+        )
+
+        self.assertNotEqual(config1, config2)
+        self.assertNotEqual(config1.Database.fingerprint, config2.Database.fingerprint)
+        self.assertEqual(config1.Cache.fingerprint, config2.Cache.fingerprint)
+        self.assertEqual(
+            [
+                FieldChange(name="APP_NAME", old="app", new="x"),
+                FieldChange(name="APP_PORT", old=80, new=81),
+                FieldChange(name="APP_TOKEN", old="******", new="******"),
+                FieldChange(name="APP_DB_HOST", old="db", new="db2"),
+            ],
+            config1.diff(config2),
+        )
+
+    def test_diff_skips_unchanged_subtrees(self):
+        config1 = self.Config.new_populated(MockProvider(self.data))
+        config2 = self.Config.new_populated(MockProvider({**self.data, "APP_DB_HOST": "db2"}))
+
+        # fields of the unchanged Cache subtree must not be compared:
+        with unittest.mock.patch.object(self.Config.Cache, "_iter_field_instances", side_effect=AssertionError):
+            self.assertEqual([FieldChange(name="APP_DB_HOST", old="db", new="db2")], config1.diff(config2))
+
+    def test_diff_different_classes(self):
+        class Other(Minicfg):
+            pass
+
+        with self.assertRaises(TypeError):
+            self.Config().diff(Other())
+
+
+class TestFreeze(unittest.TestCase):
+    def setUp(self):
+        @minicfg_name("APP")
+        class Config(Minicfg):
+            PORT: int = Field()
+            NAME = Field(default="app")
+
+            @minicfg_name("DB")
+            class Database(Minicfg):
+                HOST = Field()
+
+        self.Config = Config
+        self.config = Config.new_populated(MockProvider({"APP_PORT": "80", "APP_DB_HOST": "db"}))
+
+    def test_freeze(self):
+        frozen = self.config.freeze()
+        self.assertIsInstance(frozen, FrozenMinicfg)
+        self.assertEqual("FrozenConfig", frozen.__class__.__name__)
+        self.assertEqual(80, frozen.PORT)
+        self.assertEqual("app", frozen.NAME)
+        self.assertEqual("db", frozen.Database.HOST)
+        self.assertEqual(self.config.fingerprint, frozen.fingerprint)
+        self.assertFalse(hasattr(frozen, "__dict__"))
+
+    def test_read_only(self):
+        frozen = self.config.freeze()
+        with self.assertRaises(AttributeError):
+            frozen.PORT = 81
+        with self.assertRaises(AttributeError):
+            frozen.Database.HOST = "other"
+        with self.assertRaises(AttributeError):
+            frozen.OTHER = 1
+        with self.assertRaises(AttributeError):
+            del frozen.NAME
+        self.assertEqual(80, frozen.PORT)
+
+    def test_containers_copied(self):
+        @minicfg_name("APP")
+        class Config(Minicfg):
+            HOSTS: list[str] = Field()
+            OPTIONS = Field(caster=JSONCaster())
+
+        config = Config.new_populated(MockProvider({"APP_HOSTS": "a,b", "APP_OPTIONS": '{"ports": [1, 2]}'}))
+        frozen = config.freeze()
+        self.assertEqual(("a", "b"), frozen.HOSTS)
+        self.assertEqual(FrozenDict({"ports": (1, 2)}), frozen.OPTIONS)
+        with self.assertRaises(AttributeError):
+            frozen.HOSTS.append("c")
+        with self.assertRaises(TypeError):
+            frozen.OPTIONS["ports"] = []
+        self.assertEqual(["a", "b"], config.HOSTS)
+
+    def test_frozen_class_generated_once(self):
+        frozen1 = self.config.freeze()
+        frozen2 = self.Config.new_populated(MockProvider({"APP_PORT": "81", "APP_DB_HOST": "db"})).freeze()
+        self.assertIs(frozen1.__class__, frozen2.__class__)
+        self.assertIs(frozen1.Database.__class__, frozen2.Database.__class__)
+        self.assertNotEqual(frozen1, frozen2)
+        self.assertEqual(frozen1, self.config.freeze())
+        self.assertEqual(hash(frozen1), hash(self.config.freeze()))
+
+    def test_not_populated(self):
+        with self.assertRaises(ValueError):
+            self.Config().freeze()
+
+
+class _CountingProvider(MockProvider):
+    """
+    A mock provider recording lookups.
+    """
+
+    def __init__(self, data: dict[str, str]):
+        super().__init__(data)
+        self.lookups: list[str] = []
+
+    def get(self, key: str) -> str | None:
+        self.lookups.append(key)
+        return super().get(key)
+
+
+class TestLazyChild(unittest.TestCase):
+    def setUp(self):
+        @minicfg_name("APP")
+        class Config(Minicfg):
+            NAME = Field(default="app")
+
+            @minicfg_lazy
+            @minicfg_name("REPORTS")
+            class Reports(Minicfg):
+                BUCKET = Field()
+                RETENTION: int = Field(default=30)
+
+                @minicfg_name("MAIL")
+                class Mail(Minicfg):
+                    HOST = Field()
+
+        self.Config = Config
+        self.provider = _CountingProvider({"APP_REPORTS_BUCKET": "reports", "APP_REPORTS_MAIL_HOST": "mail"})
+
+    def test_populated_on_first_access(self):
+        config = self.Config.new_populated(self.provider)
+        self.assertEqual(["APP_NAME"], self.provider.lookups)
+        self.assertNotIn("Reports", vars(config))
+
+        self.assertEqual("reports", config.Reports.BUCKET)
+        self.assertEqual(30, config.Reports.RETENTION)
+        self.assertEqual("mail", config.Reports.Mail.HOST)
+        self.assertIs(config.Reports, config.Reports)
+        self.assertEqual(4, len(self.provider.lookups))
+
+    def test_names_generated_with_parent(self):
+        self.Config()
+        self.assertIs(self.Config.Reports, self.Config.__dict__["Reports"].__get__(None, self.Config))
+        self.assertEqual("APP_REPORTS_BUCKET", self.Config.Reports.BUCKET.name)
+        self.assertEqual("APP_REPORTS_MAIL_HOST", self.Config.Reports.Mail.HOST.name)
+
+    def test_error_on_first_access(self):
+        config = self.Config.new_populated(MockProvider({}))
+        with self.assertRaises(FieldValueNotProvidedError):
+            config.Reports
+
+        # the child minicfg is populated again on the next access:
+        config.populate(self.provider)
+        self.assertEqual("reports", config.Reports.BUCKET)
+
+    def test_populate_again(self):
+        config = self.Config.new_populated(self.provider)
+        reports = config.Reports
+
+        # the child minicfg in use is populated together with its parent:
+        config.populate(MockProvider({"APP_REPORTS_BUCKET": "other", "APP_REPORTS_MAIL_HOST": "mail"}))
+        self.assertIs(reports, config.Reports)
+        self.assertEqual("other", reports.BUCKET)
+
+    def test_populate_only_not_accessed(self):
+        config = self.Config.new_populated(self.provider)
+        config.populate(MockProvider({"APP_REPORTS_BUCKET": "new", "APP_REPORTS_MAIL_HOST": "mail"}), only=["Reports"])
+        self.assertNotIn("Reports", vars(config))
+        self.assertEqual("new", config.Reports.BUCKET)
+
+    def test_compared_once_populated(self):
+        config = self.Config.new_populated(self.provider)
+        other = self.Config.new_populated(
+            MockProvider({"APP_REPORTS_BUCKET": "other", "APP_REPORTS_MAIL_HOST": "mail"})
+        )
+        # lazy child minicfgs are not covered by fingerprints and are not populated by comparisons:
+        self.assertEqual(config.fingerprint, other.fingerprint)
+        self.assertEqual(config, other)
+        self.assertEqual([], config.diff(other))
+        self.assertNotIn("Reports", vars(other))
+
+        config.Reports
+        other.Reports
+        self.assertNotEqual(config, other)
+        self.assertEqual([FieldChange(name="APP_REPORTS_BUCKET", old="reports", new="other")], config.diff(other))
+
+
+class TestPopulateOnly(unittest.TestCase):
+    def setUp(self):
+        @minicfg_name("APP")
+        class Config(Minicfg):
+            NAME = Field()
+            DATABASE_URL = Field(template="postgres://${APP_DB_USER}:${APP_DB_PASSWORD}@db")
+
+            @minicfg_name("DB")
+            class Database(Minicfg):
+                USER = Field()
+                PASSWORD = Field(secret=True)
+
+            @minicfg_name("API")
+            class ExternalAPI(Minicfg):
+                KEY = Field()
+                TIMEOUT: int = Field(default=5)
+
+        self.Config = Config
+        self.data = {"APP_NAME": "app", "APP_DB_USER": "user", "APP_DB_PASSWORD": "old", "APP_API_KEY": "old"}
+        self.config = Config.new_populated(MockProvider(self.data))
+
+    def test_only(self):
+        self.data.update(APP_NAME="other", APP_DB_PASSWORD="new", APP_API_KEY="new", APP_API_TIMEOUT="10")
+        provider = _CountingProvider(self.data)
+        self.config.populate(provider, only=["Database", "ExternalAPI.KEY"])
+
+        self.assertEqual("app", self.config.NAME)
+        self.assertEqual("new", self.config.Database.PASSWORD)
+        self.assertEqual("new", self.config.ExternalAPI.KEY)
+        self.assertEqual(5, self.config.ExternalAPI.TIMEOUT)
+        # the interpolated field depending on the database is populated too:
+        self.assertEqual("postgres://user:new@db", self.config.DATABASE_URL)
+        self.assertEqual({"APP_DB_USER", "APP_DB_PASSWORD", "APP_API_KEY", "APP_DATABASE_URL"}, set(provider.lookups))
+
+    def test_fingerprints_updated(self):
+        self.data.update(APP_DB_PASSWORD="new")
+        self.config.populate(MockProvider(self.data), only=["Database.PASSWORD"])
+
+        expected = self.Config.new_populated(MockProvider(self.data))
+        self.assertEqual(expected, self.config)
+        self.assertEqual(expected.Database.fingerprint, self.config.Database.fingerprint)
+        self.assertEqual(expected.ExternalAPI.fingerprint, self.config.ExternalAPI.fingerprint)
+
+    def test_child_populated_directly(self):
+        # populating a child instance directly does not update its parents, populating with only does:
+        old = self.Config.new_populated(MockProvider(self.data))
+        self.data.update(APP_DB_PASSWORD="new")
+        self.config.Database.populate(MockProvider(self.data))
+        self.assertEqual(old.fingerprint, self.config.fingerprint)
+        self.assertEqual("postgres://user:old@db", self.config.DATABASE_URL)
+
+        self.config.populate(MockProvider(self.data), only=["Database"])
+        self.assertNotEqual(old, self.config)
+        self.assertEqual("postgres://user:new@db", self.config.DATABASE_URL)
+        self.assertEqual(
+            ["APP_DATABASE_URL", "APP_DB_PASSWORD"], sorted(change.name for change in old.diff(self.config))
+        )
+
+    def test_history(self):
+        history = self.config.enable_history()
+        self.config.populate(MockProvider({**self.data, "APP_API_KEY": "new"}), only=["ExternalAPI"])
+        self.assertEqual(
+            [FieldChange(name="APP_API_KEY", old="old", new="new")], history.diff(*(v.number for v in history.versions))
+        )
+
+    def test_collect_errors(self):
+        with self.assertRaises(PopulationError) as context:
+            self.config.populate(MockProvider({}), collect_errors=True, only=["NAME", "ExternalAPI.KEY"])
+        self.assertEqual(2, len(context.exception.errors))
+
+    def test_invalid_paths(self):
+        for path in ("MISSING", "Missing.KEY", "ExternalAPI.MISSING", "NAME.MISSING"):
+            with self.subTest(path=path):
+                with self.assertRaises(ValueError):
+                    self.config.populate(MockProvider(self.data), only=[path])
+
+    def test_not_populated(self):
+        with self.assertRaises(ValueError):
+            self.Config().populate(MockProvider(self.data), only=["NAME"])
+
+
+class TestAnnotations(unittest.TestCase):
+    def test_infer_caster(self):
+        class Config(Minicfg):
+            PORT: int = Field()
+            RATIO: float = Field()
+            HOSTS: list[str] = Field()
+            HOST: str = Field()
+
+        self.assertIs(infer_caster(int), Config.PORT.caster)
+        self.assertIsNone(Config.HOST.caster)
+
+        config = Config.new_populated(MockProvider({"PORT": "80", "RATIO": "0.5", "HOSTS": "a,b", "HOST": "a"}))
+        self.assertEqual(80, config.PORT)
+        self.assertEqual(0.5, config.RATIO)
+        self.assertEqual(["a", "b"], config.HOSTS)
+        self.assertEqual("a", config.HOST)
+
+    def test_explicit_caster_precedence(self):
+        caster = FloatCaster()
+
+        class Config(Minicfg):
+            PORT: int = Field(caster=caster)
+            CUSTOM: object = Field(caster=caster)
+
+        self.assertIs(caster, Config.PORT.caster)
+        self.assertIs(caster, Config.CUSTOM.caster)
+
+    def test_shared_casters(self):
+        class Config(Minicfg):
+            A: int = Field()
+            B: int = Field()
+
+        self.assertIs(Config.A.caster, Config.B.caster)
+
+    def test_unsupported_annotation(self):
+        class Config(Minicfg):
+            A: pathlib.Path = Field()
+
+        self.assertEqual("/srv", Config.new_populated(MockProvider({"A": "/srv"})).A)
+
+    def test_string_annotations(self):
+        class Config(Minicfg):
+            A: "int" = Field()
+            B: "Optional[int]" = Field()
+
+        self.assertIsNone(Config.A.caster)  # resolved lazily
+
+        config = Config.new_populated(MockProvider({"A": "1", "B": "2"}))
+        self.assertEqual(1, config.A)
+        self.assertEqual(2, config.B)
+        self.assertIsInstance(Config.A.caster, IntCaster)
+
+    def test_inherited_string_annotations(self):
+        class Base(Minicfg):
+            A: "int" = Field()
+
+        class Child(Base):
+            B: "int" = Field()
+
+        config = Child.new_populated(MockProvider({"A": "1", "B": "2"}))
+        self.assertEqual(1, config.A)
+        self.assertEqual(2, config.B)
+
+    def test_unresolvable_string_annotation(self):
+        class Config(Minicfg):
+            A: "Unknown" = Field()
+
+        with self.assertRaises(TypeError):
+            Config()
+
+
 class TestDecorators(unittest.TestCase):
     def test_minicfg_name(self):
         name = "TEST_NAME"
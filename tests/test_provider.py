@@ -1,8 +1,28 @@
+import asyncio
+import base64
+import http.server
+import json
 import os
+import sqlite3
+import tempfile
+import threading
+import time
 import unittest
+import urllib.parse
 from unittest.mock import patch
 
-from minicfg.provider import EnvProvider
+from minicfg.provider import (
+    AbstractProvider,
+    CoalescingProvider,
+    DictProvider,
+    DirectoryProvider,
+    EnvProvider,
+    HTTPProvider,
+    HTTPProviderError,
+    ProviderUnavailableError,
+    ResilientProvider,
+    SQLiteProvider,
+)
 
 
 class TestEnvProvider(unittest.TestCase):
@@ -34,3 +54,542 @@ class TestEnvProvider(unittest.TestCase):
         with patch.dict(os.environ, {"EMPTY_KEY": ""}):
             result = self.provider.get("EMPTY_KEY")
             self.assertEqual(result, "")
+
+    def test_get_many(self):
+        with patch.dict(os.environ, {"KEY_1": "1", "KEY_2": ""}):
+            self.assertEqual({"KEY_1": "1", "KEY_2": ""}, self.provider.get_many(["KEY_1", "KEY_2", "MISSING"]))
+
+
+class TestDictProvider(unittest.TestCase):
+    def test_get(self):
+        provider = DictProvider({"KEY": "value"})
+        self.assertEqual("value", provider.get("KEY"))
+        self.assertIsNone(provider.get("MISSING"))
+
+    def test_get_many(self):
+        provider = DictProvider({"KEY": "value", "OTHER": "other"})
+        self.assertEqual({"KEY": "value"}, provider.get_many(["KEY", "MISSING"]))
+
+
+class TestDirectoryProvider(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = self._directory.name
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _write(self, name: str, value: str) -> None:
+        with open(os.path.join(self.path, name), "w") as file:
+            file.write(value)
+
+    def _write_kubernetes_volume(self, version: str, data: dict[str, str]) -> None:
+        # emulate the kubernetes atomic writer: write a new timestamped directory and swap the ..data symlink
+        data_dir = os.path.join(self.path, f"..{version}")
+        os.mkdir(data_dir)
+        for name, value in data.items():
+            with open(os.path.join(data_dir, name), "w") as file:
+                file.write(value)
+
+        tmp_link = os.path.join(self.path, "..data_tmp")
+        os.symlink(f"..{version}", tmp_link)
+        os.replace(tmp_link, os.path.join(self.path, "..data"))
+
+        for name in data:
+            if not os.path.islink(os.path.join(self.path, name)):
+                os.symlink(os.path.join("..data", name), os.path.join(self.path, name))
+
+    def test_get(self):
+        self._write("DATABASE_PASSWORD", "secret\n")
+        provider = DirectoryProvider(self.path)
+        self.assertEqual("secret", provider.get("DATABASE_PASSWORD"))
+        self.assertIsNone(provider.get("MISSING"))
+
+    def test_name_mapper(self):
+        self._write("database-password", "secret")
+        provider = DirectoryProvider(self.path, name_mapper=lambda name: name.upper().replace("-", "_"))
+        self.assertEqual("secret", provider.get("DATABASE_PASSWORD"))
+
+    def test_skip_hidden(self):
+        self._write(".hidden", "value")
+        os.mkdir(os.path.join(self.path, "directory"))
+        provider = DirectoryProvider(self.path)
+        self.assertIsNone(provider.get(".hidden"))
+        self.assertIsNone(provider.get("directory"))
+
+    def test_lazy_read(self):
+        self._write("KEY", "value")
+        with patch("builtins.open", wraps=open) as mock_open:
+            provider = DirectoryProvider(self.path)
+            mock_open.assert_not_called()
+            provider.get("KEY")
+            provider.get("KEY")
+            mock_open.assert_called_once()
+
+    def test_refresh_unchanged(self):
+        self._write("KEY", "value")
+        provider = DirectoryProvider(self.path)
+        self.assertFalse(provider.refresh())
+
+    def test_refresh_kubernetes(self):
+        self._write_kubernetes_volume("2024_01_01", {"KEY": "old"})
+        provider = DirectoryProvider(self.path)
+        self.assertEqual("old", provider.get("KEY"))
+        self.assertIsNone(provider.get("..data"))
+        self.assertFalse(provider.refresh())
+
+        self._write_kubernetes_volume("2024_01_02", {"KEY": "new"})
+        self.assertTrue(provider.refresh())
+        self.assertEqual("new", provider.get("KEY"))
+        self.assertFalse(provider.refresh())
+
+
+class _SlowProvider(AbstractProvider):
+    """
+    A provider which blocks lookups until released and counts calls.
+    """
+
+    def __init__(self, data: dict[str, str]):
+        self.data = data
+        self.calls = 0
+        self.release = threading.Event()
+
+    def get(self, key: str) -> str | None:
+        self.calls += 1
+        self.release.wait(timeout=5)
+        if key == "ERROR":
+            raise RuntimeError("lookup failed")
+        return self.data.get(key)
+
+
+class TestCoalescingProvider(unittest.TestCase):
+    def test_get(self):
+        provider = CoalescingProvider(DictProvider({"KEY": "value"}))
+        self.assertEqual("value", provider.get("KEY"))
+        self.assertIsNone(provider.get("MISSING"))
+
+    def _get_concurrently(self, provider: CoalescingProvider, key: str) -> list:
+        results = []
+
+        def worker():
+            try:
+                results.append(provider.get(key))
+            except Exception as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        return threads, results
+
+    def test_threads(self):
+        slow_provider = _SlowProvider({"KEY": "value"})
+        provider = CoalescingProvider(slow_provider)
+
+        threads, results = self._get_concurrently(provider, "KEY")
+        time.sleep(0.05)
+        slow_provider.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(["value"] * 8, results)
+        self.assertEqual(1, slow_provider.calls)
+
+        # completed lookups are not cached:
+        provider.get("KEY")
+        self.assertEqual(2, slow_provider.calls)
+
+    def test_threads_error(self):
+        slow_provider = _SlowProvider({})
+        provider = CoalescingProvider(slow_provider)
+
+        threads, results = self._get_concurrently(provider, "ERROR")
+        time.sleep(0.05)
+        slow_provider.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(8, len(results))
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertEqual(1, slow_provider.calls)
+
+    def test_asyncio(self):
+        slow_provider = _SlowProvider({"KEY": "value"})
+        provider = CoalescingProvider(slow_provider)
+
+        async def main():
+            tasks = [asyncio.create_task(provider.get_async("KEY")) for _ in range(8)]
+            await asyncio.sleep(0.05)
+            slow_provider.release.set()
+            return await asyncio.gather(*tasks)
+
+        self.assertEqual(["value"] * 8, asyncio.run(main()))
+        self.assertEqual(1, slow_provider.calls)
+        self.assertEqual({}, provider._tasks)
+
+
+class _KVServer(http.server.ThreadingHTTPServer):
+    """
+    A stand-in for a Consul-style key/value API, counting requests and connections.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _KVHandler)
+        self.data: dict[str, str] = {}
+        self.index = 1
+        self.changed = threading.Condition()
+        self.requests: list[str] = []
+        self.connections = 0
+        self.status: int | None = None  # status to respond with instead of the data
+        self.drop_connections = False  # close connections after responding, without telling the client
+
+    def set(self, key: str, value: str) -> None:
+        with self.changed:
+            self.data[key] = value
+            self.index += 1
+            self.changed.notify_all()
+
+
+class _KVHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections alive
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server: _KVServer = self.server
+        server.requests.append(self.path)
+        url = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        prefix = urllib.parse.unquote(url.path[len("/v1/kv/") :])
+
+        if server.status is not None:
+            self._respond(server.status, b"")
+            return
+
+        if "index" in query:
+            # blocking query:
+            with server.changed:
+                server.changed.wait_for(lambda: str(server.index) != query["index"], float(query["wait"][:-1]))
+
+        entries = [
+            {"Key": key, "Value": base64.b64encode(value.encode()).decode()}
+            for key, value in server.data.items()
+            if key.startswith(prefix)
+        ]
+        if not entries:
+            self._respond(404, b"")
+            return
+
+        etag = f'"{server.index}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._respond(304, b"", etag)
+            return
+        self._respond(200, json.dumps(entries).encode(), etag)
+
+    def _respond(self, status: int, body: bytes, etag: str | None = None):
+        self.send_response(status)
+        self.send_header("X-Consul-Index", str(self.server.index))
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.server.drop_connections:
+            self.close_connection = True
+
+
+class TestHTTPProvider(unittest.TestCase):
+    def setUp(self):
+        self.server = _KVServer()
+        self.server.data = {"service/APP_HOST": "example.com", "service/APP_PORT": "80", "other/KEY": "other"}
+        threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True).start()
+        self.provider = HTTPProvider(f"http://127.0.0.1:{self.server.server_port}/v1/kv/", prefix="service/")
+
+    def tearDown(self):
+        self.provider.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_get(self):
+        self.assertEqual("example.com", self.provider.get("APP_HOST"))
+        self.assertEqual("80", self.provider.get("APP_PORT"))
+        self.assertIsNone(self.provider.get("KEY"))
+        self.assertIsNone(self.provider.get("MISSING"))
+
+        # the whole prefix is fetched with a single request:
+        self.assertEqual(["/v1/kv/service/?recurse=true"], self.server.requests)
+
+    def test_empty_prefix(self):
+        provider = HTTPProvider(f"http://127.0.0.1:{self.server.server_port}/v1/kv/", prefix="missing/")
+        self.assertIsNone(provider.get("KEY"))
+        provider.close()
+
+    def test_error(self):
+        self.server.status = 500
+        with self.assertRaises(HTTPProviderError) as context:
+            self.provider.get("APP_HOST")
+        self.assertEqual(500, context.exception.status)
+
+    def test_invalid_scheme(self):
+        with self.assertRaises(ValueError):
+            HTTPProvider("ftp://127.0.0.1/v1/kv/")
+
+    def test_refresh(self):
+        self.provider.get("APP_HOST")
+
+        # unchanged prefix costs a 304:
+        self.assertFalse(self.provider.refresh())
+        self.assertEqual("example.com", self.provider.get("APP_HOST"))
+
+        self.server.set("service/APP_HOST", "example.org")
+        self.assertTrue(self.provider.refresh())
+        self.assertEqual("example.org", self.provider.get("APP_HOST"))
+
+        # all requests are made through a single keep-alive connection:
+        self.assertEqual(3, len(self.server.requests))
+        self.assertEqual(1, self.server.connections)
+
+    def test_refresh_blocking_query(self):
+        self.provider.get("APP_HOST")
+
+        start = time.monotonic()
+        self.assertFalse(self.provider.refresh(wait=0.1))
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+        threading.Timer(0.05, self.server.set, args=("service/APP_PORT", "81")).start()
+        self.assertTrue(self.provider.refresh(wait=5))
+        self.assertEqual("81", self.provider.get("APP_PORT"))
+
+    def test_reconnect(self):
+        self.server.drop_connections = True
+        self.provider.get("APP_HOST")
+
+        # the idle connection has been closed by the server, so the request is retried on a new connection:
+        self.server.set("service/APP_HOST", "example.org")
+        self.assertTrue(self.provider.refresh())
+        self.assertEqual("example.org", self.provider.get("APP_HOST"))
+        self.assertEqual(2, self.server.connections)
+
+
+class TestSQLiteProvider(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "config.db")
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("CREATE TABLE config (key TEXT PRIMARY KEY, value TEXT)")
+        self.set({"APP_HOST": "example.com", "APP_PORT": 80, "APP_EMPTY": None, "APQ": "x", "OTHER": "other"})
+
+        self.provider = SQLiteProvider(self.path, prefix="APP_")
+        self.statements: list[str] = []
+        self.provider._connection.set_trace_callback(self.statements.append)
+
+    def tearDown(self):
+        self.provider.close()
+        self.connection.close()
+        self.tmp_dir.cleanup()
+
+    def set(self, data: dict[str, str | int | None]) -> None:
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO config VALUES (?, ?)", data.items())
+
+    def queries(self) -> list[str]:
+        return [statement for statement in self.statements if statement.startswith("SELECT")]
+
+    def test_get(self):
+        self.assertEqual("example.com", self.provider.get("APP_HOST"))
+        self.assertEqual("80", self.provider.get("APP_PORT"))
+        self.assertIsNone(self.provider.get("APP_EMPTY"))
+        self.assertIsNone(self.provider.get("APP_MISSING"))
+
+        # the whole prefix is loaded with a single range query:
+        self.assertEqual(1, len(self.queries()))
+        self.assertIn("key >= 'APP_' AND key < 'APP`'", self.queries()[0])
+
+    def test_keys_outside_prefix(self):
+        self.assertEqual("x", self.provider.get("APQ"))
+        self.assertEqual("x", self.provider.get("APQ"))
+        self.assertIsNone(self.provider.get("MISSING"))
+        self.assertEqual(2, len(self.queries()))
+
+    def test_get_many(self):
+        keys = ["APP_HOST", "OTHER", "APQ", "MISSING", "MISSING"]
+        self.assertEqual({"APP_HOST": "example.com", "OTHER": "other", "APQ": "x"}, self.provider.get_many(keys))
+        self.assertEqual(2, len(self.queries()))
+
+        self.assertEqual({"OTHER": "other"}, self.provider.get_many(["OTHER", "MISSING"]))
+        self.assertEqual(2, len(self.queries()))
+
+    def test_refresh(self):
+        self.provider.get("APP_HOST")
+        self.assertFalse(self.provider.refresh())
+        self.assertEqual(1, len(self.queries()))
+
+        self.set({"OTHER": "changed"})
+        self.assertFalse(self.provider.refresh())
+        self.assertEqual("changed", self.provider.get("OTHER"))
+
+        self.set({"APP_HOST": "example.org"})
+        self.assertTrue(self.provider.refresh())
+        self.assertEqual("example.org", self.provider.get("APP_HOST"))
+
+    def test_threads(self):
+        results: list[str | None] = []
+        threads = [threading.Thread(target=lambda: results.append(self.provider.get("APP_HOST"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(["example.com"] * 8, results)
+        self.assertEqual(1, len(self.queries()))
+
+    def test_read_only(self):
+        with self.assertRaises(sqlite3.OperationalError):
+            self.provider._connection.execute("DELETE FROM config")
+
+    def test_no_prefix(self):
+        provider = SQLiteProvider(self.path)
+        self.assertEqual({"APQ": "x", "OTHER": "other"}, provider.get_many(["APQ", "OTHER"]))
+        provider.close()
+
+    def test_invalid_table(self):
+        with self.assertRaises(ValueError):
+            SQLiteProvider(self.path, table="config; DROP TABLE config")
+
+
+class _FlakyProvider(AbstractProvider):
+    """
+    A provider failing or hanging for the configured number of calls.
+    """
+
+    def __init__(self, data: dict[str, str], failures: int = 0, delay: float = 0):
+        self.data = data
+        self.failures = failures  # number of calls to fail, before answering
+        self.delay = delay
+        self.calls = 0
+
+    def get(self, key: str) -> str | None:
+        self.calls += 1
+        if self.calls <= self.failures:
+            if self.delay:
+                time.sleep(self.delay)
+            else:
+                raise ConnectionError("backend is unavailable")
+        return self.data.get(key)
+
+
+class TestResilientProvider(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.fallback_path = os.path.join(self.tmp_dir.name, "fallback.json")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_get(self):
+        provider = ResilientProvider(_FlakyProvider({"KEY": "value"}))
+        self.assertEqual("value", provider.get("KEY"))
+        self.assertIsNone(provider.get("MISSING"))
+        self.assertEqual(2, provider.stats.lookups)
+        self.assertEqual(0, provider.stats.failures)
+
+    def test_retries(self):
+        flaky_provider = _FlakyProvider({"KEY": "value"}, failures=2)
+        provider = ResilientProvider(flaky_provider, retries=2, backoff=0.001)
+        self.assertEqual("value", provider.get("KEY"))
+        self.assertEqual(3, flaky_provider.calls)
+        self.assertEqual(2, provider.stats.failures)
+        self.assertEqual(2, provider.stats.retries)
+
+    def test_unavailable(self):
+        provider = ResilientProvider(_FlakyProvider({}, failures=10), retries=1, backoff=0.001)
+        with self.assertRaises(ProviderUnavailableError) as context:
+            provider.get("KEY")
+        self.assertIn("ConnectionError", context.exception.reason)
+
+    def test_timeout_fallback(self):
+        flaky_provider = _FlakyProvider({"KEY": "value"})
+        provider = ResilientProvider(flaky_provider, timeout=0.05, retries=0)
+        provider.get("KEY")
+
+        flaky_provider.failures, flaky_provider.delay = 10, 1
+        start = time.monotonic()
+        self.assertEqual("value", provider.get("KEY"))
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(1, provider.stats.timeouts)
+        self.assertEqual(1, provider.stats.fallbacks)
+
+    def test_deadline(self):
+        flaky_provider = _FlakyProvider({"A": "a", "B": "b", "C": "c"})
+        provider = ResilientProvider(flaky_provider, timeout=None, fallback_path=self.fallback_path)
+        with provider.deadline(1):
+            provider.get("A"), provider.get("B"), provider.get("C")
+        self.assertTrue(os.path.exists(self.fallback_path))
+
+        # every lookup hangs, but the whole block is bounded by the deadline:
+        flaky_provider.failures, flaky_provider.delay = 10, 1
+        provider = ResilientProvider(flaky_provider, timeout=None, fallback_path=self.fallback_path)
+        start = time.monotonic()
+        with provider.deadline(0.1):
+            values = [provider.get("A"), provider.get("B"), provider.get("C")]
+        self.assertEqual(["a", "b", "c"], values)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(3, provider.stats.fallbacks)
+
+    def test_deadline_fallback_not_saved(self):
+        flaky_provider = _FlakyProvider({"A": "a"})
+        provider = ResilientProvider(flaky_provider, fallback_path=self.fallback_path)
+        provider.get("A")
+        provider.save()
+
+        flaky_provider.data = {"A": "new"}
+        flaky_provider.failures, flaky_provider.delay = flaky_provider.calls + 10, 1
+        with provider.deadline(0.05):
+            self.assertEqual("a", provider.get("A"))
+
+        # values are not saved when the block has fallen back:
+        flaky_provider.failures = 0
+        provider.get("A")
+        self.assertEqual("a", ResilientProvider(flaky_provider, fallback_path=self.fallback_path)._last_known_good["A"])
+
+    def test_circuit_breaker(self):
+        flaky_provider = _FlakyProvider({"KEY": "value"}, failures=2)
+        provider = ResilientProvider(flaky_provider, timeout=None, retries=0, failure_threshold=2, reset_timeout=0.05)
+        for _ in range(2):
+            with self.assertRaises(ProviderUnavailableError):
+                provider.get("KEY")
+        self.assertEqual(1, provider.stats.circuit_opens)
+
+        # the open circuit breaker does not let lookups through:
+        with self.assertRaises(ProviderUnavailableError) as context:
+            provider.get("KEY")
+        self.assertEqual("circuit breaker is open", context.exception.reason)
+        self.assertEqual(2, flaky_provider.calls)
+
+        # a successful trial lookup closes the circuit breaker:
+        time.sleep(0.05)
+        self.assertEqual("value", provider.get("KEY"))
+        self.assertEqual("value", provider.get("KEY"))
+        self.assertEqual(4, flaky_provider.calls)
+
+    def test_circuit_breaker_failed_trial(self):
+        flaky_provider = _FlakyProvider({}, failures=10)
+        provider = ResilientProvider(flaky_provider, timeout=None, retries=0, failure_threshold=1, reset_timeout=0.05)
+        with self.assertRaises(ProviderUnavailableError):
+            provider.get("KEY")
+        time.sleep(0.05)
+        with self.assertRaises(ProviderUnavailableError):
+            provider.get("KEY")
+
+        # the failed trial lookup opens the circuit breaker again:
+        self.assertEqual(2, provider.stats.circuit_opens)
+        with self.assertRaises(ProviderUnavailableError):
+            provider.get("KEY")
+        self.assertEqual(2, flaky_provider.calls)
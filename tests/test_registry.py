@@ -0,0 +1,132 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from minicfg import Field, Minicfg, minicfg_name
+from minicfg.field import FieldValueNotProvidedError
+from minicfg.interpolation import InterpolationError
+from minicfg.minicfg import PopulationError
+from minicfg.provider import AbstractProvider
+from minicfg.registry import ConflictError, Registry
+
+from ._mock_provider import MockProvider
+
+
+class _BatchProvider(MockProvider):
+    """
+    A mock provider recording batch and single lookups.
+    """
+
+    def __init__(self, data: dict[str, str]):
+        super().__init__(data)
+        self.batches: list[set[str]] = []
+        self.lookups: list[str] = []
+
+    def get(self, key: str) -> str | None:
+        self.lookups.append(key)
+        return super().get(key)
+
+    def get_many(self, keys):
+        self.batches.append(set(keys))
+        return AbstractProvider.get_many(self, keys)
+
+
+class TestRegistry(unittest.TestCase):
+    def setUp(self):
+        @minicfg_name("DB")
+        class DatabaseConfig(Minicfg):
+            HOST = Field(attach_file_field=True)
+
+        class LoggingConfig(Minicfg):
+            LOG_LEVEL = Field(default="info")
+
+        class CacheConfig(Minicfg):
+            CACHE_URL = Field(template="redis://${DB_HOST}")
+            LOG_LEVEL = Field(default="info")
+
+        self.registry = Registry()
+        self.DatabaseConfig = self.registry.register(DatabaseConfig)
+        self.CacheConfig = self.registry.register(CacheConfig)
+        self.LoggingConfig = self.registry.register(LoggingConfig)
+
+    def test_keys(self):
+        self.assertEqual({"DB_HOST", "DB_HOST_FILE", "LOG_LEVEL", "CACHE_URL"}, self.registry.keys())
+        self.assertEqual([], self.registry.conflicts())
+
+    def test_populate(self):
+        provider = _BatchProvider({"DB_HOST": "db", "LOG_LEVEL": "debug", "OTHER": "x"})
+        self.registry.populate(provider)
+
+        database_config = self.registry.get(self.DatabaseConfig)
+        cache_config = self.registry.get(self.CacheConfig)
+        self.assertEqual("db", database_config.HOST)
+        self.assertEqual("debug", self.registry.get(self.LoggingConfig).LOG_LEVEL)
+        self.assertEqual("redis://db", cache_config.CACHE_URL)
+        self.assertEqual("debug", cache_config.LOG_LEVEL)
+
+        # all keys are read in one batch, each of them once:
+        self.assertEqual([self.registry.keys()], provider.batches)
+        self.assertEqual(sorted(self.registry.keys()), sorted(provider.lookups))
+
+    def test_populate_env(self):
+        with patch.dict(os.environ, {"DB_HOST": "db"}):
+            self.registry.populate()
+        self.assertEqual("db", self.registry.get(self.DatabaseConfig).HOST)
+
+    def test_populate_collect_errors(self):
+        class OtherConfig(Minicfg):
+            OTHER = Field()
+
+        self.registry.register(OtherConfig)
+        with self.assertRaises(PopulationError) as context:
+            self.registry.populate(MockProvider({}), collect_errors=True)
+
+        # errors of all classes are collected:
+        self.assertEqual(
+            [FieldValueNotProvidedError, InterpolationError, FieldValueNotProvidedError],
+            [type(error) for error in context.exception.errors],
+        )
+
+    def test_conflicts(self):
+        class OtherConfig(Minicfg):
+            LOG_LEVEL = Field(default="warning")
+
+        self.registry.register(OtherConfig)
+        conflicts = self.registry.conflicts()
+        self.assertEqual(["LOG_LEVEL"], [conflict.key for conflict in conflicts])
+        self.assertEqual(3, len(conflicts[0].definitions))
+        self.assertIn("OtherConfig.LOG_LEVEL: str = 'warning'", conflicts[0].definitions[2])
+
+        with self.assertRaises(ConflictError):
+            self.registry.populate(MockProvider({"DB_HOST": "db"}))
+
+    def test_conflicting_casters(self):
+        class OtherConfig(Minicfg):
+            LOG_LEVEL: int = Field(default="info")
+
+        self.registry.register(OtherConfig)
+        self.assertEqual(["LOG_LEVEL"], [conflict.key for conflict in self.registry.conflicts()])
+
+    def test_register(self):
+        self.assertIs(self.DatabaseConfig, self.registry.register(self.DatabaseConfig))
+        with self.assertRaises(TypeError):
+            self.registry.register(object)
+        with self.assertRaises(KeyError):
+            Registry().get(self.DatabaseConfig)
+
+    def test_register_before_decorators(self):
+        registry = Registry()
+
+        @minicfg_name("SERVICE")
+        @registry.register
+        class ServiceConfig(Minicfg):
+            PORT: "_Port" = Field()  # forward reference, defined after the class
+
+        global _Port
+        _Port = int
+        try:
+            self.assertEqual({"SERVICE_PORT"}, registry.keys())
+            registry.populate(MockProvider({"SERVICE_PORT": "8080"}))
+            self.assertEqual(8080, registry.get(ServiceConfig).PORT)
+        finally:
+            del _Port
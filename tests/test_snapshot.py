@@ -0,0 +1,155 @@
+import enum
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from minicfg import Field, Minicfg, minicfg_name
+from minicfg.caster import FloatCaster, IntCaster, JSONCaster
+from minicfg.snapshot import Snapshot, attach, dump_file, dumps, open_file, share
+
+from ._mock_provider import MockProvider
+
+
+class _Mode(enum.IntEnum):
+    A = 1
+
+
+@minicfg_name("SERVICE")
+class _Config(Minicfg):
+    NAME = Field()
+    PORT = Field(caster=IntCaster())
+    RATIO = Field(caster=FloatCaster())
+    DEBUG: bool = Field()
+    EXTRA = Field(caster=JSONCaster())
+    MODE: _Mode = Field()
+    NOTHING = Field(default=None)
+
+    @minicfg_name("DATABASE")
+    class Database(Minicfg):
+        HOST = Field()
+
+        class Replica(Minicfg):
+            HOST = Field()
+
+
+_DATA = {
+    "SERVICE_NAME": "sérvice",
+    "SERVICE_PORT": "8080",
+    "SERVICE_RATIO": "0.5",
+    "SERVICE_DEBUG": "yes",
+    "SERVICE_EXTRA": '{"a": [1, 2]}',
+    "SERVICE_MODE": "1",
+    "SERVICE_DATABASE_HOST": "db",
+}
+
+
+def _read_port(name: str, queue: multiprocessing.Queue) -> None:
+    with attach(name) as snapshot:
+        queue.put(snapshot.config.PORT)
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.config = _Config.new_populated(MockProvider(_DATA))
+
+    def assertSnapshot(self, snapshot: Snapshot):
+        config = snapshot.config
+        self.assertEqual("sérvice", config.NAME)
+        self.assertEqual(8080, config.PORT)
+        self.assertEqual(0.5, config.RATIO)
+        self.assertIs(True, config.DEBUG)
+        self.assertEqual({"a": [1, 2]}, config.EXTRA)
+        self.assertIs(_Mode.A, config.MODE)
+        self.assertIsNone(config.NOTHING)
+        self.assertEqual("db", config.Database.HOST)
+        self.assertEqual("db", config.Database.Replica.HOST)
+
+    def test_bytes(self):
+        self.assertSnapshot(Snapshot(dumps(self.config)))
+
+    def test_keys(self):
+        snapshot = Snapshot(dumps(self.config))
+        self.assertIn("Database.Replica.HOST", snapshot.keys())
+        self.assertEqual("db", snapshot.get("Database.HOST"))
+
+    def test_missing_attribute(self):
+        snapshot = Snapshot(dumps(self.config))
+        with self.assertRaises(AttributeError):
+            snapshot.config.MISSING
+
+    def test_read_only(self):
+        snapshot = Snapshot(dumps(self.config))
+        with self.assertRaises(AttributeError):
+            snapshot.config.PORT = 1
+
+    def test_not_populated(self):
+        with self.assertRaises(ValueError):
+            dumps(_Config())
+
+    def test_invalid_buffer(self):
+        with self.assertRaises(ValueError):
+            Snapshot(b"\x00" * 16)
+
+    def test_shared_memory(self):
+        shm = share(self.config)
+        try:
+            with attach(shm.name) as snapshot:
+                self.assertSnapshot(snapshot)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "fork is not available")
+    def test_shared_memory_worker(self):
+        shm = share(self.config)
+        try:
+            context = multiprocessing.get_context("fork")
+            queue = context.Queue()
+            process = context.Process(target=_read_port, args=(shm.name, queue))
+            process.start()
+            self.assertEqual(8080, queue.get(timeout=10))
+            process.join()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_shared_memory_independent_process(self):
+        shm = share(self.config)
+        try:
+            code = (
+                "import sys\nfrom minicfg.snapshot import attach\nwith attach(sys.argv[1]) as s:\n print(s.config.PORT)"
+            )
+            package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            result = subprocess.run(
+                [sys.executable, "-c", code, shm.name],
+                capture_output=True,
+                text=True,
+                timeout=60,
+                env={**os.environ, "PYTHONPATH": package_dir},
+            )
+            self.assertEqual("8080", result.stdout.strip(), result.stderr)
+
+            # the block is not unlinked when the attaching process exits:
+            with attach(shm.name) as snapshot:
+                self.assertSnapshot(snapshot)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "config.snapshot")
+            dump_file(self.config, path)
+            with open_file(path) as snapshot:
+                self.assertSnapshot(snapshot)
+            if os.name == "posix":
+                # snapshots contain secret values:
+                self.assertEqual(0o600, os.stat(path).st_mode & 0o777)
+            self.assertEqual(["config.snapshot"], os.listdir(directory))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+
+from minicfg import Field, Minicfg, minicfg_lazy, minicfg_name, telemetry
+from minicfg.minicfg import FieldChange
+from minicfg.telemetry import FieldAccess
+
+from ._mock_provider import MockProvider
+
+
+@minicfg_name("APP")
+class _Config(Minicfg):
+    HOST = Field()
+    UNUSED = Field(default="unused")
+
+    @minicfg_name("DB")
+    class Database(Minicfg):
+        PORT: int = Field(default=5432)
+
+    @minicfg_lazy
+    @minicfg_name("REPORTS")
+    class Reports(Minicfg):
+        BUCKET = Field(default="reports")
+
+
+class TestTelemetry(unittest.TestCase):
+    def setUp(self):
+        self.config = _Config.new_populated(MockProvider({"APP_HOST": "example.com"}))
+
+    def test_record(self):
+        recorder = telemetry.enable(self.config)
+        for _ in range(3):
+            self.assertEqual("example.com", self.config.HOST)
+        self.assertEqual(5432, self.config.Database.PORT)
+
+        report = recorder.report()
+        self.assertEqual({"APP_HOST", "APP_UNUSED", "APP_DB_PORT"}, set(report))
+        self.assertEqual(3, report["APP_HOST"].reads)
+        self.assertLessEqual(report["APP_HOST"].first_read, report["APP_HOST"].last_read)
+        self.assertEqual(1, report["APP_DB_PORT"].reads)
+        self.assertEqual(FieldAccess(name="APP_UNUSED"), report["APP_UNUSED"])
+
+    def test_disable(self):
+        recorder = telemetry.enable(self.config)
+        self.assertIsNot(_Config, self.config.__class__)
+        self.assertIsInstance(self.config, _Config)
+
+        recorder.disable()
+        self.assertIs(_Config, self.config.__class__)
+        self.assertIs(_Config.Database, self.config.Database.__class__)
+        self.config.HOST
+        self.assertEqual(0, recorder.report()["APP_HOST"].reads)
+
+        # recording can be enabled again:
+        telemetry.enable(self.config).disable()
+
+    def test_compare(self):
+        other = _Config.new_populated(MockProvider({"APP_HOST": "other"}))
+        telemetry.enable(self.config)
+        self.assertEqual(self.config, _Config.new_populated(MockProvider({"APP_HOST": "example.com"})))
+        self.assertEqual(hash(_Config.new_populated(MockProvider({"APP_HOST": "example.com"}))), hash(self.config))
+        self.assertNotEqual(self.config, other)
+        self.assertEqual([FieldChange(name="APP_HOST", old="example.com", new="other")], self.config.diff(other))
+
+    def test_lazy_child(self):
+        recorder = telemetry.enable(self.config)
+        # the lazy child minicfg is not created by recording, but recorded once created:
+        self.assertNotIn("Reports", vars(self.config))
+        self.assertNotIn("APP_REPORTS_BUCKET", recorder.report())
+
+        self.assertEqual("reports", self.config.Reports.BUCKET)
+        self.assertIs(self.config.Reports, self.config.Reports)
+        self.assertEqual(1, recorder.report()["APP_REPORTS_BUCKET"].reads)
+
+        recorder.disable()
+        self.assertIs(_Config.Reports, self.config.Reports.__class__)
+
+    def test_enable_twice(self):
+        telemetry.enable(self.config)
+        with self.assertRaises(ValueError):
+            telemetry.enable(self.config)
+
+    def test_dump_and_merge(self):
+        other_config = _Config.new_populated(MockProvider({"APP_HOST": "example.com"}))
+        recorders = [telemetry.enable(self.config), telemetry.enable(other_config)]
+        self.config.HOST
+        other_config.HOST
+        other_config.Database.PORT
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = [os.path.join(tmp_dir, f"{i}.json") for i in range(2)]
+            for recorder, path in zip(recorders, paths):
+                recorder.dump(path)
+            report = telemetry.merge(telemetry.load(path) for path in paths)
+
+        self.assertEqual(2, report["APP_HOST"].reads)
+        self.assertEqual(recorders[0].report()["APP_HOST"].first_read, report["APP_HOST"].first_read)
+        self.assertEqual(recorders[1].report()["APP_HOST"].last_read, report["APP_HOST"].last_read)
+        self.assertEqual(1, report["APP_DB_PORT"].reads)
+        self.assertEqual(0, report["APP_UNUSED"].reads)
+        self.assertIsNone(report["APP_UNUSED"].first_read)
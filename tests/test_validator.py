@@ -0,0 +1,100 @@
+import re
+import unittest
+
+from minicfg.validator import Choices, Custom, Length, Pattern, Range
+
+
+class TestRange(unittest.TestCase):
+    def test_validate(self):
+        validator = Range(min=1, max=10)
+        validator.validate(1)
+        validator.validate(10)
+        with self.assertRaises(ValueError):
+            validator.validate(0)
+        with self.assertRaises(ValueError):
+            validator.validate(11)
+
+    def test_open_range(self):
+        Range(min=1).validate(10**9)
+        Range(max=1).validate(-(10**9))
+
+    def test_validate_many(self):
+        validator = Range(min=1, max=10)
+        validator.validate_many([1, 5, 10])
+        validator.validate_many([])
+        with self.assertRaisesRegex(ValueError, "11"):
+            validator.validate_many([1, 11, 5])
+
+    def test_validate_many_nan(self):
+        nan = float("nan")
+        Range(max=10).validate_many([nan, 1, 10])
+        with self.assertRaisesRegex(ValueError, "100"):
+            Range(max=10).validate_many([nan, 1, 100])
+        with self.assertRaisesRegex(ValueError, "-1"):
+            Range(min=0).validate_many([nan, -1.0, 5])
+
+
+class TestLength(unittest.TestCase):
+    def test_validate(self):
+        validator = Length(min=1, max=3)
+        validator.validate("abc")
+        with self.assertRaises(ValueError):
+            validator.validate("")
+        with self.assertRaises(ValueError):
+            validator.validate([1, 2, 3, 4])
+
+    def test_validate_many(self):
+        validator = Length(max=3)
+        validator.validate_many(["a", "abc"])
+        with self.assertRaisesRegex(ValueError, "abcd"):
+            validator.validate_many(["a", "abcd"])
+
+
+class TestPattern(unittest.TestCase):
+    def test_validate(self):
+        validator = Pattern(r"[a-z]+")
+        validator.validate("abc")
+        with self.assertRaises(ValueError):
+            validator.validate("abc1")  # the whole value must match
+
+    def test_compiled(self):
+        Pattern(re.compile("[a-z]+", re.IGNORECASE)).validate("ABC")
+        Pattern("[a-z]+", re.IGNORECASE).validate("ABC")
+
+    def test_validate_many(self):
+        validator = Pattern(r"\d+")
+        validator.validate_many(["1", "22"])
+        with self.assertRaisesRegex(ValueError, "x"):
+            validator.validate_many(["1", "x"])
+
+
+class TestChoices(unittest.TestCase):
+    def test_validate(self):
+        validator = Choices(["a", "b"])
+        validator.validate("a")
+        with self.assertRaises(ValueError):
+            validator.validate("c")
+
+    def test_validate_many(self):
+        validator = Choices([1, 2])
+        validator.validate_many([1, 2, 1])
+        with self.assertRaisesRegex(ValueError, "3"):
+            validator.validate_many([1, 3])
+
+
+class TestCustom(unittest.TestCase):
+    def test_validate(self):
+        validator = Custom(lambda value: value % 2 == 0, "is not even")
+        validator.validate(2)
+        with self.assertRaisesRegex(ValueError, "3 is not even"):
+            validator.validate(3)
+
+    def test_validate_many(self):
+        validator = Custom(lambda value: value % 2 == 0)
+        validator.validate_many([2, 4])
+        with self.assertRaises(ValueError):
+            validator.validate_many([2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()